@@ -15,8 +15,14 @@ from ._exceptions import (
     InvalidInputError,
     InternalError,
     DialogNotActiveError,
+    ProcessPoolNotAvailableError,
+    SharedBufferNotSupportedError,
+    SignalNotDeclaredError,
+    RunnerNotActiveError,
+    HeadlessScriptExhaustedError,
     QTrioWarning,
     ApplicationQuitWarning,
+    ConnectionCountWarning,
 )
 
 from ._core import (
@@ -33,4 +39,13 @@ from ._core import (
     register_requested_event_type,
 )
 
-from ._qt import Signal
+from ._idle import preempt_on_input, run_when_idle, until_idle
+
+from ._process import ProcessPool, SharedBuffer, run_in_process
+
+from ._qt import (
+    ConnectionRegistry,
+    ConnectionStatistics,
+    Signal,
+    track_connections,
+)
@@ -1,3 +1,7 @@
+import functools
+import json
+import typing
+
 import click
 
 
@@ -38,8 +42,70 @@ def emissions() -> None:  # pragma: no cover
     help="Frames per second for progress updates.",
     type=click.IntRange(min=1),
 )
-def download(url: str, destination: str, fps: int) -> None:  # pragma: no cover
-    import qtrio
+@click.option(
+    "--manifest",
+    help=(
+        "Download a batch listed in this file, or - for stdin, instead of a single URL."
+        "  Each line holds a URL and a destination separated by whitespace."
+    ),
+    type=click.File("r"),
+)
+@click.option(
+    "--max-connections",
+    default=4,
+    help="The maximum number of concurrent batch downloads.",
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--summary",
+    default="-",
+    help="The file to write the JSON summary of a batch to, or - for stdout.",
+    type=click.File("w"),
+)
+def download(
+    url: typing.Optional[str],
+    destination: typing.Optional[str],
+    fps: int,
+    manifest: typing.Optional[typing.TextIO],
+    max_connections: int,
+    summary: typing.TextIO,
+) -> None:  # pragma: no cover
+    if manifest is None:
+        import qtrio
+        import qtrio.examples.download
+
+        qtrio.run(qtrio.examples.download.start_downloader, url, destination, fps)
+        return
+
+    if url is not None or destination is not None:
+        raise click.UsageError(
+            "--manifest can not be combined with --url or --destination."
+        )
+
     import qtrio.examples.download
 
-    qtrio.run(qtrio.examples.download.start_downloader, url, destination, fps)
+    try:
+        entries = qtrio.examples.download.read_manifest(manifest)
+    except qtrio.examples.download.ManifestError as e:
+        raise click.ClickException(str(e)) from e
+
+    import qtrio
+
+    batch_summary: typing.Optional[qtrio.examples.download.BatchSummary]
+    batch_summary = qtrio.run(  # type: ignore[assignment]
+        functools.partial(
+            qtrio.examples.download.start_batch_downloader,
+            entries=entries,
+            fps=fps,
+            max_connections=max_connections,
+        )
+    )
+
+    if batch_summary is None:
+        raise click.ClickException("Cancelled.")
+
+    json.dump(batch_summary.to_dict(), summary, indent=2)
+    summary.write("\n")
+
+    if len(batch_summary.failures) > 0:
+        raise click.exceptions.Exit(1)
@@ -18,6 +18,8 @@ import trio
 import trio.abc
 
 import qtrio
+import qtrio._idle
+import qtrio._process
 import qtrio._qt
 
 
@@ -275,16 +277,18 @@ async def open_emissions_channel(
     )
 
     async with send_channel:
-        with contextlib.ExitStack() as stack:
-            emissions = Emissions(channel=receive_channel, send_channel=send_channel)
-
-            for signal in signals:
-                slot = EmissionsChannelSlot(
+        pairs = [
+            (
+                signal,
+                EmissionsChannelSlot(
                     internal_signal=signal, send_channel=send_channel
-                )
-                stack.enter_context(qtrio._qt.connection(signal, slot.slot))
+                ).slot,
+            )
+            for signal in signals
+        ]
 
-            yield emissions
+        with qtrio._qt.connections(pairs=pairs):
+            yield Emissions(channel=receive_channel, send_channel=send_channel)
 
 
 @async_generator.asynccontextmanager
@@ -388,6 +392,47 @@ class EmissionsNursery:
 
         self.connect(signal=signal, slot=async_slot)
 
+    def connect_in_thread(
+        self,
+        signal: "QtCore.SignalInstance",
+        slot: typing.Callable[..., object],
+        result_slot: typing.Optional[typing.Callable[[object], object]] = None,
+        limiter: typing.Optional[trio.CapacityLimiter] = None,
+        cancellable: bool = False,
+    ) -> None:
+        """Connect a sync slot to this emissions nursery so when called the slot will
+        be run in a worker thread via :func:`trio.to_thread.run_sync`.  This keeps
+        CPU-bound handlers from blocking the GUI thread.  The slot must not interact
+        with Qt objects living in the GUI thread.
+
+        Arguments:
+            signal: The signal to connect.
+            slot: The sync callable to run in a worker thread for each emission.
+            result_slot: Called in the GUI thread with the value returned by ``slot``.
+                Passing the ``emit`` method of a :class:`qtrio.Signal` instance will
+                deliver the results as emissions.
+            limiter: The :class:`trio.CapacityLimiter` bounding the number of
+                concurrently running slots.  Trio's default limiter is used when
+                :obj:`None`.
+            cancellable: See :func:`trio.to_thread.run_sync`.  Calls still waiting
+                on the limiter are cancelled with the nursery either way.  When false,
+                the default, cancellation of the nursery waits for slots already
+                running in a thread to complete.  This keeps the structured guarantee
+                that no slot outlives the nursery, since Python threads can not be
+                interrupted.  When true, running slots are abandoned and left to
+                finish in the background with their results discarded.
+        """
+
+        async def async_slot(*args: object) -> None:
+            result = await trio.to_thread.run_sync(
+                slot, *args, cancellable=cancellable, limiter=limiter
+            )
+
+            if result_slot is not None:
+                result_slot(result)
+
+        self.connect(signal=signal, slot=async_slot)
+
 
 @async_generator.asynccontextmanager
 async def open_emissions_nursery(
@@ -615,6 +660,11 @@ class Runner:
     of the async function passed to :meth:`run` will be passed to this callback.
     """
 
+    process_pool: "qtrio.ProcessPool" = attr.ib(factory=qtrio._process.ProcessPool)
+    """The process pool used by :func:`qtrio.run_in_process` during this run.  The
+    worker processes are started on first use and shutdown in :meth:`trio_done`.
+    """
+
     outcomes: Outcomes = attr.ib(factory=Outcomes, init=False)
     """The outcomes from the Qt and Trio runs."""
     cancel_scope: trio.CancelScope = attr.ib(default=None, init=False)
@@ -704,6 +754,11 @@ class Runner:
 
         result: object = None
 
+        qtrio._process._process_pool.set(self.process_pool)
+        qtrio._idle._idle_monitor.set(
+            qtrio._idle.IdleMonitor(application=self.application)
+        )
+
         with trio.CancelScope() as self.cancel_scope:
             with contextlib.ExitStack() as exit_stack:
                 if (
@@ -724,8 +779,9 @@ class Runner:
     def trio_done(self, run_outcome: outcome.Outcome) -> None:
         """Will be called after the Trio guest run has finished.  This allows collection
         of the :class:`outcome.Outcome` and execution of any application provided done
-        callback.  Finally, if :attr:`qtrio.Runner.quit_application` was set when
-        creating the instance then the Qt application will be requested to quit.
+        callback.  The process pool is shutdown beforehand.  Finally, if
+        :attr:`qtrio.Runner.quit_application` was set when creating the instance then
+        the Qt application will be requested to quit.
 
         Actions such as outputting error information or unwrapping the outcomes need
         to be further considered.
@@ -735,11 +791,14 @@ class Runner:
         """
         self.outcomes = attr.evolve(self.outcomes, trio=run_outcome)
 
-        if self.done_callback is not None:
-            self.done_callback(self.outcomes)
+        try:
+            self.process_pool.shutdown()
+        finally:
+            if self.done_callback is not None:
+                self.done_callback(self.outcomes)
 
-        if self.quit_application:
-            self.application.aboutToQuit.disconnect(_early_quit_warning)
-            self.application.quit()
+            if self.quit_application:
+                self.application.aboutToQuit.disconnect(_early_quit_warning)
+                self.application.quit()
 
-        self._done = True
+            self._done = True
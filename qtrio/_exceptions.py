@@ -89,6 +89,36 @@ class DialogNotActiveError(QTrioException):
     """
 
 
+class ProcessPoolNotAvailableError(QTrioException):
+    """Raised when attempting to run in a process pool outside of a
+    :class:`qtrio.Runner` run.
+    """
+
+
+class SharedBufferNotSupportedError(QTrioException):
+    """Raised when passing a :class:`qtrio.SharedBuffer` on a Python version lacking
+    :mod:`multiprocessing.shared_memory`.
+    """
+
+
+class SignalNotDeclaredError(QTrioException):
+    """Raised when accessing a :class:`qtrio.Signal` that was added to a class after
+    signals of the class were first used.
+    """
+
+
+class RunnerNotActiveError(QTrioException):
+    """Raised when using a feature that requires a :class:`qtrio.Runner` run outside of
+    one.
+    """
+
+
+class HeadlessScriptExhaustedError(QTrioException):
+    """Raised when a headless dialog is waited on after all the scripted responses were
+    used.
+    """
+
+
 class QTrioWarning(UserWarning):
     """Base warning for all QTrio warnings."""
 
@@ -98,3 +128,9 @@ class ApplicationQuitWarning(QTrioWarning):
     application lifetime.  See the documentation on
     :ref:`the application lifetime <lifetime>` for more information.
     """
+
+
+class ConnectionCountWarning(QTrioWarning):
+    """Emitted when the live connections to a signal exceed the threshold of a
+    :class:`qtrio.ConnectionRegistry`, possibly indicating leaked connections.
+    """
@@ -0,0 +1,191 @@
+"""This module provides scheduling of low priority work for when the Qt host is idle.
+
+Attributes:
+    _idle_monitor: The idle monitor of the present :class:`qtrio.Runner` run.
+"""
+import contextlib
+import sys
+import typing
+
+import attr
+import trio
+
+import qtrio
+import qtrio._qt
+
+
+if typing.TYPE_CHECKING or "sphinx_autodoc_typehints" in sys.modules:
+    from qts import QtCore
+
+    import qtrio.qt
+
+
+_idle_monitor: trio.lowlevel.RunVar = trio.lowlevel.RunVar("qtrio._idle_monitor")
+
+
+def _input_event_types() -> typing.FrozenSet["QtCore.QEvent.Type"]:
+    from qts import QtCore
+
+    return frozenset(
+        [
+            QtCore.QEvent.KeyPress,
+            QtCore.QEvent.KeyRelease,
+            QtCore.QEvent.MouseButtonPress,
+            QtCore.QEvent.MouseButtonRelease,
+            QtCore.QEvent.MouseButtonDblClick,
+            QtCore.QEvent.MouseMove,
+            QtCore.QEvent.Wheel,
+            QtCore.QEvent.TouchBegin,
+            QtCore.QEvent.TouchUpdate,
+            QtCore.QEvent.TabletPress,
+        ]
+    )
+
+
+@attr.s(auto_attribs=True)
+class IdleMonitor:
+    """Notice when the Qt host is idle and when user input arrives.  The Qt hooks are
+    only installed while they are needed by a waiting task or a preemptible scope.
+    Generally this is used via :func:`qtrio.until_idle`,
+    :func:`qtrio.preempt_on_input`, and :func:`qtrio.run_when_idle`.
+    """
+
+    application: "QtCore.QCoreApplication"
+    """The application to monitor."""
+
+    _waiters: typing.List[trio.Event] = attr.ib(factory=list, init=False)
+    _scopes: typing.List[trio.CancelScope] = attr.ib(factory=list, init=False)
+    _about_to_block: typing.Optional[qtrio._qt.Connections] = attr.ib(
+        default=None, init=False
+    )
+    _input_filter: typing.Optional["qtrio.qt.InputEventFilter"] = attr.ib(
+        default=None, init=False
+    )
+
+    async def until_idle(self) -> None:
+        """See :func:`qtrio.until_idle`."""
+        event = trio.Event()
+        self._waiters.append(event)
+
+        if self._about_to_block is None:
+            from qts import QtCore
+
+            dispatcher = QtCore.QAbstractEventDispatcher.instance(
+                self.application.thread()
+            )
+            self._about_to_block = qtrio._qt.Connections()
+            self._about_to_block.connect(
+                signal=dispatcher.aboutToBlock, slot=self._idle
+            )
+
+        try:
+            await event.wait()
+        finally:
+            if event in self._waiters:
+                self._waiters.remove(event)
+            self._maybe_disconnect()
+
+    def _idle(self) -> None:
+        waiters = self._waiters
+        self._waiters = []
+
+        for event in waiters:
+            event.set()
+
+        self._maybe_disconnect()
+
+    def _maybe_disconnect(self) -> None:
+        if len(self._waiters) == 0 and self._about_to_block is not None:
+            self._about_to_block.disconnect_all()
+            self._about_to_block = None
+
+    @contextlib.contextmanager
+    def preempt_on_input(self) -> typing.Generator[trio.CancelScope, None, None]:
+        """See :func:`qtrio.preempt_on_input`."""
+        with trio.CancelScope() as cancel_scope:
+            self._scopes.append(cancel_scope)
+
+            if self._input_filter is None:
+                import qtrio.qt
+
+                self._input_filter = qtrio.qt.InputEventFilter(
+                    event_types=_input_event_types(), callback=self._input
+                )
+                self.application.installEventFilter(self._input_filter)
+
+            try:
+                yield cancel_scope
+            finally:
+                self._scopes.remove(cancel_scope)
+
+                if len(self._scopes) == 0:
+                    self.application.removeEventFilter(self._input_filter)
+                    self._input_filter = None
+
+    def _input(self) -> None:
+        for cancel_scope in self._scopes:
+            cancel_scope.cancel()
+
+
+def _get_idle_monitor() -> IdleMonitor:
+    try:
+        idle_monitor: IdleMonitor = _idle_monitor.get()
+    except LookupError:
+        raise qtrio.RunnerNotActiveError(
+            "Idle scheduling is only available while running in a qtrio.Runner."
+        ) from None
+
+    return idle_monitor
+
+
+async def until_idle() -> None:
+    """Wait until the Qt host event loop has processed all pending events and is about
+    to block waiting for more.
+
+    Raises:
+        qtrio.RunnerNotActiveError: If called outside of a :class:`qtrio.Runner` run.
+    """
+    await _get_idle_monitor().until_idle()
+
+
+@contextlib.contextmanager
+def preempt_on_input() -> typing.Generator[trio.CancelScope, None, None]:
+    """Cancel the managed context as soon as user input such as a key press, mouse
+    click or wheel event arrives for any object in the application.  Check
+    :attr:`trio.CancelScope.cancelled_caught` of the yielded scope to tell if the work
+    was preempted.  An application wide event filter is installed only while such
+    contexts are active.
+
+    Yields:
+        The cancel scope which will be cancelled on input.
+
+    Raises:
+        qtrio.RunnerNotActiveError: If used outside of a :class:`qtrio.Runner` run.
+    """
+    with _get_idle_monitor().preempt_on_input() as cancel_scope:
+        yield cancel_scope
+
+
+async def run_when_idle(
+    async_fn: typing.Callable[..., typing.Awaitable[object]], *args: object
+) -> object:
+    """Run low priority work such as warming caches only while the Qt host is idle.
+    The async function is started once the host is idle and cancelled as soon as user
+    input arrives, then restarted from scratch once the host is idle again.  It should
+    therefore be safe to cancel and repeat.
+
+    Arguments:
+        async_fn: The async function to run.
+        args: Positional arguments to pass to ``async_fn``.
+
+    Returns:
+        The object returned by ``async_fn``.
+
+    Raises:
+        qtrio.RunnerNotActiveError: If called outside of a :class:`qtrio.Runner` run.
+    """
+    while True:
+        await until_idle()
+
+        with preempt_on_input():
+            return await async_fn(*args)
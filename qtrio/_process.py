@@ -0,0 +1,308 @@
+"""This module provides process pool execution integrated with the lifetime of a
+:class:`qtrio.Runner`.
+
+Attributes:
+    _process_pool: The process pool of the present :class:`qtrio.Runner` run.
+"""
+import concurrent.futures
+import multiprocessing
+import os
+import sys
+import typing
+
+import attr
+import trio
+
+import qtrio
+
+
+if typing.TYPE_CHECKING:
+    import multiprocessing.shared_memory
+
+
+_process_pool: trio.lowlevel.RunVar = trio.lowlevel.RunVar("qtrio._process_pool")
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class SharedBuffer:
+    """Wrap an object supporting the buffer protocol, such as a :class:`bytes` or an
+    array, so it is passed to the worker process through shared memory rather than as
+    a pickled copy.  The worker receives a read-only :class:`memoryview` of the data in
+    place of this wrapper.  The view is only valid for the duration of the call.
+
+    Note:
+        Requires Python 3.8 or later for :mod:`multiprocessing.shared_memory`.  On
+        earlier versions :class:`qtrio.SharedBufferNotSupportedError` is raised.
+    """
+
+    buffer: typing.Any
+    """The object supporting the buffer protocol to be shared."""
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class _SharedBufferHandle:
+    name: str
+    nbytes: int
+
+
+def _call_with_shared_buffers(
+    fn: typing.Callable[..., object], args: typing.Tuple[object, ...]
+) -> object:
+    """Attach to the shared memory blocks referenced by ``args`` and call ``fn`` with
+    views of them in place of the handles.  Runs in the worker process.
+
+    Arguments:
+        fn: The function to call.
+        args: The positional arguments to pass, possibly including shared buffer
+            handles.
+
+    Returns:
+        Whatever ``fn`` returns.
+    """
+    from multiprocessing import shared_memory
+
+    blocks: typing.List[shared_memory.SharedMemory] = []
+    views: typing.List[memoryview] = []
+    converted_args: typing.List[object] = []
+
+    try:
+        for arg in args:
+            if isinstance(arg, _SharedBufferHandle):
+                block = shared_memory.SharedMemory(name=arg.name)
+                blocks.append(block)
+                view = block.buf[: arg.nbytes].toreadonly()
+                views.append(view)
+                converted_args.append(view)
+            else:
+                converted_args.append(arg)
+
+        return fn(*converted_args)
+    finally:
+        for view in views:
+            view.release()
+        for block in blocks:
+            block.close()
+
+
+def _share(
+    buffer: SharedBuffer,
+) -> typing.Tuple["multiprocessing.shared_memory.SharedMemory", _SharedBufferHandle]:
+    """Copy the buffer into a new shared memory block.
+
+    Arguments:
+        buffer: The buffer to share.
+
+    Returns:
+        The new shared memory block and the handle to pass to the worker.
+    """
+    if sys.version_info < (3, 8):  # pragma: no cover
+        raise qtrio.SharedBufferNotSupportedError(
+            "qtrio.SharedBuffer requires Python 3.8 or later."
+        )
+
+    from multiprocessing import shared_memory
+
+    with memoryview(buffer.buffer) as source:
+        nbytes = source.nbytes
+        # zero sized blocks are not allowed
+        block = shared_memory.SharedMemory(create=True, size=max(1, nbytes))
+        block.buf[:nbytes] = source.cast("B")
+
+    return block, _SharedBufferHandle(name=block.name, nbytes=nbytes)
+
+
+@attr.s(auto_attribs=True)
+class ProcessPool:
+    """A lazily started pool of worker processes.  Generally the pool associated with
+    the present :class:`qtrio.Runner` will be used via :func:`qtrio.run_in_process`.
+    """
+
+    max_workers: typing.Optional[int] = None
+    """The maximum number of worker processes and of concurrently submitted calls.
+    Defaults to the number of processors when :obj:`None`.
+    """
+    mp_context: typing.Optional[typing.Any] = attr.ib(
+        factory=lambda: multiprocessing.get_context("spawn")
+    )
+    """The :mod:`multiprocessing` context used to start the workers.  Spawning is the
+    default to avoid forking a process with a running Qt application.
+    """
+
+    executor: typing.Optional[concurrent.futures.ProcessPoolExecutor] = attr.ib(
+        default=None, init=False
+    )
+    """The executor once started, otherwise :obj:`None`."""
+    _limiter: typing.Optional[trio.CapacityLimiter] = attr.ib(default=None, init=False)
+
+    def _start(
+        self,
+    ) -> typing.Tuple[concurrent.futures.ProcessPoolExecutor, trio.CapacityLimiter]:
+        if self.executor is None or self._limiter is None:
+            max_workers = self.max_workers
+            if max_workers is None:
+                max_workers = os.cpu_count() or 1
+
+            self.executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=self.mp_context
+            )
+            self._limiter = trio.CapacityLimiter(max_workers)
+
+        return self.executor, self._limiter
+
+    async def run(self, fn: typing.Callable[..., object], *args: object) -> object:
+        """See :func:`qtrio.run_in_process`."""
+        executor, limiter = self._start()
+        token = trio.lowlevel.current_trio_token()
+        borrower = object()
+
+        await limiter.acquire_on_behalf_of(borrower)
+
+        def release() -> None:
+            limiter.release_on_behalf_of(borrower)
+
+        def done(future: "concurrent.futures.Future[object]") -> None:
+            # The capacity and shared memory are held until the call actually
+            # completes, even if the caller was cancelled and abandoned it.
+            _release_blocks(blocks=blocks)
+            try:
+                token.run_sync_soon(release)
+            except trio.RunFinishedError:  # pragma: no cover
+                pass
+
+        blocks: typing.List["multiprocessing.shared_memory.SharedMemory"] = []
+
+        try:
+            # Sharing copies the buffers and submitting may spawn worker processes so
+            # keep both off the GUI thread.
+            future = await trio.to_thread.run_sync(_submit, executor, fn, args, blocks)
+        except BaseException:
+            _release_blocks(blocks=blocks)
+            release()
+            raise
+
+        future.add_done_callback(done)
+
+        return await _wait_future(future=future)
+
+    def shutdown(self) -> None:
+        """Shutdown the worker processes, if started.  Calls not yet running are
+        cancelled.  This does not wait so abandoned calls that are running are left to
+        complete in the background after which the workers exit.
+        """
+        if self.executor is None:
+            return
+
+        if sys.version_info >= (3, 9):
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        else:  # pragma: no cover
+            self.executor.shutdown(wait=False)
+
+        self.executor = None
+        self._limiter = None
+
+
+def _submit(
+    executor: concurrent.futures.ProcessPoolExecutor,
+    fn: typing.Callable[..., object],
+    args: typing.Tuple[object, ...],
+    blocks: typing.List["multiprocessing.shared_memory.SharedMemory"],
+) -> "concurrent.futures.Future[object]":
+    """Copy shared buffers to shared memory and submit the call to the executor.
+
+    Arguments:
+        executor: The executor to submit to.
+        fn: The function to call in the worker process.
+        args: Positional arguments to pass to ``fn``.
+        blocks: Filled with the created shared memory blocks.
+
+    Returns:
+        The future for the submitted call.
+    """
+    converted_args: typing.List[object] = []
+    for arg in args:
+        if isinstance(arg, SharedBuffer):
+            block, handle = _share(buffer=arg)
+            blocks.append(block)
+            converted_args.append(handle)
+        else:
+            converted_args.append(arg)
+
+    if len(blocks) > 0:
+        return executor.submit(_call_with_shared_buffers, fn, tuple(converted_args))
+
+    return executor.submit(fn, *converted_args)
+
+
+def _release_blocks(
+    blocks: typing.List["multiprocessing.shared_memory.SharedMemory"],
+) -> None:
+    for block in blocks:
+        block.close()
+        block.unlink()
+
+
+async def _wait_future(future: "concurrent.futures.Future[object]") -> object:
+    """Wait for the future to complete without blocking the Trio thread.  On
+    cancellation the future is cancelled if the executor has not yet started it,
+    otherwise its result is abandoned.
+
+    Arguments:
+        future: The future to wait on.
+
+    Returns:
+        The result of the future.
+    """
+    event = trio.Event()
+    token = trio.lowlevel.current_trio_token()
+
+    def done(future: "concurrent.futures.Future[object]") -> None:
+        try:
+            token.run_sync_soon(event.set)
+        except trio.RunFinishedError:  # pragma: no cover
+            pass
+
+    future.add_done_callback(done)
+
+    try:
+        await event.wait()
+    except trio.Cancelled:
+        future.cancel()
+        raise
+
+    return future.result()
+
+
+async def run_in_process(fn: typing.Callable[..., object], *args: object) -> object:
+    """Run a sync function in a worker process of the present :class:`qtrio.Runner`'s
+    process pool and return the result.  The pool is started on first use and shutdown
+    when the run finishes.  Concurrent calls beyond the pool size wait for capacity.
+    ``fn`` and the arguments must be picklable.  Wrap large buffers in
+    :class:`qtrio.SharedBuffer` to pass them through shared memory.
+
+    If cancelled while waiting for capacity, the call is dropped.  Once submitted to
+    the pool a call generally can not be cancelled.  It is then abandoned and its
+    result discarded, but it keeps its capacity and shared memory until it completes
+    in the background.  Abandoned calls do not delay the end of the run.
+
+    Submission happens in a worker thread since the first calls spawn the worker
+    processes and sharing copies the buffers.
+
+    Arguments:
+        fn: The function to call in the worker process.
+        args: Positional arguments to pass to ``fn``.
+
+    Returns:
+        The object returned by ``fn``.
+
+    Raises:
+        qtrio.ProcessPoolNotAvailableError: If called outside of a
+            :class:`qtrio.Runner` run.
+    """
+    try:
+        process_pool: ProcessPool = _process_pool.get()
+    except LookupError:
+        raise qtrio.ProcessPoolNotAvailableError(
+            "Process pools are only available while running in a qtrio.Runner."
+        ) from None
+
+    return await process_pool.run(fn, *args)
@@ -1,19 +1,152 @@
 """This module provides general Qt related utilities that are not Trio specific."""
 
+import collections
 import contextlib
+import functools
+import os
 import sys
+import time
 import typing
+import warnings
+import weakref
 
-import typing_extensions
+import attr
 
 if typing.TYPE_CHECKING or "sphinx_autodoc_typehints" in sys.modules:
     from qts import QtCore
 
+import qtrio
 import qtrio._python
 
 
-class SignalProtocol(typing_extensions.Protocol):
-    signal: typing.ClassVar["QtCore.Signal"]
+@attr.s(auto_attribs=True, frozen=True)
+class _SignalHostClass:
+    """A generated :class:`QtCore.QObject` subclass hosting the real signals for all
+    the :class:`qtrio.Signal` descriptors of a class.
+    """
+
+    cls: typing.Type["QtCore.QObject"]
+    """The signal-hosting class."""
+    attribute_names: typing.Mapping["Signal", str]
+    """The attribute names on the hosting class for each descriptor."""
+    instance_attribute_names: typing.Mapping["Signal", typing.Tuple[str, ...]]
+    """The attribute names on the owner class for each descriptor, several if it is
+    aliased.
+    """
+
+
+_signal_host_classes: "weakref.WeakKeyDictionary[type, _SignalHostClass]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _signal_host_class(owner: type) -> _SignalHostClass:
+    """Get the signal-hosting class for ``owner``, creating it on first use.  All
+    :class:`qtrio.Signal` descriptors found through the MRO of ``owner`` are hosted by
+    the single class.
+
+    Arguments:
+        owner: The class on which the descriptors are hosted.
+
+    Returns:
+        The signal-hosting class information.
+    """
+    host_class = _signal_host_classes.get(owner)
+
+    if host_class is None:
+        from qts import QtCore
+
+        signals: typing.Dict[str, Signal] = {}
+        for cls in reversed(owner.__mro__):
+            for name, value in vars(cls).items():
+                if isinstance(value, Signal):
+                    signals[name] = value
+                else:
+                    # overridden by a subclass with something other than a signal
+                    signals.pop(name, None)
+
+        namespace: typing.Dict[str, object] = {}
+        attribute_names: typing.Dict[Signal, str] = {}
+        instance_attribute_names: typing.Dict[Signal, typing.Tuple[str, ...]] = {}
+        for name, signal in signals.items():
+            instance_attribute_names[signal] = (
+                *instance_attribute_names.get(signal, ()),
+                name,
+            )
+
+            if signal in attribute_names:
+                # an alias shares the real signal of the first name
+                continue
+
+            # prefixed to avoid shadowing QObject attributes such as .event()
+            attribute_name = "signal_" + name
+            namespace[attribute_name] = signal.create_qt_signal(default_name=name)
+            attribute_names[signal] = attribute_name
+
+        host_class = _SignalHostClass(
+            cls=type(f"{owner.__name__}_SignalHost", (QtCore.QObject,), namespace),
+            attribute_names=attribute_names,
+            instance_attribute_names=instance_attribute_names,
+        )
+        _signal_host_classes[owner] = host_class
+
+    return host_class
+
+
+@attr.s(auto_attribs=True)
+class _IdentityWeakKeyTable:
+    """Map objects to their signal-hosting :class:`QtCore.QObject` by identity while
+    only weakly referencing the objects.  Unlike :class:`weakref.WeakKeyDictionary`
+    this supports unhashable objects such as ``attr.s(eq=True)`` instances.
+    """
+
+    entries: typing.Dict[
+        int, typing.Tuple["weakref.ReferenceType[object]", "QtCore.QObject"]
+    ] = attr.ib(factory=dict)
+
+    def setdefault(
+        self, instance: object, factory: typing.Callable[[], "QtCore.QObject"]
+    ) -> "QtCore.QObject":
+        """Get the value for ``instance``, first storing a new value from ``factory``
+        if needed.
+
+        Arguments:
+            instance: The object to get the value for.
+            factory: Called to create the value when none is present.
+
+        Returns:
+            The value for ``instance``.
+
+        Raises:
+            TypeError: If the object does not support weak references.
+        """
+        key = id(instance)
+        entry = self.entries.get(key)
+
+        if entry is not None and entry[0]() is instance:
+            return entry[1]
+
+        try:
+            reference = weakref.ref(instance, functools.partial(self._remove, key))
+        except TypeError as e:
+            raise TypeError(
+                f"{type(instance).__qualname__} instances need either a __dict__ or"
+                " a __weakref__ slot to host a qtrio.Signal."
+            ) from e
+
+        value = factory()
+        self.entries[key] = (reference, value)
+
+        return value
+
+    def _remove(self, key: int, reference: "weakref.ReferenceType[object]") -> None:
+        entry = self.entries.get(key)
+
+        if entry is not None and entry[0] is reference:
+            del self.entries[key]
+
+
+_slotted_signal_hosts = _IdentityWeakKeyTable()
 
 
 class Signal:
@@ -22,25 +155,41 @@ class Signal:
     not-quite part is that it will be a bit more complicated to change thread affinity
     of the relevant :class:`QtCore.QObject`.  If you need this, maybe just inherit.
 
-    This signal gets around the normally required inheritance by creating
-    :class:`QtCore.QObject` instances behind the scenes to host the real signals.  Just
+    This signal gets around the normally required inheritance by creating a
+    :class:`QtCore.QObject` instance behind the scenes to host the real signals.  All
+    the signals declared on a class share a single hosting object per instance.  Just
     as :class:`QtCore.Signal` uses the Python descriptor protocol to intercept the
     attribute access, so does this so it can 'redirect' to the signal on the other
-    object.
+    object.  Signals must be declared in the class body or at least before the first
+    access of any signal on an instance of the class.  Signals added later raise
+    :class:`qtrio.SignalNotDeclaredError` when accessed.  When no name is passed the
+    real signal is named after the attribute the descriptor is assigned to.
+
+    The signal instance is cached in the instance ``__dict__`` on first access so that
+    later accesses are plain attribute lookups.  Classes using ``__slots__``, such as
+    ``attr.s(slots=True)``, are supported if they have a ``__weakref__`` slot.
     """
 
     _attribute_name: typing.ClassVar[str] = ""
 
     def __init__(self, *types: type, name: typing.Optional[str] = None) -> None:
+        self.types = types
+        self.name = name
+
+    def create_qt_signal(self, default_name: str) -> "QtCore.Signal":
+        """Create the real signal to be placed on the hosting class.
+
+        Arguments:
+            default_name: The signal name to use if none was specified.
+
+        Returns:
+            The new signal.
+        """
         from qts import QtCore
 
-        class _SignalQObject(QtCore.QObject):
-            if name is None:
-                signal = QtCore.Signal(*types)
-            else:
-                signal = QtCore.Signal(*types, name=name)
+        name = default_name if self.name is None else self.name
 
-        self.object_cls: typing.Type[SignalProtocol] = _SignalQObject
+        return QtCore.Signal(*self.types, name=name)
 
     @typing.overload
     def __get__(self, instance: None, owner: object) -> "Signal":
@@ -56,9 +205,45 @@ class Signal:
         if instance is None:
             return self
 
-        o = self.object(instance=instance)
+        host_class = _signal_host_class(type(instance))
+        o = self._object(instance=instance, host_class=host_class)
+        signal_instance = getattr(o, host_class.attribute_names[self])
+
+        instance_dict = getattr(instance, "__dict__", None)
+        if instance_dict is not None:
+            # This is a non-data descriptor so the instance attributes will shadow it
+            # and later accesses will be a plain attribute lookup.  Aliases share the
+            # signal so they are all cached.
+            for name in host_class.instance_attribute_names[self]:
+                instance_dict[name] = signal_instance
+
+        return signal_instance
 
-        return o.signal
+    def _object(
+        self, instance: object, host_class: _SignalHostClass
+    ) -> "QtCore.QObject":
+        if self not in host_class.attribute_names:
+            raise qtrio.SignalNotDeclaredError(
+                "Signal not found on the signal-hosting class, signals must be declared"
+                " before first use."
+            )
+
+        instance_dict = getattr(instance, "__dict__", None)
+
+        if instance_dict is None:
+            # Classes with __slots__ such as attr.s(slots=True) get a side table.
+            return _slotted_signal_hosts.setdefault(
+                instance=instance, factory=host_class.cls
+            )
+
+        o: typing.Optional[QtCore.QObject] = instance_dict.get(self._attribute_name)
+
+        if o is None:
+            o = host_class.cls()
+            # Avoid setattr() so frozen classes are supported.
+            instance_dict[self._attribute_name] = o
+
+        return o
 
     def object(self, instance: object) -> "QtCore.QObject":
         """Get the :class:`QtCore.QObject` that hosts the real signal.  This can be
@@ -72,24 +257,330 @@ class Signal:
 
         Returns:
             The signal-hosting :class:`QtCore.QObject`.
+
+        Raises:
+            qtrio.SignalNotDeclaredError: If this signal was added to the class after
+                the signal-hosting class was created.
+            TypeError: If the instance has neither a ``__dict__`` nor supports weak
+                references.
         """
-        d: typing.Optional[
-            typing.Dict[typing.Type[SignalProtocol], QtCore.QObject]
-        ] = getattr(instance, self._attribute_name, None)
+        return self._object(
+            instance=instance, host_class=_signal_host_class(type(instance))
+        )
 
-        if d is None:
-            d = {}
-            setattr(instance, self._attribute_name, d)
 
-        o: typing.Optional[QtCore.QObject] = d.get(self.object_cls)
-        if o is None:
-            o = self.object_cls()
-            d[self.object_cls] = o
+Signal._attribute_name = qtrio._python.identifier_path(Signal)
 
-        return o
 
+@attr.s(auto_attribs=True, frozen=True, eq=False)
+class _ConnectionRecord:
+    signal: str
+    site: str
+    created: float
 
-Signal._attribute_name = qtrio._python.identifier_path(Signal)
+
+@attr.s(auto_attribs=True, frozen=True)
+class ConnectionStatistics:
+    """The live connections of a single signal as tracked by a
+    :class:`qtrio.ConnectionRegistry`.
+    """
+
+    signal: str
+    """A description of the signal."""
+    count: int
+    """The number of live connections."""
+    sites: typing.Mapping[str, int]
+    """The number of live connections made from each ``file:line`` creation site."""
+    oldest_age: float
+    """Seconds since the oldest live connection was made."""
+
+
+_internal_files = {
+    os.path.normcase(os.path.abspath(path))
+    for path in [
+        __file__,
+        os.path.join(os.path.dirname(__file__), "_core.py"),
+        contextlib.__file__,
+    ]
+}
+
+
+def _creation_site() -> str:
+    """Describe the first frame on the stack outside of the connection machinery.
+
+    Returns:
+        The site as ``file:line``.
+    """
+    frame = sys._getframe(1)
+
+    while frame.f_back is not None:
+        filename = os.path.normcase(os.path.abspath(frame.f_code.co_filename))
+        if filename not in _internal_files:
+            break
+        frame = frame.f_back
+
+    return f"{frame.f_code.co_filename}:{frame.f_lineno}"
+
+
+@attr.s(auto_attribs=True)
+class ConnectionRegistry:
+    """Track the live connections made through QTrio such as by
+    :func:`qtrio.enter_emissions_channel` and :class:`qtrio.EmissionsNursery`.
+    Generally instances should be created via :func:`qtrio.track_connections`.
+    """
+
+    threshold: typing.Optional[int] = None
+    """Warn with :class:`qtrio.ConnectionCountWarning` when the live connections of a
+    single signal exceed this count.  :obj:`None` disables the warning.
+    """
+    clock: typing.Callable[[], float] = time.monotonic
+    """The clock used to measure the age of the connections."""
+    records: typing.Dict[str, typing.List[_ConnectionRecord]] = attr.ib(
+        factory=lambda: collections.defaultdict(list)
+    )
+    """The live connection records, per signal."""
+
+    def add(self, signal: "QtCore.SignalInstance") -> _ConnectionRecord:
+        """Record a new connection.
+
+        Arguments:
+            signal: The connected signal.
+
+        Returns:
+            The record to pass to :meth:`remove` when disconnecting.
+        """
+        description = repr(signal)
+        record = _ConnectionRecord(
+            signal=description, site=_creation_site(), created=self.clock()
+        )
+        records = self.records[description]
+        records.append(record)
+
+        if self.threshold is not None and len(records) == self.threshold + 1:
+            warnings.warn(
+                qtrio.ConnectionCountWarning(
+                    f"{len(records)} live connections to {description}, most recently"
+                    f" from {record.site}"
+                ),
+                stacklevel=2,
+            )
+
+        return record
+
+    def remove(self, record: _ConnectionRecord) -> None:
+        """Forget a connection that has been disconnected.
+
+        Arguments:
+            record: The record returned by :meth:`add`.
+        """
+        records = self.records.get(record.signal)
+        if records is None:
+            return
+
+        try:
+            records.remove(record)
+        except ValueError:
+            return
+
+        if len(records) == 0:
+            del self.records[record.signal]
+
+    def top(self, count: int = 10) -> typing.List[ConnectionStatistics]:
+        """Get the signals with the most live connections.
+
+        Arguments:
+            count: The maximum number of signals to report.
+
+        Returns:
+            The statistics ordered by descending connection count.
+        """
+        now = self.clock()
+        statistics = [
+            ConnectionStatistics(
+                signal=signal,
+                count=len(records),
+                sites=dict(collections.Counter(record.site for record in records)),
+                oldest_age=now - min(record.created for record in records),
+            )
+            for signal, records in self.records.items()
+        ]
+        statistics.sort(key=lambda statistic: statistic.count, reverse=True)
+
+        return statistics[:count]
+
+    def dump(
+        self, count: int = 10, file: typing.Optional[typing.TextIO] = None
+    ) -> None:
+        """Write a report of the signals with the most live connections.
+
+        Arguments:
+            count: The maximum number of signals to report.
+            file: Where to write the report.  Defaults to :data:`sys.stderr`.
+        """
+        if file is None:
+            file = sys.stderr
+
+        for statistic in self.top(count=count):
+            print(
+                f"{statistic.count} connections, oldest {statistic.oldest_age:.1f}s:"
+                f" {statistic.signal}",
+                file=file,
+            )
+            for site, site_count in sorted(
+                statistic.sites.items(), key=lambda item: item[1], reverse=True
+            ):
+                print(f"    {site_count} from {site}", file=file)
+
+
+_connection_registry: typing.Optional[ConnectionRegistry] = None
+
+
+@contextlib.contextmanager
+def track_connections(
+    threshold: typing.Optional[int] = None,
+) -> typing.Generator[ConnectionRegistry, None, None]:
+    """Track the live connections made through QTrio while in this context manager to
+    help find leaks.  Connections made while not tracking are not recorded, leaving the
+    only cost a check of whether tracking is enabled.
+
+    Arguments:
+        threshold: See :attr:`qtrio.ConnectionRegistry.threshold`.
+
+    Yields:
+        The registry recording the connections.
+    """
+    global _connection_registry
+
+    previous = _connection_registry
+    registry = ConnectionRegistry(threshold=threshold)
+    _connection_registry = registry
+
+    try:
+        yield registry
+    finally:
+        _connection_registry = previous
+
+
+ConnectionHandle = typing.Union[
+    "QtCore.QMetaObject.Connection",
+    typing.Callable[..., object],
+    "QtCore.SignalInstance",  # TODO: https://bugreports.qt.io/browse/PYSIDE-1334
+]
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class _TrackedConnection:
+    signal: "QtCore.SignalInstance"
+    slot: typing.Callable[..., object]
+    """Held strongly since PyQt only weakly references bound method slots."""
+    handle: ConnectionHandle
+    record: typing.Optional[_ConnectionRecord]
+    registry: typing.Optional[ConnectionRegistry]
+
+
+@attr.s(auto_attribs=True)
+class Connections:
+    """Track signal and slot connections so they can be disconnected together in a
+    single pass.  Generally instances should be created via
+    :func:`qtrio._qt.connections`.
+
+    With PyQt the :class:`QtCore.QMetaObject.Connection` handles returned when
+    connecting are used to disconnect without raising for connections that are
+    already gone.  PySide does not provide such handles
+    (https://bugreports.qt.io/browse/PYSIDE-1334) so there each disconnection still
+    falls back to catching the :class:`RuntimeError` raised for a missing connection.
+    """
+
+    connections: typing.List[_TrackedConnection] = attr.ib(factory=list)
+    """The tracked connections, including strong references to their slots."""
+
+    def connect(
+        self, signal: "QtCore.SignalInstance", slot: typing.Callable[..., object]
+    ) -> ConnectionHandle:
+        """Connect a signal and slot and track the connection.
+
+        Args:
+            signal: The signal to connect.
+            slot: The callable to connect the signal to.
+
+        Returns:
+            The handle usable to disconnect the signal.
+        """
+        import qts
+
+        # if you get segfault or sigsegv here, especially from pyside2<5.15.2, make
+        # sure the slot isn't on a non-hashable (frozen will make it hashable) attrs
+        # class.  https://bugreports.qt.io/browse/PYSIDE-1422
+        handle: ConnectionHandle = signal.connect(slot)
+
+        if qts.is_pyside_5_wrapper or qts.is_pyside_6_wrapper:
+            # PySide2 presently returns a bool rather than a QMetaObject.Connection
+            # https://bugreports.qt.io/browse/PYSIDE-1334
+            handle = slot
+
+        registry = _connection_registry
+        record = None if registry is None else registry.add(signal=signal)
+
+        self.connections.append(
+            _TrackedConnection(
+                signal=signal,
+                slot=slot,
+                handle=handle,
+                record=record,
+                registry=registry,
+            )
+        )
+
+        return handle
+
+    def disconnect_all(self) -> None:
+        """Disconnect all tracked connections.  Connections that were already
+        disconnected are ignored.
+        """
+        import qts
+        from qts import QtCore
+
+        connections = self.connections
+        self.connections = []
+
+        if qts.is_pyside_5_wrapper or qts.is_pyside_6_wrapper:
+            for connection in connections:
+                try:
+                    connection.signal.disconnect(connection.handle)
+                except RuntimeError:
+                    pass
+        else:
+            # disconnecting by handle just returns false if already disconnected
+            disconnect = QtCore.QObject.disconnect
+            for connection in connections:
+                disconnect(connection.handle)
+
+        for connection in connections:
+            if connection.registry is not None and connection.record is not None:
+                connection.registry.remove(record=connection.record)
+
+
+@contextlib.contextmanager
+def connections(
+    pairs: typing.Iterable[
+        typing.Tuple["QtCore.SignalInstance", typing.Callable[..., object]]
+    ],
+) -> typing.Generator[Connections, None, None]:
+    """Connect signal and slot pairs for the duration of the context manager.  All the
+    connections are disconnected together on exit.
+
+    Args:
+        pairs: The signals and the callables to connect them to.
+    """
+    this_connections = Connections()
+
+    try:
+        for signal, slot in pairs:
+            this_connections.connect(signal=signal, slot=slot)
+
+        yield this_connections
+    finally:
+        this_connections.disconnect_all()
 
 
 @contextlib.contextmanager
@@ -123,9 +614,15 @@ def connection(
         # https://bugreports.qt.io/browse/PYSIDE-1334
         this_connection = slot
 
+    registry = _connection_registry
+    record = None if registry is None else registry.add(signal=signal)
+
     try:
         yield this_connection
     finally:
+        if registry is not None and record is not None:
+            registry.remove(record=record)
+
         expected_exception: typing.Type[Exception]
 
         if qts.is_pyside_5_wrapper or qts.is_pyside_6_wrapper:
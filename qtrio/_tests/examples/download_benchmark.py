@@ -0,0 +1,305 @@
+"""Benchmarks for :mod:`qtrio.examples.download`.  Run with
+``python -m qtrio._tests.examples.download_benchmark --help``.
+"""
+import contextlib
+import functools
+import itertools
+import tempfile
+import time
+import tracemalloc
+import typing
+
+import attr
+import click
+import hypercorn.config
+import hypercorn.trio
+import hyperlink
+import quart_trio
+import trio
+import trio_typing
+
+import qtrio
+import qtrio.dialogs
+import qtrio.examples.download
+
+
+async def serve_payload(
+    payload: bytes,
+    *,
+    task_status: trio_typing.TaskStatus[hyperlink.URL] = trio.TASK_STATUS_IGNORED,
+) -> None:
+    """Serve the payload at every path over HTTP on an ephemeral local port until
+    cancelled.  The base URL is passed to ``task_status.started()``.
+    """
+    application = quart_trio.QuartTrio(__name__)
+
+    @application.route("/<path:path>")
+    async def root(path: str) -> bytes:
+        return payload
+
+    config = hypercorn.config.Config()
+    config.bind = ["127.0.0.1:0"]
+    config.accesslog = None
+    config.loglevel = "WARNING"
+
+    async with trio.open_nursery() as nursery:
+        binds: typing.List[str] = await nursery.start(
+            functools.partial(hypercorn.trio.serve, application, config)
+        )
+        task_status.started(hyperlink.URL.from_text(binds[0]))
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class PoolingResult:
+    """Requests per second for each approach."""
+
+    per_download_client: float
+    pooled_client: float
+
+
+async def measure_pooling(
+    count: int = 200, size: int = 10_000, concurrency: int = 10
+) -> PoolingResult:
+    """Download the same small payload ``count`` times with up to ``concurrency`` at
+    once.  First with a client per download, as :func:`qtrio.examples.download.get`
+    does by default, then through a :class:`qtrio.examples.download.DownloadManager`.
+
+    Arguments:
+        count: The number of downloads for each approach.
+        size: The payload size in bytes.
+        concurrency: The maximum concurrent downloads.
+
+    Returns:
+        The requests per second of each approach.
+    """
+    async with trio.open_nursery() as nursery:
+        base_url = await nursery.start(serve_payload, bytes(size))
+
+        with tempfile.TemporaryDirectory() as directory:
+            destination_directory = trio.Path(directory)
+
+            def url(index: int) -> hyperlink.URL:
+                return base_url.child(str(index))
+
+            def destination(index: int) -> trio.Path:
+                return destination_directory.joinpath(str(index))
+
+            limiter = trio.CapacityLimiter(concurrency)
+
+            async def download(index: int) -> None:
+                async with limiter:
+                    async for _ in qtrio.examples.download.get(
+                        url=url(index), destination=destination(index)
+                    ):
+                        pass
+
+            start = time.perf_counter()
+            async with trio.open_nursery() as downloads_nursery:
+                for index in range(count):
+                    downloads_nursery.start_soon(download, index)
+            per_download_client = count / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            async with qtrio.examples.download.open_download_manager(
+                max_connections=concurrency,
+                max_connections_per_host=concurrency,
+            ) as manager:
+                for index in range(count):
+                    manager.submit(url=url(index), destination=destination(index))
+                await manager.join()
+            pooled_client = count / (time.perf_counter() - start)
+
+        nursery.cancel_scope.cancel()
+
+    return PoolingResult(
+        per_download_client=per_download_client, pooled_client=pooled_client
+    )
+
+
+@attr.s(auto_attribs=True)
+class PayloadApplication:
+    """An ASGI application serving a payload of zeros at every path.  Sending never
+    waits on a socket so the download side is the bottleneck.
+    """
+
+    size: int
+
+    async def __call__(
+        self,
+        scope: typing.Dict[str, typing.Any],
+        receive: typing.Callable[[], typing.Awaitable[typing.Dict[str, typing.Any]]],
+        send: typing.Callable[[typing.Dict[str, typing.Any]], typing.Awaitable[None]],
+    ) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-length", str(self.size).encode())],
+            }
+        )
+        await send({"type": "http.response.body", "body": bytes(self.size)})
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class ThroughputResult:
+    """The measurements of one download through
+    :class:`qtrio.examples.download.GetDialog`.
+    """
+
+    headless: bool
+    chunk_size: int
+    fps: float
+    bytes_per_second: float
+    cpu_seconds: float
+    """The process CPU time, including all threads."""
+    peak_memory: int
+    """The peak bytes allocated by Python as traced by :mod:`tracemalloc`.  This
+    includes the payload held by the in-process server and HTTP transport.
+    """
+
+
+async def measure_throughput(
+    size: int, chunk_size: int, fps: float, headless: bool
+) -> ThroughputResult:
+    """Download a payload of ``size`` bytes from an in-process ASGI application via
+    :func:`qtrio.examples.download.start_get_dialog`.  The clock runs from the start
+    until the summary message box is shown.  Tracing memory slows Python code so
+    compare the throughput of runs with each other rather than with production.
+
+    Arguments:
+        size: The payload size in bytes.
+        chunk_size: The fixed chunk size handed to the writer and progress reporting.
+        fps: The frame rate of the progress dialog.
+        headless: Use :func:`qtrio.dialogs.use_headless_backend` instead of widgets.
+
+    Returns:
+        The measurements.
+    """
+    with contextlib.ExitStack() as stack:
+        directory = stack.enter_context(tempfile.TemporaryDirectory())
+        if headless:
+            stack.enter_context(
+                qtrio.dialogs.use_headless_backend(
+                    responder=qtrio.dialogs.scripted_responder([None])
+                )
+            )
+
+        tracemalloc.start()
+        start_cpu = time.process_time()
+        start = time.perf_counter()
+
+        try:
+            async with trio.open_nursery() as nursery:
+                get_dialog: qtrio.examples.download.GetDialog = await nursery.start(
+                    functools.partial(
+                        qtrio.examples.download.start_get_dialog,
+                        url=hyperlink.URL.from_text("http://benchmark/"),
+                        destination=trio.Path(directory).joinpath("payload"),
+                        fps=fps,
+                        http_application=PayloadApplication(size=size),
+                        chunk_sizer=qtrio.examples.download.ChunkSizer(
+                            minimum=chunk_size, maximum=chunk_size
+                        ),
+                    )
+                )
+
+                await get_dialog.message_box_shown_event.wait()
+                end = time.perf_counter()
+                end_cpu = time.process_time()
+                _, peak_memory = tracemalloc.get_traced_memory()
+
+                if get_dialog.message_box is not None:
+                    accept_button = get_dialog.message_box.accept_button
+                    if accept_button is not None:
+                        accept_button.click()
+        finally:
+            tracemalloc.stop()
+
+    return ThroughputResult(
+        headless=headless,
+        chunk_size=chunk_size,
+        fps=fps,
+        bytes_per_second=size / (end - start),
+        cpu_seconds=end_cpu - start_cpu,
+        peak_memory=peak_memory,
+    )
+
+
+async def measure_throughputs(
+    size: int,
+    chunk_sizes: typing.Sequence[int],
+    fpss: typing.Sequence[float],
+    headlesses: typing.Sequence[bool] = (True, False),
+) -> typing.List[ThroughputResult]:
+    """Run :func:`measure_throughput` for every combination of the parameters."""
+    return [
+        await measure_throughput(
+            size=size, chunk_size=chunk_size, fps=fps, headless=headless
+        )
+        for headless, chunk_size, fps in itertools.product(
+            headlesses, chunk_sizes, fpss
+        )
+    ]
+
+
+@click.group()
+def cli() -> None:  # pragma: no cover
+    """Benchmark the download example."""
+
+
+@cli.command()
+@click.option("--count", default=200, type=click.IntRange(min=1))
+@click.option("--size", default=10_000, type=click.IntRange(min=0))
+@click.option("--concurrency", default=10, type=click.IntRange(min=1))
+def pooling(count: int, size: int, concurrency: int) -> None:  # pragma: no cover
+    """Compare requests per second with and without a pooled client.  Payloads are
+    served over real local sockets so connection setup costs are included.
+    """
+    result: PoolingResult = qtrio.run(  # type: ignore[assignment]
+        functools.partial(
+            measure_pooling, count=count, size=size, concurrency=concurrency
+        )
+    )
+
+    click.echo(f"per download client: {result.per_download_client:.1f} requests/s")
+    click.echo(f"pooled client:       {result.pooled_client:.1f} requests/s")
+
+
+@cli.command()
+@click.option("--size", default=100_000_000, type=click.IntRange(min=1))
+@click.option(
+    "--chunk-size",
+    "chunk_sizes",
+    multiple=True,
+    default=[16_384, 262_144, 4_194_304],
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--fps", "fpss", multiple=True, default=[10, 60], type=click.FloatRange(min=0.1)
+)
+def throughput(
+    size: int, chunk_sizes: typing.Tuple[int, ...], fpss: typing.Tuple[float, ...]
+) -> None:  # pragma: no cover
+    """Measure the download throughput, CPU time and peak memory for each combination
+    of chunk size and frame rate, headless and with the dialog.
+    """
+    results: typing.List[ThroughputResult] = qtrio.run(  # type: ignore[assignment]
+        functools.partial(
+            measure_throughputs, size=size, chunk_sizes=chunk_sizes, fpss=fpss
+        )
+    )
+
+    click.echo(
+        f"{'mode':>8} {'chunk':>9} {'fps':>5} {'MB/s':>9} {'CPU s':>7} {'peak MB':>8}"
+    )
+    for result in results:
+        mode = "headless" if result.headless else "dialog"
+        click.echo(
+            f"{mode:>8} {result.chunk_size:>9} {result.fps:>5g}"
+            f" {result.bytes_per_second / 1e6:>9.1f} {result.cpu_seconds:>7.2f}"
+            f" {result.peak_memory / 1e6:>8.1f}"
+        )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    cli()
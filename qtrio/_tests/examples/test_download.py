@@ -1,15 +1,26 @@
+import contextlib
 import functools
+import hashlib
+import io
+import json
+import math
 import os
 import pathlib
 import random
+import subprocess
 import sys
+import threading
 import typing
 
+import attr
 import hyperlink
 import pytest
+import quart
 import quart_trio
 import trio
+import trio.testing
 
+import qtrio._tests.examples.download_benchmark
 import qtrio.dialogs
 import qtrio.examples.download
 
@@ -288,3 +299,1082 @@ async def test_get(
     assert written == data
     assert all(progress.total == content_length for progress in progresses)
     assert [progresses[0].downloaded, progresses[-1].downloaded] == [0, len(data)]
+
+
+async def test_get_updates_counter(
+    chunked_data: typing.List[bytes],
+    content_length: typing.Optional[int],
+    http_application: quart_trio.QuartTrio,
+    url: hyperlink.URL,
+    tmp_path: pathlib.Path,
+) -> None:
+    """The counter follows every chunk while progress is only yielded at the start and
+    end with an infinite update period.
+    """
+    data = b"".join(chunked_data)
+    counter = qtrio.examples.download.ProgressCounter()
+
+    progresses = [
+        progress
+        async for progress in qtrio.examples.download.get(
+            url=url,
+            destination=trio.Path(tmp_path / "file"),
+            update_period=math.inf,
+            http_application=http_application,
+            counter=counter,
+        )
+    ]
+
+    assert counter.downloaded == len(data)
+    assert counter.total == content_length
+    assert progresses[0].first
+    assert progresses[-1].downloaded == len(data)
+    assert len(progresses) <= 2
+
+
+async def test_main_headless(
+    chunked_data: typing.List[bytes],
+    http_application: quart_trio.QuartTrio,
+    url: hyperlink.URL,
+    tmp_path: pathlib.Path,
+) -> None:
+    """The downloader runs to completion with scripted headless dialogs."""
+    data = b"".join(chunked_data)
+    destination = tmp_path / "file"
+
+    responder = qtrio.dialogs.scripted_responder(
+        [url.to_text(), os.fspath(destination), None]
+    )
+
+    with qtrio.dialogs.use_headless_backend(responder=responder):
+        async with trio.open_nursery() as nursery:
+            start = functools.partial(
+                qtrio.examples.download.start_downloader,
+                fps=10,
+                http_application=http_application,
+            )
+            await nursery.start(start)
+
+    assert destination.read_bytes() == data
+
+
+ranged_data = bytes(random_generator.randrange(256) for _ in range(1_000))
+
+
+@pytest.fixture(name="ranged_http_application")
+def ranged_http_application_fixture():
+    application = quart_trio.QuartTrio(__name__)
+    application.config["ranges"] = []
+
+    @application.route("/", methods=["GET", "HEAD"])
+    async def root():
+        headers = {"accept-ranges": "bytes"}
+
+        if quart.request.method == "HEAD":
+            headers["content-length"] = str(len(ranged_data))
+            return b"", 200, headers
+
+        raw_range = quart.request.headers.get("range")
+        if raw_range is None:
+            return ranged_data, 200, headers
+
+        first, last = (int(s) for s in raw_range[len("bytes=") :].split("-"))
+        application.config["ranges"].append((first, last))
+        headers["content-range"] = f"bytes {first}-{last}/{len(ranged_data)}"
+
+        return ranged_data[first : last + 1], 206, headers
+
+    return application
+
+
+async def test_get_ranges(
+    ranged_http_application: quart_trio.QuartTrio,
+    tmp_path: pathlib.Path,
+) -> None:
+    """With several connections the download is split into range requests."""
+    destination = trio.Path(tmp_path / "file")
+
+    progresses = [
+        progress
+        async for progress in qtrio.examples.download.get(
+            url=hyperlink.URL.from_text("http://test/"),
+            destination=destination,
+            update_period=0,
+            http_application=ranged_http_application,
+            connections=4,
+            minimum_part_size=100,
+        )
+    ]
+
+    assert sorted(ranged_http_application.config["ranges"]) == [
+        (0, 249),
+        (250, 499),
+        (500, 749),
+        (750, 999),
+    ]
+    assert await destination.read_bytes() == ranged_data
+    assert progresses[0].first
+    assert progresses[-1].downloaded == progresses[-1].total == len(ranged_data)
+
+
+async def test_get_ranges_updates_counter(
+    ranged_http_application: quart_trio.QuartTrio,
+    tmp_path: pathlib.Path,
+) -> None:
+    """The counter sums the progress of all parts."""
+    counter = qtrio.examples.download.ProgressCounter()
+
+    async for _ in qtrio.examples.download.get(
+        url=hyperlink.URL.from_text("http://test/"),
+        destination=trio.Path(tmp_path / "file"),
+        update_period=math.inf,
+        http_application=ranged_http_application,
+        connections=4,
+        minimum_part_size=100,
+        counter=counter,
+    ):
+        pass
+
+    assert counter.downloaded == counter.total == len(ranged_data)
+
+
+async def test_get_ranges_limited_by_part_size(
+    ranged_http_application: quart_trio.QuartTrio,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Parts are not made smaller than the minimum part size."""
+    destination = trio.Path(tmp_path / "file")
+
+    async for _ in qtrio.examples.download.get(
+        url=hyperlink.URL.from_text("http://test/"),
+        destination=destination,
+        http_application=ranged_http_application,
+        connections=4,
+        minimum_part_size=400,
+    ):
+        pass
+
+    assert sorted(ranged_http_application.config["ranges"]) == [(0, 499), (500, 999)]
+    assert await destination.read_bytes() == ranged_data
+
+
+async def test_get_ranges_falls_back_to_one_stream(
+    chunked_data: typing.List[bytes],
+    http_application: quart_trio.QuartTrio,
+    tmp_path: pathlib.Path,
+) -> None:
+    """A single stream is used when the server does not support ranges."""
+    destination = trio.Path(tmp_path / "file")
+
+    async for _ in qtrio.examples.download.get(
+        url=hyperlink.URL.from_text("http://test/"),
+        destination=destination,
+        http_application=http_application,
+        connections=4,
+        minimum_part_size=1,
+    ):
+        pass
+
+    assert await destination.read_bytes() == b"".join(chunked_data)
+
+
+async def test_get_range_not_satisfied_raises(tmp_path: pathlib.Path) -> None:
+    """A server ignoring a range request results in an error."""
+    application = quart_trio.QuartTrio(__name__)
+
+    @application.route("/", methods=["GET", "HEAD"])
+    async def root():
+        headers = {"accept-ranges": "bytes"}
+        if quart.request.method == "HEAD":
+            headers["content-length"] = str(len(ranged_data))
+            return b"", 200, headers
+
+        # only the first part is served as requested
+        if quart.request.headers["range"] == "bytes=0-499":
+            return ranged_data[:500], 206, headers
+
+        return ranged_data, 200, headers
+
+    with pytest.raises(qtrio.examples.download.RangeNotSatisfiedError):
+        async for _ in qtrio.examples.download.get(
+            url=hyperlink.URL.from_text("http://test/"),
+            destination=trio.Path(tmp_path / "file"),
+            http_application=application,
+            connections=2,
+            minimum_part_size=100,
+        ):
+            pass
+
+
+@attr.s(auto_attribs=True)
+class ResumableHttpApplication:
+    """An ASGI application serving ``ranged_data`` with If-Range support."""
+
+    ranges: typing.List[typing.Optional[str]] = attr.ib(factory=list)
+
+    async def __call__(
+        self,
+        scope: typing.Dict[str, typing.Any],
+        receive: typing.Callable[[], typing.Awaitable[typing.Dict[str, typing.Any]]],
+        send: typing.Callable[[typing.Dict[str, typing.Any]], typing.Awaitable[None]],
+    ) -> None:
+        headers = dict(scope["headers"])
+        raw_range = headers.get(b"range")
+        self.ranges.append(None if raw_range is None else raw_range.decode())
+
+        first = 0
+        status = 200
+        if raw_range is not None and headers.get(b"if-range") == b'"abc"':
+            first = int(raw_range[len(b"bytes=") : -len(b"-")])
+            status = 206
+
+            if first >= len(ranged_data):
+                await send({"type": "http.response.start", "status": 416})
+                await send({"type": "http.response.body"})
+                return
+
+        data = ranged_data[first:]
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"etag", b'"abc"'),
+                    (b"content-length", str(len(data)).encode()),
+                ],
+            }
+        )
+
+        for start in range(0, len(data), 100):
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": data[start : start + 100],
+                    "more_body": True,
+                }
+            )
+
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+@pytest.fixture(name="resumable_http_application")
+def resumable_http_application_fixture():
+    return ResumableHttpApplication()
+
+
+async def test_get_resumes_from_checkpoint(
+    resumable_http_application: ResumableHttpApplication,
+    tmp_path: pathlib.Path,
+) -> None:
+    """A checkpointed partial download is continued with a range request."""
+    destination = trio.Path(tmp_path / "file")
+    await destination.write_bytes(ranged_data[:300] + b"unsynced")
+    await qtrio.examples.download.checkpoint_path(destination).write_text(
+        '{"offset": 300, "etag": "\\"abc\\""}'
+    )
+
+    progresses = [
+        progress
+        async for progress in qtrio.examples.download.get(
+            url=hyperlink.URL.from_text("http://test/"),
+            destination=destination,
+            http_application=resumable_http_application,
+        )
+    ]
+
+    assert resumable_http_application.ranges == ["bytes=300-"]
+    assert progresses[0].downloaded == 300
+    assert progresses[-1].downloaded == progresses[-1].total == len(ranged_data)
+    assert await destination.read_bytes() == ranged_data
+    assert not await qtrio.examples.download.checkpoint_path(destination).exists()
+
+
+async def test_get_restarts_on_etag_mismatch(
+    resumable_http_application: ResumableHttpApplication,
+    tmp_path: pathlib.Path,
+) -> None:
+    """A checkpoint for a different version of the resource is not resumed."""
+    destination = trio.Path(tmp_path / "file")
+    await destination.write_bytes(b"x" * 300)
+    await qtrio.examples.download.checkpoint_path(destination).write_text(
+        '{"offset": 300, "etag": "\\"old\\""}'
+    )
+
+    async for _ in qtrio.examples.download.get(
+        url=hyperlink.URL.from_text("http://test/"),
+        destination=destination,
+        http_application=resumable_http_application,
+    ):
+        pass
+
+    assert await destination.read_bytes() == ranged_data
+
+
+async def test_get_checkpoints_when_cancelled(
+    resumable_http_application: ResumableHttpApplication,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Cancelling a download checkpoints what was written so it can be resumed."""
+    destination = trio.Path(tmp_path / "file")
+
+    with trio.CancelScope() as cancel_scope:
+        async for progress in qtrio.examples.download.get(
+            url=hyperlink.URL.from_text("http://test/"),
+            destination=destination,
+            update_period=-1,
+            http_application=resumable_http_application,
+        ):
+            if not progress.first:
+                cancel_scope.cancel()
+
+    checkpoint_path = qtrio.examples.download.checkpoint_path(destination)
+    checkpoint = json.loads(await checkpoint_path.read_text())
+    assert checkpoint == {"offset": len(ranged_data), "etag": '"abc"'}
+    assert await destination.read_bytes() == ranged_data
+
+    async for _ in qtrio.examples.download.get(
+        url=hyperlink.URL.from_text("http://test/"),
+        destination=destination,
+        http_application=resumable_http_application,
+    ):
+        pass
+
+    # the already complete download is not satisfiable so it is restarted
+    assert resumable_http_application.ranges == [
+        None,
+        f"bytes={len(ranged_data)}-",
+        None,
+    ]
+    assert await destination.read_bytes() == ranged_data
+    assert not await checkpoint_path.exists()
+
+
+@attr.s(auto_attribs=True)
+class RecordingHttpApplication:
+    """An ASGI application recording the requested paths and the concurrency per
+    host.
+    """
+
+    paths: typing.List[str] = attr.ib(factory=list)
+    active: typing.Dict[bytes, int] = attr.ib(factory=dict)
+    maximum_active: typing.Dict[bytes, int] = attr.ib(factory=dict)
+
+    async def __call__(
+        self,
+        scope: typing.Dict[str, typing.Any],
+        receive: typing.Callable[[], typing.Awaitable[typing.Dict[str, typing.Any]]],
+        send: typing.Callable[[typing.Dict[str, typing.Any]], typing.Awaitable[None]],
+    ) -> None:
+        host = dict(scope["headers"])[b"host"]
+        self.paths.append(scope["path"])
+
+        self.active[host] = self.active.get(host, 0) + 1
+        self.maximum_active[host] = max(
+            self.maximum_active.get(host, 0), self.active[host]
+        )
+        try:
+            await trio.sleep(0.01)
+        finally:
+            self.active[host] -= 1
+
+        if scope["path"] == "/missing":
+            await send({"type": "http.response.start", "status": 404})
+            await send({"type": "http.response.body"})
+            raise Exception("missing")
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-length", str(len(ranged_data)).encode())],
+            }
+        )
+        await send({"type": "http.response.body", "body": ranged_data})
+
+
+async def test_download_manager_downloads_jobs(tmp_path: pathlib.Path) -> None:
+    """Queued jobs are all downloaded and the aggregate progress is emitted."""
+    application = RecordingHttpApplication()
+    aggregates: typing.List[qtrio.examples.download.AggregateProgress] = []
+
+    async with qtrio.examples.download.open_download_manager(
+        http_application=application
+    ) as manager:
+        manager.progress_changed.connect(aggregates.append)
+
+        jobs = [
+            manager.submit(
+                url=hyperlink.URL.from_text(f"http://test/{index}"),
+                destination=trio.Path(tmp_path / str(index)),
+            )
+            for index in range(5)
+        ]
+
+        await manager.join()
+
+    for job in jobs:
+        assert await job.destination.read_bytes() == ranged_data
+
+    assert aggregates[-1] == qtrio.examples.download.AggregateProgress(
+        downloaded=5 * len(ranged_data),
+        total=5 * len(ranged_data),
+        completed=5,
+        count=5,
+    )
+
+
+async def test_download_manager_starts_higher_priority_first(
+    tmp_path: pathlib.Path,
+) -> None:
+    """Queued jobs are started in order of priority then submission."""
+    application = RecordingHttpApplication()
+
+    async with qtrio.examples.download.open_download_manager(
+        http_application=application, max_connections=1
+    ) as manager:
+        for index, priority in enumerate([0, 2, 1, 2]):
+            manager.submit(
+                url=hyperlink.URL.from_text(f"http://test/{index}"),
+                destination=trio.Path(tmp_path / str(index)),
+                priority=priority,
+            )
+
+        await manager.join()
+
+    assert application.paths == ["/1", "/3", "/2", "/0"]
+
+
+async def test_download_manager_limits_per_host(tmp_path: pathlib.Path) -> None:
+    """Concurrent downloads from each host are limited separately."""
+    application = RecordingHttpApplication()
+
+    async with qtrio.examples.download.open_download_manager(
+        http_application=application, max_connections_per_host=2
+    ) as manager:
+        for index in range(6):
+            for host in ["a", "b"]:
+                manager.submit(
+                    url=hyperlink.URL.from_text(f"http://{host}/{index}"),
+                    destination=trio.Path(tmp_path / f"{host}{index}"),
+                )
+
+        await manager.join()
+
+    assert application.maximum_active == {b"a": 2, b"b": 2}
+
+
+async def test_download_manager_records_job_errors(tmp_path: pathlib.Path) -> None:
+    """A failed download is reported by its job without stopping the others."""
+    application = RecordingHttpApplication()
+
+    async with qtrio.examples.download.open_download_manager(
+        http_application=application
+    ) as manager:
+        failing = manager.submit(
+            url=hyperlink.URL.from_text("http://test/missing"),
+            destination=trio.Path(tmp_path / "missing"),
+        )
+        succeeding = manager.submit(
+            url=hyperlink.URL.from_text("http://test/present"),
+            destination=trio.Path(tmp_path / "present"),
+        )
+
+        with pytest.raises(Exception, match="missing"):
+            await failing.wait()
+
+        progress = await succeeding.wait()
+
+    assert progress is not None
+    assert progress.downloaded == len(ranged_data)
+
+
+async def test_pooling_benchmark() -> None:
+    """The pooling benchmark runs and reports both rates."""
+    result = await qtrio._tests.examples.download_benchmark.measure_pooling(
+        count=4, size=100, concurrency=2
+    )
+
+    assert result.per_download_client > 0
+    assert result.pooled_client > 0
+
+
+@pytest.mark.parametrize(argnames=["headless"], argvalues=[[True], [False]])
+async def test_throughput_benchmark(headless: bool) -> None:
+    """The throughput benchmark runs and reports its measurements."""
+    [result] = await qtrio._tests.examples.download_benchmark.measure_throughputs(
+        size=100_000, chunk_sizes=[16_384], fpss=[60], headlesses=[headless]
+    )
+
+    assert result.headless == headless
+    assert result.chunk_size == 16_384
+    assert result.bytes_per_second > 0
+    assert result.cpu_seconds >= 0
+    assert result.peak_memory >= 100_000
+
+
+def test_read_manifest() -> None:
+    """Manifest lines are split into URLs and destinations, skipping comments and
+    blank lines.
+    """
+    lines = [
+        "# assets\n",
+        "http://test/a a.bin\n",
+        "\n",
+        "  http://test/b   with spaces/b.bin  \n",
+    ]
+
+    entries = qtrio.examples.download.read_manifest(lines)
+
+    assert entries == [
+        qtrio.examples.download.ManifestEntry(
+            url=hyperlink.URL.from_text("http://test/a"),
+            destination=trio.Path("a.bin"),
+        ),
+        qtrio.examples.download.ManifestEntry(
+            url=hyperlink.URL.from_text("http://test/b"),
+            destination=trio.Path("with spaces/b.bin"),
+        ),
+    ]
+
+
+def test_read_manifest_raises_for_missing_destination() -> None:
+    """A manifest line without a destination raises with the line number."""
+    with pytest.raises(qtrio.examples.download.ManifestError, match="Line 2"):
+        qtrio.examples.download.read_manifest(["http://test/a a", "http://test/b"])
+
+
+@pytest.mark.parametrize(argnames=["headless"], argvalues=[[True], [False]])
+async def test_batch_downloader_summarizes(
+    tmp_path: pathlib.Path, headless: bool
+) -> None:
+    """Batch downloads are summarized including failures, without raising."""
+    application = RecordingHttpApplication()
+    entries = [
+        qtrio.examples.download.ManifestEntry(
+            url=hyperlink.URL.from_text(f"http://test/{name}"),
+            destination=trio.Path(tmp_path / name),
+        )
+        for name in ["a", "missing", "b"]
+    ]
+
+    with contextlib.ExitStack() as stack:
+        if headless:
+            stack.enter_context(
+                qtrio.dialogs.use_headless_backend(
+                    responder=qtrio.dialogs.scripted_responder([])
+                )
+            )
+
+        summary = await qtrio.examples.download.start_batch_downloader(
+            entries=entries, max_connections=2, http_application=application
+        )
+
+    assert summary is not None
+    assert [result.url for result in summary.results] == [
+        "http://test/a",
+        "http://test/missing",
+        "http://test/b",
+    ]
+    assert [result.error is None for result in summary.results] == [
+        True,
+        False,
+        True,
+    ]
+    assert summary.downloaded == 2 * len(ranged_data)
+    assert summary.failures == [summary.results[1]]
+    assert await entries[0].destination.read_bytes() == ranged_data
+    assert await entries[2].destination.read_bytes() == ranged_data
+
+    data = json.loads(json.dumps(summary.to_dict()))
+    assert data["downloaded"] == 2 * len(ranged_data)
+    assert data["failures"] == 1
+    assert data["results"][0]["downloaded"] == len(ranged_data)
+    assert data["results"][0]["destination"] == os.fspath(tmp_path / "a")
+    assert set(data["results"][0]) == {
+        "url",
+        "destination",
+        "downloaded",
+        "duration",
+        "error",
+        "bytes_per_second",
+    }
+
+
+def test_batch_progress_weights_jobs_equally() -> None:
+    """Each job of a batch counts equally toward the progress regardless of size."""
+    url = hyperlink.URL.from_text("http://test/")
+    done = qtrio.examples.download.DownloadJob(url=url, destination=trio.Path("a"))
+    done.done_event.set()
+    half = qtrio.examples.download.DownloadJob(
+        url=url,
+        destination=trio.Path("b"),
+        progress=qtrio.examples.download.Progress(
+            downloaded=500, first=False, total=1000
+        ),
+    )
+    unknown = qtrio.examples.download.DownloadJob(
+        url=url,
+        destination=trio.Path("c"),
+        progress=qtrio.examples.download.Progress(downloaded=500, first=False),
+    )
+
+    value = qtrio.examples.download._batch_progress_value(jobs=[done, half, unknown])
+
+    assert value == 1.5 * qtrio.examples.download.batch_progress_resolution
+
+
+async def test_cli_batch_writes_summary(tmp_path: pathlib.Path) -> None:
+    """The CLI batch mode downloads the manifest entries and writes a JSON summary to
+    stdout, exiting with an error if any failed.
+    """
+    async with trio.open_nursery() as nursery:
+        base_url = await nursery.start(
+            qtrio._tests.examples.download_benchmark.serve_payload, b"abc" * 1000
+        )
+
+        manifest = tmp_path / "manifest"
+        manifest.write_text(
+            "\n".join(
+                [
+                    f"{base_url.child('a').to_text()} {tmp_path / 'a'}",
+                    f"http://127.0.0.1:1/b {tmp_path / 'b'}",
+                ]
+            )
+        )
+
+        completed = await trio.run_process(
+            [
+                sys.executable,
+                "-m",
+                "qtrio",
+                "examples",
+                "download",
+                "--manifest",
+                "-",
+            ],
+            stdin=manifest.read_bytes(),
+            capture_stdout=True,
+            check=False,
+        )
+
+        nursery.cancel_scope.cancel()
+
+    summary = json.loads(completed.stdout)
+
+    assert completed.returncode == 1
+    assert summary["downloaded"] == 3000
+    assert summary["failures"] == 1
+    assert [result["error"] is None for result in summary["results"]] == [True, False]
+    assert (tmp_path / "a").read_bytes() == b"abc" * 1000
+
+
+class RecordingFile(io.BytesIO):
+    """Record the sizes written, optionally blocking each write until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.sizes: typing.List[int] = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def write(self, data) -> int:  # type: ignore[no-untyped-def]
+        self.release.wait()
+        self.sizes.append(len(data))
+        return super().write(data)
+
+
+@pytest.mark.parametrize(argnames=["position"], argvalues=[[0], [5]])
+async def test_batched_writer_writes_aligned_blocks(position: int) -> None:
+    """Chunks are collected into blocks aligned to the file position."""
+    file = RecordingFile()
+    file.write(b"x" * position)
+    file.sizes.clear()
+
+    writer = qtrio.examples.download.BatchedWriter(
+        file=file, position=position, block_size=10
+    )
+    writer.start()
+
+    try:
+        for index in range(12):
+            await writer.write(bytes([index]) * 3)
+
+        await writer.flush()
+    finally:
+        await writer.stop()
+
+    expected_data = b"".join(bytes([index]) * 3 for index in range(12))
+    assert file.getvalue() == b"x" * position + expected_data
+    assert writer.position == position + len(expected_data)
+    assert file.sizes == {0: [10, 10, 10, 6], 5: [5, 10, 10, 10, 1]}[position]
+
+
+async def test_batched_writer_waits_for_memory_budget() -> None:
+    """Writing waits while more than the memory budget is queued."""
+    file = RecordingFile()
+    file.release.clear()
+
+    writer = qtrio.examples.download.BatchedWriter(
+        file=file, block_size=10, memory_budget=20
+    )
+    writer.start()
+    written = trio.Event()
+
+    async def write() -> None:
+        for _ in range(3):
+            await writer.write(b"a" * 10)
+
+        written.set()
+
+    try:
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(write)
+
+            await trio.testing.wait_all_tasks_blocked()
+            assert not written.is_set()
+
+            file.release.set()
+
+        await writer.flush()
+    finally:
+        file.release.set()
+        await writer.stop()
+
+    assert file.getvalue() == b"a" * 30
+
+
+async def test_batched_writer_raises_write_errors() -> None:
+    """An error writing a block is raised from a later call."""
+
+    class FailingFile(io.BytesIO):
+        def write(self, data) -> int:  # type: ignore[no-untyped-def]
+            raise OSError("disk full")
+
+    writer = qtrio.examples.download.BatchedWriter(file=FailingFile())
+    writer.start()
+
+    try:
+        await writer.write(b"a")
+
+        with pytest.raises(OSError, match="disk full"):
+            await writer.flush()
+    finally:
+        await writer.stop()
+
+
+async def test_open_batched_writer_fsyncs_on_close(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The file is synced to disk on close when requested."""
+    path = trio.Path(tmp_path / "file")
+    await path.write_bytes(b"abc")
+    synced: typing.List[int] = []
+
+    monkeypatch.setattr(os, "fsync", synced.append)
+
+    async with qtrio.examples.download.open_batched_writer(
+        path=path, fsync_on_close=True
+    ) as writer:
+        await writer.write(b"def")
+
+    assert len(synced) == 1
+    assert await path.read_bytes() == b"abcdef"
+
+
+@pytest.mark.parametrize(argnames=["connections"], argvalues=[[1], [4]])
+async def test_get_preallocated(
+    ranged_http_application: quart_trio.QuartTrio,
+    tmp_path: pathlib.Path,
+    connections: int,
+) -> None:
+    """Preallocated downloads write through a memory mapping, with or without
+    ranges.
+    """
+    destination = trio.Path(tmp_path / "file")
+    await destination.write_bytes(b"x" * 2 * len(ranged_data))
+
+    async for _ in qtrio.examples.download.get(
+        url=hyperlink.URL.from_text("http://test/"),
+        destination=destination,
+        http_application=ranged_http_application,
+        connections=connections,
+        minimum_part_size=100,
+        preallocate=True,
+    ):
+        pass
+
+    assert await destination.read_bytes() == ranged_data
+
+
+async def test_get_preallocated_resumes_from_checkpoint(
+    resumable_http_application: ResumableHttpApplication,
+    tmp_path: pathlib.Path,
+) -> None:
+    """A preallocated download resumes at the checkpointed position."""
+    destination = trio.Path(tmp_path / "file")
+    await destination.write_bytes(ranged_data[:300])
+    await qtrio.examples.download.checkpoint_path(destination).write_text(
+        '{"offset": 300, "etag": "\\"abc\\""}'
+    )
+
+    async for _ in qtrio.examples.download.get(
+        url=hyperlink.URL.from_text("http://test/"),
+        destination=destination,
+        http_application=resumable_http_application,
+        preallocate=True,
+    ):
+        pass
+
+    assert resumable_http_application.ranges == ["bytes=300-"]
+    assert await destination.read_bytes() == ranged_data
+
+
+async def test_open_mapped_file_allocates(tmp_path: pathlib.Path) -> None:
+    """The mapped file is resized and, where supported, allocated."""
+    path = trio.Path(tmp_path / "file")
+    await path.write_bytes(b"abc")
+
+    async with qtrio.examples.download.open_mapped_file(
+        path=path, size=100_000
+    ) as mapping:
+        writer = qtrio.examples.download.MappedWriter(mapping=mapping, position=3)
+        await writer.write(b"def")
+        await writer.flush(fsync=True)
+
+    stat = await path.stat()
+    assert stat.st_size == 100_000
+    if hasattr(os, "posix_fallocate"):
+        assert stat.st_blocks * 512 >= 100_000
+
+    assert (await path.read_bytes())[:7] == b"abcdef\0"
+
+
+async def test_mapped_writer_raises_past_end(tmp_path: pathlib.Path) -> None:
+    """Writing past the end of the mapping raises."""
+    path = trio.Path(tmp_path / "file")
+    await path.touch()
+
+    async with qtrio.examples.download.open_mapped_file(path=path, size=10) as mapping:
+        writer = qtrio.examples.download.MappedWriter(mapping=mapping, position=8)
+
+        with pytest.raises(ValueError):
+            await writer.write(b"abc")
+
+
+def test_import_leaves_httpcore_read_size_alone() -> None:
+    """Importing the example does not retune other HTTP clients in the process."""
+    code = """
+import httpcore._async.http11
+
+before = httpcore._async.http11.AsyncHTTP11Connection.READ_NUM_BYTES
+import qtrio.examples.download
+after = httpcore._async.http11.AsyncHTTP11Connection.READ_NUM_BYTES
+
+assert before == after, (before, after)
+"""
+
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_chunk_sizer_follows_throughput() -> None:
+    """The chunk size follows the smoothed throughput within the bounds."""
+    sizer = qtrio.examples.download.ChunkSizer(minimum=100, maximum=10_000, period=0.1)
+    assert sizer.size == 100
+
+    sizer.observe(count=1_000, duration=0.1)
+    assert sizer.size == 1_000
+
+    sizer.observe(count=3_000, duration=0.1)
+    assert sizer.size == 2_000
+
+    sizer.observe(count=1_000_000, duration=0.1)
+    assert sizer.size == 10_000
+
+
+def test_chunk_sizer_keeps_minimum_when_slow() -> None:
+    """The chunk size does not drop below the minimum."""
+    sizer = qtrio.examples.download.ChunkSizer(minimum=100, maximum=10_000)
+
+    sizer.observe(count=100, duration=10)
+    assert sizer.size == 100
+
+
+def test_chunk_sizer_grows_when_unmeasurably_fast() -> None:
+    """The chunk size doubles when no time passes receiving a chunk."""
+    sizer = qtrio.examples.download.ChunkSizer(minimum=100, maximum=300)
+
+    sizer.observe(count=100, duration=0)
+    assert sizer.size == 200
+
+    sizer.observe(count=200, duration=0)
+    assert sizer.size == 300
+
+
+async def test_sized_chunks_collects_to_the_chunk_size() -> None:
+    """Small received chunks are combined and large ones are passed on as is."""
+    sizer = qtrio.examples.download.ChunkSizer(minimum=10, maximum=10)
+    raw_chunks = [b"a" * 4, b"b" * 4, b"c" * 4, b"d" * 25, b"e" * 3]
+
+    chunks = [
+        chunk
+        async for chunk in qtrio.examples.download._sized_chunks(
+            raw_chunks=asynchronize(raw_chunks), sizer=sizer, clock=lambda: 0
+        )
+    ]
+
+    assert chunks == [b"a" * 4 + b"b" * 4 + b"c" * 4, b"d" * 25, b"e" * 3]
+
+
+ranged_digests = {
+    "sha256": hashlib.sha256(ranged_data).hexdigest(),
+    "blake2b": hashlib.blake2b(ranged_data).hexdigest(),
+}
+
+
+@pytest.mark.parametrize(argnames=["connections"], argvalues=[[1], [4]])
+async def test_get_hashes_while_downloading(
+    ranged_http_application: quart_trio.QuartTrio,
+    tmp_path: pathlib.Path,
+    connections: int,
+) -> None:
+    """The final progress reports the digests of the downloaded data."""
+    progresses = [
+        progress
+        async for progress in qtrio.examples.download.get(
+            url=hyperlink.URL.from_text("http://test/"),
+            destination=trio.Path(tmp_path / "file"),
+            http_application=ranged_http_application,
+            connections=connections,
+            minimum_part_size=100,
+            hash_names=["sha256", "blake2b"],
+        )
+    ]
+
+    assert all(progress.digests is None for progress in progresses[:-1])
+    assert progresses[-1].digests == ranged_digests
+    assert progresses[-1].verified is None
+
+
+@pytest.mark.parametrize(
+    argnames=["expected", "verified"],
+    argvalues=[
+        [ranged_digests["sha256"].upper(), True],
+        ["0" * 64, False],
+    ],
+    ids=["matching", "mismatched"],
+)
+async def test_get_verifies_expected_digests(
+    ranged_http_application: quart_trio.QuartTrio,
+    tmp_path: pathlib.Path,
+    expected: str,
+    verified: bool,
+) -> None:
+    """The final progress reports whether the expected digests matched."""
+    async for progress in qtrio.examples.download.get(
+        url=hyperlink.URL.from_text("http://test/"),
+        destination=trio.Path(tmp_path / "file"),
+        http_application=ranged_http_application,
+        expected_digests={"sha256": expected},
+    ):
+        pass
+
+    assert progress.digests == {"sha256": ranged_digests["sha256"]}
+    assert progress.verified is verified
+
+
+async def test_get_hashes_resumed_download(
+    resumable_http_application: ResumableHttpApplication,
+    tmp_path: pathlib.Path,
+) -> None:
+    """The already downloaded part of a resumed download is included in the digest."""
+    destination = trio.Path(tmp_path / "file")
+    await destination.write_bytes(ranged_data[:300])
+    await qtrio.examples.download.checkpoint_path(destination).write_text(
+        '{"offset": 300, "etag": "\\"abc\\""}'
+    )
+
+    async for progress in qtrio.examples.download.get(
+        url=hyperlink.URL.from_text("http://test/"),
+        destination=destination,
+        http_application=resumable_http_application,
+        expected_digests={"blake2b": ranged_digests["blake2b"]},
+    ):
+        pass
+
+    assert resumable_http_application.ranges == ["bytes=300-"]
+    assert progress.verified
+
+
+async def test_token_bucket_allows_burst_then_limits(
+    autojump_clock: trio.testing.MockClock,
+) -> None:
+    """A full bucket passes a burst at once and then limits to the rate."""
+    bucket = qtrio.examples.download.TokenBucket(rate=100)
+    start = trio.current_time()
+
+    await bucket.consume(100)
+    assert trio.current_time() == start
+
+    await bucket.consume(300)
+    assert trio.current_time() - start == pytest.approx(3)
+
+
+async def test_token_bucket_is_shared(
+    autojump_clock: trio.testing.MockClock,
+) -> None:
+    """Concurrent consumers share the rate."""
+    bucket = qtrio.examples.download.TokenBucket(rate=100, burst=0)
+    start = trio.current_time()
+
+    async def consume() -> None:
+        for _ in range(5):
+            await bucket.consume(20)
+
+    async with trio.open_nursery() as nursery:
+        for _ in range(4):
+            nursery.start_soon(consume)
+
+    assert trio.current_time() - start == pytest.approx(4)
+
+
+async def test_token_bucket_rate_change_applies_to_waiting(
+    autojump_clock: trio.testing.MockClock,
+) -> None:
+    """Changing the rate recalculates the wait of waiting consumers."""
+    bucket = qtrio.examples.download.TokenBucket(rate=0, burst=0)
+    start = trio.current_time()
+
+    async with trio.open_nursery() as nursery:
+        nursery.start_soon(bucket.consume, 100)
+
+        await trio.sleep(10)
+        bucket.set_rate(50)
+
+    assert trio.current_time() - start == pytest.approx(12)
+
+    bucket.set_rate(math.inf)
+    await bucket.consume(1_000_000)
+    assert trio.current_time() - start == pytest.approx(12)
+
+
+async def test_get_rate_limited(
+    autojump_clock: trio.testing.MockClock,
+    resumable_http_application: ResumableHttpApplication,
+    tmp_path: pathlib.Path,
+) -> None:
+    """A download through a token bucket takes as long as the rate requires."""
+    bucket = qtrio.examples.download.TokenBucket(rate=250, burst=0)
+    start = trio.current_time()
+
+    async for _ in qtrio.examples.download.get(
+        url=hyperlink.URL.from_text("http://test/"),
+        destination=trio.Path(tmp_path / "file"),
+        clock=trio.current_time,
+        http_application=resumable_http_application,
+        chunk_sizer=qtrio.examples.download.ChunkSizer(minimum=100, maximum=100),
+        rate_limiter=bucket,
+    ):
+        pass
+
+    assert trio.current_time() - start == pytest.approx(4)
+    assert await trio.Path(tmp_path / "file").read_bytes() == ranged_data
@@ -2,6 +2,8 @@ import pytest
 from qts import QtWidgets
 import trio
 
+import qtrio._core
+
 
 @pytest.fixture(name="qtrio_preshow_workaround", scope="session", autouse=True)
 def qtrio_preshow_workaround_fixture(qapp):
@@ -28,6 +30,22 @@ def qtrio_testdir_fixture(testdir):
     return testdir
 
 
+@pytest.fixture(name="isolated_event_type")
+def isolated_event_type_fixture():
+    """Run the test in this process as if no reenter event type had been registered,
+    restoring the prior registration afterwards.  Qt can not unregister event types so
+    each registration within the test uses up one of the limited types.  Tests which
+    use them all up must still run in a subprocess.
+    """
+    original = qtrio._core._reenter_event_type
+    qtrio._core._reenter_event_type = None
+
+    try:
+        yield
+    finally:
+        qtrio._core._reenter_event_type = original
+
+
 @pytest.fixture(
     name="optional_hold_event",
     params=[lambda: None, trio.Event],
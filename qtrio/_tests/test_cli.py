@@ -27,3 +27,27 @@ def test_emissions_help_dash_m():
     subprocess.run(
         [sys.executable, "-m", "qtrio", "examples", "emissions", "--help"], check=True
     )
+
+
+def test_download_manifest_excludes_url(tmp_path):
+    """Passing both a manifest and a URL is a usage error."""
+    manifest = tmp_path / "manifest"
+    manifest.write_text("")
+
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "qtrio",
+            "examples",
+            "download",
+            "--manifest",
+            os.fspath(manifest),
+            "--url",
+            "http://test/",
+        ],
+        stderr=subprocess.PIPE,
+    )
+
+    assert completed.returncode == 2
+    assert b"--manifest can not be combined" in completed.stderr
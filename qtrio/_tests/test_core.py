@@ -1,3 +1,4 @@
+import math
 import os
 import sys
 import threading
@@ -25,7 +26,7 @@ def emissions_channel_fixture(request):
     return request.param
 
 
-def test_reenter_event_triggers_in_main_thread(qapp):
+def test_reenter_event_triggers_in_main_thread(qapp, isolated_event_type):
     """Reenter events posted in another thread result in the function being run in the
     main thread.
     """
@@ -55,24 +56,14 @@ def test_reenter_event_triggers_in_main_thread(qapp):
 timeout = 40
 
 
-def test_reenter_event_raises_if_type_not_registered(testdir):
-    test_file = r"""
-    import pytest
-
-    import qtrio
+def test_reenter_event_raises_if_type_not_registered(isolated_event_type):
     import qtrio.qt
 
-    def test():
-        with pytest.raises(
-            qtrio.InternalError,
-            match="reenter event type must be registered",
-        ):
-            qtrio.qt.ReenterEvent(fn=lambda: None)
-    """
-    testdir.makepyfile(test_file)
-
-    result = testdir.runpytest_subprocess(timeout=timeout)
-    result.assert_outcomes(passed=1)
+    with pytest.raises(
+        qtrio.InternalError,
+        match="reenter event type must be registered",
+    ):
+        qtrio.qt.ReenterEvent(fn=lambda: None)
 
 
 # TODO: debug further
@@ -113,51 +104,29 @@ def test_reenter_event_writes_to_stderr_for_exception(capsys, testdir):
     )
 
 
-def test_run_returns_value(testdir):
+def test_run_returns_value():
     """:func:`qtrio.run()` returns the result of the passed async function."""
 
-    test_file = r"""
-    import outcome
-
-    import qtrio
+    async def main():
+        return 29
 
-    def test():
-        async def main():
-            return 29
+    result = qtrio.run(main)
 
-        result = qtrio.run(main)
+    assert result == 29
 
-        assert result == 29
-    """
-    testdir.makepyfile(test_file)
 
-    result = testdir.runpytest_subprocess(timeout=timeout)
-    result.assert_outcomes(passed=1)
-
-
-def test_run_passes_args(testdir):
+def test_run_passes_args():
     """:func:`qtrio.run()` passes *args to async function."""
 
-    test_file = r"""
-    import outcome
-
-    import qtrio
+    result = []
 
-    def test():
-        result = []
+    async def main(arg1, arg2):
+        result.append(arg1)
+        result.append(arg2)
 
-        async def main(arg1, arg2):
-            result.append(arg1)
-            result.append(arg2)
+    qtrio.run(main, 27, 32)
 
-        qtrio.run(main, 27, 32)
-
-        assert result == [27, 32]
-    """
-    testdir.makepyfile(test_file)
-
-    result = testdir.runpytest_subprocess(timeout=timeout)
-    result.assert_outcomes(passed=1)
+    assert result == [27, 32]
 
 
 def test_qt_last_window_closed_does_not_quit_qt_or_cancel_trio(testdir):
@@ -233,136 +202,75 @@ def test_qt_quit_cancels_trio_with_custom_application(testdir):
     result.assert_outcomes(passed=1)
 
 
-def test_run_passes_internal_too_slow_error(testdir):
+def test_run_passes_internal_too_slow_error():
     """The async function run by :func:`qtrio.run` is executed in the Qt host thread."""
 
-    test_file = r"""
-    import math
-    import pytest
-
-    import qtrio
-    import trio
-
-
-    def test():
-        async def main():
-            with trio.fail_after(0):
-                await trio.sleep(math.inf)
-
-        with pytest.raises(trio.TooSlowError):
-            qtrio.run(main)
-    """
-    testdir.makepyfile(test_file)
+    async def main():
+        with trio.fail_after(0):
+            await trio.sleep(math.inf)
 
-    result = testdir.runpytest_subprocess(timeout=timeout)
-    result.assert_outcomes(passed=1)
+    with pytest.raises(trio.TooSlowError):
+        qtrio.run(main)
 
 
-def test_run_runs_in_main_thread(testdir):
+def test_run_runs_in_main_thread():
     """The async function run by :func:`qtrio.run` is executed in the Qt host thread."""
 
-    test_file = r"""
-    import threading
-
-    import qtrio
-
-
-    def test():
-        async def main():
-            return threading.get_ident()
-
-        result = qtrio.run(main)
+    async def main():
+        return threading.get_ident()
 
-        assert result == threading.get_ident()
-    """
-    testdir.makepyfile(test_file)
+    result = qtrio.run(main)
 
-    result = testdir.runpytest_subprocess(timeout=timeout)
-    result.assert_outcomes(passed=1)
+    assert result == threading.get_ident()
 
 
-def test_runner_runs_in_main_thread(testdir):
+def test_runner_runs_in_main_thread():
     """A directly used :class:`qtrio.Runner` runs the async function in the Qt host
     thread.
     """
-    test_file = r"""
-    import threading
-
-    import qtrio
-
 
-    def test():
-        async def main():
-            return threading.get_ident()
+    async def main():
+        return threading.get_ident()
 
-        runner = qtrio.Runner()
-        outcomes = runner.run(main)
+    runner = qtrio.Runner()
+    outcomes = runner.run(main)
 
-        assert outcomes.trio.unwrap() == threading.get_ident()
-    """
-    testdir.makepyfile(test_file)
-
-    result = testdir.runpytest_subprocess(timeout=timeout)
-    result.assert_outcomes(passed=1)
+    assert outcomes.trio == outcome.Value(threading.get_ident())
 
 
-def test_done_callback_runs_in_main_thread(testdir):
+def test_done_callback_runs_in_main_thread():
     """The done callback run by the Trio guest when finished is run in the Qt host
     thread.
     """
-    test_file = r"""
-    import threading
-
-    import qtrio
-
+    result = {}
 
-    def test():
-        result = {}
+    async def main():
+        pass
 
-        async def main():
-            pass
+    def done_callback(outcomes):
+        result["thread_id"] = threading.get_ident()
 
-        def done_callback(outcomes):
-            result['thread_id'] = threading.get_ident()
+    qtrio.run(async_fn=main, done_callback=done_callback)
 
-        qtrio.run(async_fn=main, done_callback=done_callback)
+    assert result["thread_id"] == threading.get_ident()
 
-        assert result['thread_id'] == threading.get_ident()
-    """
-    testdir.makepyfile(test_file)
 
-    result = testdir.runpytest_subprocess(timeout=timeout)
-    result.assert_outcomes(passed=1)
-
-
-def test_done_callback_gets_outcomes(testdir):
+def test_done_callback_gets_outcomes():
     """The done callback is passed the outcomes with the Trio entry filled."""
-    test_file = r"""
-    import outcome
+    result = {}
 
-    import qtrio
-
-
-    def test():
-        result = {}
-
-        async def main():
-            return 93
-
-        def done_callback(outcomes):
-            result['outcomes'] = outcomes
+    async def main():
+        return 93
 
-        qtrio.run(async_fn=main, done_callback=done_callback)
+    def done_callback(outcomes):
+        result["outcomes"] = outcomes
 
-        assert result['outcomes'] == qtrio.Outcomes(
-            qt=None,
-            trio=outcome.Value(93),
-        )
-    """
-    testdir.makepyfile(test_file)
+    qtrio.run(async_fn=main, done_callback=done_callback)
 
-    result = testdir.runpytest_subprocess(timeout=timeout)
-    result.assert_outcomes(passed=1)
+    assert result["outcomes"] == qtrio.Outcomes(
+        qt=None,
+        trio=outcome.Value(93),
+    )
 
 
 def test_out_of_hints_raises(testdir):
@@ -455,42 +363,22 @@ def test_requesting_available_event_type_succeeds(testdir):
     result.assert_outcomes(passed=1)
 
 
-def test_registering_event_type_when_already_registered(testdir):
+def test_registering_event_type_when_already_registered(isolated_event_type):
     """Requesting an available event type succeeds."""
-    test_file = r"""
-    import pytest
-    import qtrio
-
+    qtrio.register_event_type()
 
-    def test():
+    with pytest.raises(qtrio.EventTypeAlreadyRegisteredError):
         qtrio.register_event_type()
 
-        with pytest.raises(qtrio.EventTypeAlreadyRegisteredError):
-            qtrio.register_event_type()
-    """
-    testdir.makepyfile(test_file)
-
-    result = testdir.runpytest_subprocess(timeout=timeout)
-    result.assert_outcomes(passed=1)
-
 
-def test_registering_requested_event_type_when_already_registered(testdir):
+def test_registering_requested_event_type_when_already_registered(
+    isolated_event_type,
+):
     """Requesting an available event type succeeds."""
-    test_file = r"""
-    import pytest
-    import qtrio
-
-
-    def test():
-        qtrio.register_event_type()
-
-        with pytest.raises(qtrio.EventTypeAlreadyRegisteredError):
-            qtrio.register_requested_event_type(qtrio.registered_event_type())
-    """
-    testdir.makepyfile(test_file)
+    qtrio.register_event_type()
 
-    result = testdir.runpytest_subprocess(timeout=timeout)
-    result.assert_outcomes(passed=1)
+    with pytest.raises(qtrio.EventTypeAlreadyRegisteredError):
+        qtrio.register_requested_event_type(qtrio.registered_event_type())
 
 
 async def test_wait_signal_waits():
@@ -1137,6 +1025,146 @@ async def test_emissions_nursery_wraps(is_async):
         result.unwrap()
 
 
+async def test_emissions_nursery_connect_in_thread_runs_in_thread():
+    """Slots connected in a thread run in a worker thread and their results are
+    delivered in the main thread.
+    """
+
+    class SignalHost(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    slot_threads = []
+    results = []
+    result_threads = []
+    event = trio.Event()
+
+    def slot(number):
+        slot_threads.append(threading.get_ident())
+        return number * 2
+
+    def result_slot(result):
+        results.append(result)
+        result_threads.append(threading.get_ident())
+        if len(results) == 3:
+            event.set()
+
+    signal_host = SignalHost()
+
+    async with qtrio.open_emissions_nursery() as emissions_nursery:
+        emissions_nursery.connect_in_thread(
+            signal=signal_host.signal,
+            slot=slot,
+            result_slot=result_slot,
+        )
+
+        for i in range(3):
+            signal_host.signal.emit(i)
+
+        await event.wait()
+
+    assert sorted(results) == [0, 2, 4]
+    assert threading.get_ident() not in slot_threads
+    assert result_threads == [threading.get_ident()] * 3
+
+
+async def test_emissions_nursery_connect_in_thread_limits():
+    """Slots connected in a thread are limited by the passed capacity limiter."""
+
+    class SignalHost(QtCore.QObject):
+        signal = QtCore.Signal()
+
+    limiter = trio.CapacityLimiter(1)
+    lock = threading.Lock()
+    running = 0
+    maximum_running = 0
+
+    def slot():
+        nonlocal running, maximum_running
+
+        with lock:
+            running += 1
+            maximum_running = max(maximum_running, running)
+
+        time.sleep(0.01)
+
+        with lock:
+            running -= 1
+
+    signal_host = SignalHost()
+
+    async with qtrio.open_emissions_nursery() as emissions_nursery:
+        emissions_nursery.connect_in_thread(
+            signal=signal_host.signal, slot=slot, limiter=limiter
+        )
+
+        for _ in range(3):
+            signal_host.signal.emit()
+
+    assert maximum_running == 1
+
+
+async def test_emissions_nursery_connect_in_thread_receives_exceptions():
+    """Slots run in a thread that raise exceptions will feed them out to the nursery."""
+
+    class SignalHost(QtCore.QObject):
+        signal = QtCore.Signal()
+
+    class LocalUniqueException(Exception):
+        pass
+
+    def slot():
+        raise LocalUniqueException()
+
+    with pytest.raises(LocalUniqueException):
+        async with qtrio.open_emissions_nursery() as emissions_nursery:
+            signal_host = SignalHost()
+
+            emissions_nursery.connect_in_thread(signal=signal_host.signal, slot=slot)
+
+            signal_host.signal.emit()
+
+
+@pytest.mark.parametrize(
+    argnames="cancellable",
+    argvalues=[False, True],
+    ids=["not cancellable", "cancellable"],
+)
+async def test_emissions_nursery_connect_in_thread_cancellation(cancellable):
+    """Cancelling the nursery waits for running slots unless they are cancellable."""
+
+    class SignalHost(QtCore.QObject):
+        signal = QtCore.Signal()
+
+    started = trio.Event()
+    release = threading.Event()
+    finished = threading.Event()
+    token = trio.lowlevel.current_trio_token()
+
+    def slot():
+        token.run_sync_soon(started.set)
+        if cancellable:
+            release.wait(timeout=5)
+        else:
+            time.sleep(0.1)
+        finished.set()
+
+    signal_host = SignalHost()
+
+    try:
+        async with qtrio.open_emissions_nursery() as emissions_nursery:
+            emissions_nursery.connect_in_thread(
+                signal=signal_host.signal, slot=slot, cancellable=cancellable
+            )
+
+            signal_host.signal.emit()
+            await started.wait()
+            emissions_nursery.nursery.cancel_scope.cancel()
+
+        assert finished.is_set() != cancellable
+    finally:
+        release.set()
+
+
 def test_run_without_executing_application(testdir):
     """Running without executing the application...  doesn't."""
 
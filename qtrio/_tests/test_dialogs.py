@@ -389,3 +389,577 @@ def test_dialog_button_box_buttons_by_role_no_buttons(
 ) -> None:
     dialog = QtWidgets.QDialog()
     assert qtrio.dialogs._dialog_button_box_buttons_by_role(dialog=dialog) == {}
+
+
+def test_pooled_dialog_reuses_widget(builder: typing.Callable[..., typing.Any]) -> None:
+    """Dialogs created with a pool reuse the returned widget."""
+    pool = qtrio.dialogs.DialogPool()
+
+    dialog = builder(pool=pool)
+    with qtrio.dialogs._manage(dialog=dialog):
+        widget = dialog.dialog
+
+    another_dialog = builder(pool=pool)
+    with qtrio.dialogs._manage(dialog=another_dialog):
+        assert another_dialog.dialog is widget
+
+
+async def test_pooled_text_input_dialog_is_reset(qtbot: pytestqt.qtbot.QtBot) -> None:
+    """Pooled widgets do not carry over input or settings between dialogs."""
+    pool = qtrio.dialogs.DialogPool()
+
+    dialog = qtrio.dialogs.create_text_input_dialog(title="first", pool=pool)
+
+    async def user(task_status):
+        async with qtrio._core.wait_signal_context(dialog.shown):
+            task_status.started()
+
+        qtbot.keyClicks(dialog.line_edit, "abc")
+
+        assert dialog.dialog is not None
+        dialog.dialog.accept()
+
+    async with trio.open_nursery() as nursery:
+        await nursery.start(user)
+        assert await dialog.wait() == "abc"
+
+    another_dialog = qtrio.dialogs.create_text_input_dialog(pool=pool)
+    with qtrio.dialogs._manage(dialog=another_dialog):
+        assert another_dialog.dialog is not None
+        assert another_dialog.dialog.textValue() == ""
+        assert another_dialog.dialog.windowTitle() == ""
+        assert another_dialog.dialog.result() == 0
+
+
+def test_dialog_pool_fill_is_bounded(qapp: QtWidgets.QApplication) -> None:
+    """qtrio.dialogs.DialogPool.fill builds no more than the maximum size."""
+    pool = qtrio.dialogs.DialogPool(max_size=2)
+
+    pool.fill(QtWidgets.QMessageBox, count=5)
+
+    assert len(pool.idle[QtWidgets.QMessageBox]) == 2
+
+
+def test_dialog_pool_checkin_is_bounded(qapp: QtWidgets.QApplication) -> None:
+    """qtrio.dialogs.DialogPool discards returned widgets beyond the maximum size."""
+    pool = qtrio.dialogs.DialogPool(max_size=1)
+
+    pool.checkin(QtWidgets.QProgressDialog())
+    pool.checkin(QtWidgets.QProgressDialog())
+
+    assert len(pool.idle[QtWidgets.QProgressDialog]) == 1
+
+
+def test_dialog_pool_evicts_idle(qapp: QtWidgets.QApplication) -> None:
+    """qtrio.dialogs.DialogPool discards widgets idle past the timeout."""
+    now = 0.0
+    pool = qtrio.dialogs.DialogPool(idle_timeout=10, clock=lambda: now)
+
+    pool.fill(QtWidgets.QInputDialog)
+
+    now = 5
+    pool.fill(QtWidgets.QFileDialog)
+
+    now = 12
+    assert pool.checkout(QtWidgets.QInputDialog) is None
+    assert pool.checkout(QtWidgets.QFileDialog) is not None
+
+
+def test_dialog_pool_clear(qapp: QtWidgets.QApplication) -> None:
+    """qtrio.dialogs.DialogPool.clear discards all idle widgets."""
+    pool = qtrio.dialogs.DialogPool()
+
+    pool.fill(QtWidgets.QMessageBox)
+    pool.clear()
+
+    assert pool.checkout(QtWidgets.QMessageBox) is None
+
+
+async def test_file_dialog_prefetch_directories(tmp_path: pathlib.Path) -> None:
+    """FileDialog.prefetch_directories lists the default directory."""
+    directory = tmp_path / "directory"
+    directory.mkdir()
+    (directory / "a").touch()
+    (directory / "b").mkdir()
+    sibling = tmp_path / "sibling"
+    sibling.mkdir()
+    (sibling / "c").touch()
+
+    dialog = qtrio.dialogs.create_file_open_dialog(
+        default_directory=trio.Path(directory)
+    )
+    await dialog.prefetch_directories()
+
+    assert dialog.prefetched is not None
+    assert sorted(dialog.prefetched) == [
+        trio.Path(directory / "a"),
+        trio.Path(directory / "b"),
+    ]
+
+
+async def test_file_dialog_prefetch_directories_siblings(
+    tmp_path: pathlib.Path,
+) -> None:
+    """FileDialog.prefetch_directories optionally lists the sibling directories."""
+    directory = tmp_path / "directory"
+    directory.mkdir()
+    (directory / "a").touch()
+    sibling = tmp_path / "sibling"
+    sibling.mkdir()
+    (sibling / "c").touch()
+    (tmp_path / "not_a_directory").touch()
+
+    dialog = qtrio.dialogs.create_file_open_dialog(
+        default_directory=trio.Path(directory), prefetch_siblings=True
+    )
+    await dialog.prefetch_directories()
+
+    assert dialog.prefetched is not None
+    assert sorted(dialog.prefetched) == [
+        trio.Path(directory / "a"),
+        trio.Path(sibling / "c"),
+    ]
+
+
+async def test_file_dialog_prefetch_directories_missing(
+    tmp_path: pathlib.Path,
+) -> None:
+    """FileDialog.prefetch_directories skips directories that can not be listed."""
+    dialog = qtrio.dialogs.create_file_open_dialog(
+        default_directory=trio.Path(tmp_path / "missing")
+    )
+    await dialog.prefetch_directories()
+
+    assert dialog.prefetched == []
+
+
+async def test_file_dialog_prefetch_directories_no_default() -> None:
+    """FileDialog.prefetch_directories does nothing without a default directory."""
+    dialog = qtrio.dialogs.create_file_open_dialog()
+    await dialog.prefetch_directories()
+
+    assert dialog.prefetched == []
+
+
+async def test_file_save_prefetch(
+    qtbot: pytestqt.qtbot.QtBot, tmp_path: pathlib.Path
+) -> None:
+    """FileDialog with prefetching still applies the default file."""
+    path_to_select = trio.Path(tmp_path) / "something.new"
+
+    dialog = qtrio.dialogs.create_file_save_dialog(
+        default_directory=path_to_select.parent,
+        default_file=path_to_select,
+        prefetch=True,
+    )
+
+    async def user(task_status):
+        async with qtrio._core.wait_signal_context(dialog.shown):
+            task_status.started()
+
+        await trio.sleep(0)
+
+        assert dialog.dialog is not None
+
+        dialog.dialog.accept()
+
+    async with trio.open_nursery() as nursery:
+        await nursery.start(user)
+        with qtrio._qt.connection(signal=dialog.shown, slot=qtbot.addWidget):
+            selected_path = await dialog.wait()
+
+    assert selected_path == path_to_select
+    assert dialog.prefetched == []
+
+
+async def test_progress_dialog_reporter_applies_once_per_frame(
+    qtbot: pytestqt.qtbot.QtBot,
+) -> None:
+    """The progress reporter coalesces updates until the next frame."""
+    dialog = qtrio.dialogs.create_progress_dialog(maximum=1000, fps=20)
+
+    with qtrio._qt.connection(signal=dialog.shown, slot=qtbot.addWidget):
+        async with dialog.manage() as reporter:
+            assert dialog.dialog is not None
+
+            for value in range(1000):
+                reporter.update(value=value)
+
+            assert reporter.applied_count == 0
+
+            with trio.fail_after(5):
+                while reporter.applied_count == 0:
+                    await trio.sleep(0.01)
+
+            assert reporter.applied_count == 1
+            assert dialog.dialog.value() == 999
+
+
+async def test_progress_dialog_reporter_applies_pending_on_close(
+    qtbot: pytestqt.qtbot.QtBot,
+) -> None:
+    """The progress reporter applies pending updates when closed."""
+    widget = QtWidgets.QProgressDialog()
+    qtbot.addWidget(widget)
+    reporter = qtrio.dialogs.ProgressReporter(dialog=widget, fps=0.01)
+
+    reporter.update(value=7, maximum=10)
+    reporter.close()
+
+    assert [widget.value(), widget.maximum()] == [7, 10]
+    assert reporter.applied_count == 1
+
+
+def test_progress_reporter_throughput_and_eta(qtbot: pytestqt.qtbot.QtBot) -> None:
+    """The progress reporter calculates the throughput and ETA."""
+    now = 10.0
+    widget = QtWidgets.QProgressDialog()
+    qtbot.addWidget(widget)
+    reporter = qtrio.dialogs.ProgressReporter(dialog=widget, clock=lambda: now)
+
+    assert [reporter.throughput(), reporter.eta()] == [None, None]
+
+    reporter.update(value=100, maximum=1100)
+    assert [reporter.throughput(), reporter.eta()] == [None, None]
+
+    now = 12
+    reporter.update(value=300)
+
+    assert reporter.throughput() == 100
+    assert reporter.eta() == 8
+
+    reporter.close()
+
+
+async def wait_for(predicate: typing.Callable[[], bool]) -> None:
+    with trio.fail_after(5):
+        while not predicate():
+            await trio.sleep(0.01)
+
+
+async def test_text_input_dialog_validator_enables_accept(
+    qtbot: pytestqt.qtbot.QtBot,
+) -> None:
+    """The accept button is only enabled while the validator accepts the text."""
+
+    async def validator(text: str) -> bool:
+        return text == "valid"
+
+    dialog = qtrio.dialogs.create_text_input_dialog(validator=validator, debounce=0)
+    shown_event = trio.Event()
+
+    async def user() -> None:
+        await shown_event.wait()
+
+        assert dialog.accept_button is not None
+        assert dialog.line_edit is not None
+        accept_button = dialog.accept_button
+
+        assert not accept_button.isEnabled()
+
+        qtbot.keyClicks(dialog.line_edit, "valid")
+        await wait_for(accept_button.isEnabled)
+
+        qtbot.keyClicks(dialog.line_edit, "!")
+        assert not accept_button.isEnabled()
+
+        dialog.line_edit.setText("valid")
+        await wait_for(accept_button.isEnabled)
+
+        accept_button.click()
+
+    async with trio.open_nursery() as nursery:
+        nursery.start_soon(user)
+        with qtrio._qt.connection(signal=dialog.shown, slot=qtbot.addWidget):
+            assert await dialog.wait(shown_event=shown_event) == "valid"
+
+
+async def test_text_input_dialog_validator_cancels_stale(
+    qtbot: pytestqt.qtbot.QtBot,
+) -> None:
+    """Validations in progress are cancelled when the text changes."""
+
+    started: typing.List[str] = []
+    completed: typing.List[str] = []
+
+    async def validator(text: str) -> bool:
+        started.append(text)
+        if text == "slow":
+            await trio.sleep(math.inf)
+        completed.append(text)
+        return True
+
+    dialog = qtrio.dialogs.create_text_input_dialog(validator=validator, debounce=0)
+    shown_event = trio.Event()
+
+    async def user() -> None:
+        await shown_event.wait()
+
+        assert dialog.accept_button is not None
+        assert dialog.line_edit is not None
+
+        dialog.line_edit.setText("slow")
+        await wait_for(lambda: "slow" in started)
+
+        dialog.line_edit.setText("fast")
+        await wait_for(dialog.accept_button.isEnabled)
+
+        assert dialog.dialog is not None
+        dialog.dialog.accept()
+
+    async with trio.open_nursery() as nursery:
+        nursery.start_soon(user)
+        with qtrio._qt.connection(signal=dialog.shown, slot=qtbot.addWidget):
+            assert await dialog.wait(shown_event=shown_event) == "fast"
+
+    assert started == ["", "slow", "fast"]
+    assert completed == ["", "fast"]
+
+
+async def test_text_input_dialog_validator_debounces(
+    qtbot: pytestqt.qtbot.QtBot,
+) -> None:
+    """Only text left unchanged for the debounce period is validated."""
+
+    validated: typing.List[str] = []
+
+    async def validator(text: str) -> bool:
+        validated.append(text)
+        return True
+
+    dialog = qtrio.dialogs.create_text_input_dialog(validator=validator, debounce=0.5)
+    shown_event = trio.Event()
+
+    async def user() -> None:
+        await shown_event.wait()
+
+        assert dialog.accept_button is not None
+        assert dialog.line_edit is not None
+
+        qtbot.keyClicks(dialog.line_edit, "abc")
+        await wait_for(dialog.accept_button.isEnabled)
+
+        assert dialog.dialog is not None
+        dialog.dialog.accept()
+
+    async with trio.open_nursery() as nursery:
+        nursery.start_soon(user)
+        with qtrio._qt.connection(signal=dialog.shown, slot=qtbot.addWidget):
+            await dialog.wait(shown_event=shown_event)
+
+    assert validated == ["abc"]
+
+
+async def test_integer_dialog_validator(qtbot: pytestqt.qtbot.QtBot) -> None:
+    """The integer dialog validates parsed integers and rejects unparsable text."""
+
+    validated: typing.List[int] = []
+
+    async def validator(value: int) -> bool:
+        validated.append(value)
+        return value > 10
+
+    dialog = qtrio.dialogs.create_integer_dialog(validator=validator, debounce=0)
+
+    async def user(task_status):
+        async with qtrio._core.wait_signal_context(dialog.shown):
+            task_status.started()
+
+        assert dialog.accept_button is not None
+        assert dialog.edit_widget is not None
+        accept_button = dialog.accept_button
+
+        dialog.edit_widget.setText("abc")
+        dialog.edit_widget.setText("5")
+        await wait_for(lambda: validated == [5])
+        assert not accept_button.isEnabled()
+
+        dialog.edit_widget.setText("37")
+        await wait_for(accept_button.isEnabled)
+
+        accept_button.click()
+
+    async with trio.open_nursery() as nursery:
+        await nursery.start(user)
+        with qtrio._qt.connection(signal=dialog.shown, slot=qtbot.addWidget):
+            assert await dialog.wait() == 37
+
+
+async def test_message_queue_coalesces_burst(qtbot: pytestqt.qtbot.QtBot) -> None:
+    """Messages arriving within the window are shown in a single message box."""
+    async with qtrio.dialogs.open_message_queue(window=0.1) as message_queue:
+        async with qtrio.enter_emissions_channel(
+            signals=[message_queue.shown]
+        ) as emissions:
+            for i in range(5):
+                message_queue.send(f"message {i}")
+
+            with trio.fail_after(5):
+                emission = await emissions.channel.receive()
+
+            [message_box] = emission.args
+            assert isinstance(message_box, qtrio.dialogs.MessageBox)
+            assert message_box.dialog is not None
+            qtbot.addWidget(message_box.dialog)
+
+            assert message_box.text.startswith("5 messages")
+            assert message_box.detailed_text.splitlines()[::2] == [
+                f"message {i}" for i in range(5)
+            ]
+
+            assert message_box.accept_button is not None
+            message_box.accept_button.click()
+
+            with trio.move_on_after(0.3):
+                await emissions.channel.receive()
+                assert False, "unexpected second message box"  # pragma: no cover
+
+
+async def test_message_queue_single_message(qtbot: pytestqt.qtbot.QtBot) -> None:
+    """A lone message is shown as is."""
+    async with qtrio.dialogs.open_message_queue(window=0) as message_queue:
+        async with qtrio.enter_emissions_channel(
+            signals=[message_queue.shown]
+        ) as emissions:
+            message_queue.send("alone")
+
+            with trio.fail_after(5):
+                emission = await emissions.channel.receive()
+
+            [message_box] = emission.args
+            assert message_box.dialog is not None
+            qtbot.addWidget(message_box.dialog)
+
+            assert [message_box.text, message_box.detailed_text] == ["alone", ""]
+            assert message_box.dialog.detailedText() == ""
+
+
+async def test_message_queue_drops_beyond_buffer(qtbot: pytestqt.qtbot.QtBot) -> None:
+    """Messages beyond the buffer size are dropped and counted."""
+    async with qtrio.dialogs.open_message_queue(
+        window=0, max_buffer_size=2, max_details=1
+    ) as message_queue:
+        async with qtrio.enter_emissions_channel(
+            signals=[message_queue.shown]
+        ) as emissions:
+            message_queue.send("first")
+
+            with trio.fail_after(5):
+                emission = await emissions.channel.receive()
+
+            [message_box] = emission.args
+            assert message_box.dialog is not None
+            qtbot.addWidget(message_box.dialog)
+
+            for i in range(5):
+                message_queue.send(f"message {i}")
+
+            assert message_queue.dropped == 3
+
+            message_box.accept_button.click()
+
+            with trio.fail_after(5):
+                emission = await emissions.channel.receive()
+
+            [message_box] = emission.args
+            assert message_box.dialog is not None
+            qtbot.addWidget(message_box.dialog)
+
+            assert message_box.text.startswith("5 messages")
+            assert message_box.detailed_text == "message 0\n\n... and 4 more"
+            assert message_box.dialog.detailedText() == message_box.detailed_text
+            assert message_queue.dropped == 0
+
+
+async def test_headless_backend_answers_from_script(tmp_path: pathlib.Path) -> None:
+    """Dialogs created while a headless backend is in use are answered in order by the
+    scripted responses without creating widgets.
+    """
+    path = tmp_path / "file"
+
+    with qtrio.dialogs.use_headless_backend(
+        responder=qtrio.dialogs.scripted_responder([7, "text", os.fspath(path), None])
+    ) as backend:
+        integer_dialog = qtrio.dialogs.create_integer_dialog()
+        text_dialog = qtrio.dialogs.create_text_input_dialog(title="Title")
+        file_dialog = qtrio.dialogs.create_file_save_dialog()
+        message_box = qtrio.dialogs.create_message_box(title="Title", text="Text")
+
+        assert await integer_dialog.wait() == 7
+        assert await text_dialog.wait() == "text"
+        assert await file_dialog.wait() == trio.Path(path)
+        await message_box.wait()
+
+        assert file_dialog.dialog is None
+        assert backend.created_count == 4
+
+
+async def test_headless_backend_raises_scripted_exception() -> None:
+    """A scripted exception is raised from waiting on the dialog."""
+
+    with qtrio.dialogs.use_headless_backend(
+        responder=qtrio.dialogs.scripted_responder([qtrio.UserCancelledError])
+    ):
+        dialog = qtrio.dialogs.create_integer_dialog()
+
+        with pytest.raises(qtrio.UserCancelledError):
+            await dialog.wait()
+
+
+async def test_headless_backend_raises_when_script_exhausted() -> None:
+    """Waiting on a dialog after the script is exhausted raises."""
+
+    with qtrio.dialogs.use_headless_backend(
+        responder=qtrio.dialogs.scripted_responder([])
+    ):
+        dialog = qtrio.dialogs.create_text_input_dialog()
+
+        with pytest.raises(qtrio.HeadlessScriptExhaustedError):
+            await dialog.wait()
+
+
+async def test_headless_backend_awaits_responder() -> None:
+    """An awaitable response is awaited and the responder receives the dialog."""
+
+    received = []
+
+    async def respond(dialog: qtrio.dialogs.HeadlessDialog) -> object:
+        received.append((dialog.kind, dialog.arguments["title"]))
+        await trio.sleep(0)
+        return "answer"
+
+    with qtrio.dialogs.use_headless_backend(responder=respond):
+        dialog = qtrio.dialogs.create_text_input_dialog(title="Question")
+
+        assert await dialog.wait() == "answer"
+
+    assert received == [("text_input", "Question")]
+
+
+async def test_headless_progress_dialog_records_progress() -> None:
+    """A headless progress dialog yields a reporter that only records updates."""
+
+    with qtrio.dialogs.use_headless_backend(
+        responder=qtrio.dialogs.scripted_responder([])
+    ):
+        dialog = qtrio.dialogs.create_progress_dialog()
+
+        async with dialog.manage() as reporter:
+            reporter.update(3, maximum=10)
+
+    assert dialog.dialog is None
+    assert (reporter.value, reporter.maximum) == (3, 10)
+    assert reporter.applied_count == 0
+
+
+def test_headless_backend_restored_on_exit() -> None:
+    """Regular dialogs are created again after leaving the headless backend."""
+
+    with qtrio.dialogs.use_headless_backend(
+        responder=qtrio.dialogs.scripted_responder([])
+    ):
+        pass
+
+    dialog = qtrio.dialogs.create_integer_dialog()
+
+    assert isinstance(dialog, qtrio.dialogs.IntegerDialog)
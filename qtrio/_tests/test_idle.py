@@ -0,0 +1,98 @@
+import math
+import typing
+
+import pytest
+from qts import QtCore
+import trio
+
+import qtrio
+import qtrio._idle
+
+
+def post_input_event() -> None:
+    target = QtCore.QObject(QtCore.QCoreApplication.instance())
+    QtCore.QCoreApplication.postEvent(target, QtCore.QEvent(QtCore.QEvent.KeyPress))
+
+
+async def test_until_idle_returns():
+    """qtrio.until_idle() returns once the host is idle."""
+
+    with trio.fail_after(5):
+        await qtrio.until_idle()
+
+
+async def test_until_idle_disconnects_when_done():
+    """qtrio.until_idle() only stays connected while there are waiters."""
+
+    idle_monitor = qtrio._idle._idle_monitor.get()
+
+    with trio.fail_after(5):
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(qtrio.until_idle)
+            nursery.start_soon(qtrio.until_idle)
+
+    assert idle_monitor._about_to_block is None
+
+
+async def test_preempt_on_input_cancels():
+    """qtrio.preempt_on_input() cancels the context when user input arrives."""
+
+    with trio.fail_after(5):
+        with qtrio.preempt_on_input() as cancel_scope:
+            post_input_event()
+            await trio.sleep(math.inf)
+
+    assert cancel_scope.cancelled_caught
+
+
+async def test_preempt_on_input_ignores_other_events():
+    """qtrio.preempt_on_input() does not cancel the context for other events."""
+
+    target = QtCore.QObject()
+
+    with qtrio.preempt_on_input() as cancel_scope:
+        QtCore.QCoreApplication.postEvent(target, QtCore.QEvent(QtCore.QEvent.User))
+        await qtrio.until_idle()
+
+    assert not cancel_scope.cancelled_caught
+
+
+async def test_preempt_on_input_removes_filter_when_done():
+    """qtrio.preempt_on_input() only keeps an event filter while needed."""
+
+    idle_monitor = qtrio._idle._idle_monitor.get()
+
+    with qtrio.preempt_on_input():
+        with qtrio.preempt_on_input():
+            assert idle_monitor._input_filter is not None
+        assert idle_monitor._input_filter is not None
+
+    assert idle_monitor._input_filter is None
+
+
+async def test_run_when_idle_restarts_after_input():
+    """qtrio.run_when_idle() restarts the work when preempted by input."""
+
+    attempts: typing.List[int] = []
+
+    async def work() -> int:
+        attempts.append(len(attempts))
+
+        if len(attempts) == 1:
+            post_input_event()
+            await trio.sleep(math.inf)
+
+        return 37
+
+    with trio.fail_after(5):
+        result = await qtrio.run_when_idle(work)
+
+    assert result == 37
+    assert attempts == [0, 1]
+
+
+def test_until_idle_raises_outside_runner():
+    """qtrio.until_idle() raises when not run in a qtrio.Runner."""
+
+    with pytest.raises(qtrio.RunnerNotActiveError):
+        trio.run(qtrio.until_idle)
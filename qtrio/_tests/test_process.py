@@ -0,0 +1,175 @@
+import os
+import sys
+import time
+
+import pytest
+import trio
+
+import qtrio
+import qtrio._process
+
+
+async def test_run_in_process_returns_value():
+    """run_in_process() passes the arguments and returns the result."""
+
+    result = await qtrio.run_in_process(pow, 2, 10)
+
+    assert result == 1024
+
+
+async def test_run_in_process_runs_in_another_process():
+    """run_in_process() runs the function in a different process."""
+
+    pid = await qtrio.run_in_process(os.getpid)
+
+    assert pid != os.getpid()
+
+
+async def test_run_in_process_raises():
+    """run_in_process() raises exceptions raised in the worker."""
+
+    with pytest.raises(ValueError):
+        await qtrio.run_in_process(int, "not an integer")
+
+
+requires_shared_memory = pytest.mark.skipif(
+    sys.version_info < (3, 8),
+    reason="multiprocessing.shared_memory requires Python 3.8",
+)
+
+
+@requires_shared_memory
+async def test_run_in_process_passes_shared_buffer():
+    """run_in_process() passes shared buffers as views of the data."""
+
+    data = bytes(range(256)) * 1000
+
+    result = await qtrio.run_in_process(bytes, qtrio.SharedBuffer(data))
+
+    assert result == data
+
+
+@requires_shared_memory
+async def test_run_in_process_passes_empty_shared_buffer():
+    """run_in_process() passes empty shared buffers."""
+
+    result = await qtrio.run_in_process(len, qtrio.SharedBuffer(b""))
+
+    assert result == 0
+
+
+async def test_process_pool_cancellation_does_not_wait():
+    """Cancelling a process pool call returns without waiting for the worker."""
+
+    process_pool = qtrio.ProcessPool(max_workers=1)
+
+    try:
+        start = time.monotonic()
+
+        with trio.move_on_after(0.1):
+            await process_pool.run(time.sleep, 2)
+
+        end = time.monotonic()
+    finally:
+        process_pool.shutdown()
+
+    assert end - start < 1
+
+
+async def test_process_pool_cancelled_call_keeps_capacity():
+    """A cancelled call still running in a worker keeps its capacity until done."""
+
+    process_pool = qtrio.ProcessPool(max_workers=1)
+
+    try:
+        # get the worker started so its start up time does not affect the timing
+        await process_pool.run(pow, 2, 3)
+
+        with trio.move_on_after(0.1):
+            await process_pool.run(time.sleep, 1)
+
+        start = time.monotonic()
+        await process_pool.run(pow, 2, 3)
+        end = time.monotonic()
+    finally:
+        process_pool.shutdown()
+
+    assert end - start > 0.5
+
+
+def sleep_then_write(path: str, view: memoryview) -> None:
+    time.sleep(0.5)
+
+    with open(path, "wb") as file:
+        file.write(view)
+
+
+@requires_shared_memory
+async def test_process_pool_cancelled_call_keeps_shared_buffer(tmp_path):
+    """A cancelled call still running in a worker can use its shared buffer."""
+
+    process_pool = qtrio.ProcessPool(max_workers=1)
+    data = b"abc" * 1000
+    path = tmp_path / "written"
+
+    try:
+        await process_pool.run(pow, 2, 3)
+
+        with trio.move_on_after(0.1):
+            await process_pool.run(
+                sleep_then_write, os.fspath(path), qtrio.SharedBuffer(data)
+            )
+
+        # waits for the capacity held by the abandoned call
+        await process_pool.run(pow, 2, 3)
+    finally:
+        process_pool.shutdown()
+
+    assert path.read_bytes() == data
+
+
+async def test_process_pool_shutdown_clears_executor():
+    """Shutting down the process pool releases the executor."""
+
+    process_pool = qtrio.ProcessPool(max_workers=1)
+
+    await process_pool.run(pow, 2, 3)
+    assert process_pool.executor is not None
+
+    process_pool.shutdown()
+    assert process_pool.executor is None
+
+
+def test_run_in_process_raises_outside_runner():
+    """run_in_process() raises when not run in a qtrio.Runner."""
+
+    with pytest.raises(qtrio.ProcessPoolNotAvailableError):
+        trio.run(qtrio.run_in_process, pow, 2, 3)
+
+
+def test_cancelled_call_does_not_delay_run_returning(testdir):
+    """An abandoned call still running in a worker does not block the run finishing."""
+
+    test_file = r"""
+    import time
+
+    import trio
+
+    import qtrio
+
+
+    def test():
+        async def main():
+            with trio.move_on_after(0.5):
+                await qtrio.run_in_process(time.sleep, 10)
+
+        start = time.monotonic()
+        qtrio.run(main)
+        end = time.monotonic()
+
+        assert end - start < 5
+    """
+    testdir.makepyfile(test_file)
+
+    result = testdir.runpytest_subprocess(timeout=40)
+    result.assert_outcomes(passed=1)
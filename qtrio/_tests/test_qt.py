@@ -1,5 +1,8 @@
+import gc
+import io
 import typing
 
+import attr
 import pytestqt.qtbot
 from qts import QtCore
 import pytest
@@ -78,6 +81,237 @@ def test_our_signal_object_method_returns_qobject(optional_name_argument):
     assert isinstance(NotQObject.signal.object(instance=instance), QtCore.QObject)
 
 
+def test_our_signals_share_one_qobject_per_instance():
+    """qtrio._core.Signal instances on a class share a single signal-hosting QObject
+    per instance.
+    """
+
+    class NotQObject:
+        signal_a = qtrio.Signal(int)
+        signal_b = qtrio.Signal(str)
+
+    instance = NotQObject()
+    another_instance = NotQObject()
+
+    qobject = NotQObject.signal_a.object(instance=instance)
+
+    assert NotQObject.signal_b.object(instance=instance) is qobject
+    assert NotQObject.signal_a.object(instance=another_instance) is not qobject
+
+
+def test_our_signals_sharing_a_qobject_emit_independently(
+    qtbot: pytestqt.qtbot.QtBot,
+) -> None:
+    """qtrio._core.Signal instances sharing a QObject only emit to their own slots,
+    including those with names matching QObject attributes.
+    """
+
+    class NotQObject:
+        signal = qtrio.Signal(int)
+        event = qtrio.Signal(int)
+
+    results = []
+
+    instance = NotQObject()
+    instance.signal.connect(lambda value: results.append(("signal", value)))
+    instance.event.connect(lambda value: results.append(("event", value)))
+
+    instance.signal.emit(1)
+    instance.event.emit(2)
+
+    assert results == [("signal", 1), ("event", 2)]
+
+
+def test_our_signals_are_inherited(qtbot: pytestqt.qtbot.QtBot) -> None:
+    """qtrio._core.Signal instances from base classes are hosted along with those of
+    the subclass.
+    """
+
+    class Base:
+        base_signal = qtrio.Signal(int)
+
+    class Derived(Base):
+        derived_signal = qtrio.Signal(int)
+
+    results: typing.List[int] = []
+
+    instance = Derived()
+    instance.base_signal.connect(results.append)
+    instance.derived_signal.connect(results.append)
+
+    instance.base_signal.emit(1)
+    instance.derived_signal.emit(2)
+
+    assert results == [1, 2]
+    assert Derived.base_signal.object(instance) is Derived.derived_signal.object(
+        instance
+    )
+
+
+def test_our_signal_added_late_raises():
+    """qtrio._core.Signal added to a class after first use raises."""
+
+    class NotQObject:
+        signal = qtrio.Signal()
+
+    instance = NotQObject()
+    instance.signal
+
+    NotQObject.late_signal = qtrio.Signal()  # type: ignore[attr-defined]
+
+    with pytest.raises(qtrio.SignalNotDeclaredError, match="declared before first use"):
+        instance.late_signal  # type: ignore[attr-defined]
+
+
+def test_our_signal_overridden_by_non_signal_is_not_hosted():
+    """qtrio._core.Signal overridden in a subclass by a non-signal is not hosted."""
+
+    class Base:
+        signal = qtrio.Signal(int)
+        other_signal = qtrio.Signal(int)
+
+    class Derived(Base):
+        signal = None  # type: ignore[assignment]
+
+    host_class = qtrio._qt._signal_host_class(Derived)
+
+    assert list(host_class.attribute_names.values()) == ["signal_other_signal"]
+    assert not hasattr(host_class.cls, "signal_signal")
+
+
+def test_our_signal_default_name_is_attribute_name():
+    """qtrio._core.Signal without a name uses the attribute name for the Qt signal."""
+
+    class NotQObject:
+        some_signal = qtrio.Signal(int)
+
+    instance = NotQObject()
+    qobject = NotQObject.some_signal.object(instance)
+    meta_object = qobject.metaObject()
+
+    names = [
+        bytes(meta_object.method(index).name()).decode()
+        for index in range(meta_object.methodCount())
+    ]
+
+    assert "some_signal" in names
+
+
+def test_our_signal_is_cached_on_instance():
+    """qtrio._core.Signal instance access is cached in the instance dict."""
+
+    class NotQObject:
+        signal = qtrio.Signal()
+
+    instance = NotQObject()
+
+    signal_instance = instance.signal
+
+    assert vars(instance)["signal"] is signal_instance
+    assert instance.signal is signal_instance
+
+
+def test_our_signal_aliases_are_cached_under_each_name():
+    """qtrio._core.Signal assigned to several names is cached under each of them and
+    they share the one signal.
+    """
+
+    class NotQObject:
+        signal = qtrio.Signal(int)
+        alias = signal
+
+    results: typing.List[int] = []
+
+    instance = NotQObject()
+    instance.signal.connect(results.append)
+
+    assert vars(instance)["signal"] is vars(instance)["alias"]
+
+    instance.alias.emit(1)
+
+    assert results == [1]
+
+
+def test_our_signal_alias_accessed_first_is_cached_under_each_name():
+    """qtrio._core.Signal accessed via an alias is cached under the accessed name."""
+
+    class NotQObject:
+        signal = qtrio.Signal(int)
+        alias = signal
+
+    instance = NotQObject()
+    signal_instance = instance.alias
+
+    assert vars(instance)["alias"] is signal_instance
+    assert instance.signal is signal_instance
+
+
+@pytest.mark.parametrize(
+    argnames="decorator",
+    argvalues=[
+        attr.s(auto_attribs=True, slots=True),
+        attr.s(auto_attribs=True, slots=True, frozen=True),
+    ],
+    ids=["mutable", "frozen"],
+)
+def test_our_signal_on_attrs_slots_class_emits(
+    qtbot: pytestqt.qtbot.QtBot,
+    decorator: typing.Callable[[typing.Type[object]], typing.Type[object]],
+) -> None:
+    """qtrio._core.Signal works on attrs slots classes, including unhashable ones."""
+
+    @decorator
+    class Slotted:
+        value: int = 0
+        signal = qtrio.Signal(int)
+
+    results: typing.List[int] = []
+
+    instance = Slotted()
+    another_instance = Slotted()
+
+    instance.signal.connect(results.append)
+    another_instance.signal.connect(lambda value: results.append(-value))
+
+    instance.signal.emit(1)
+    another_instance.signal.emit(2)
+
+    assert results == [1, -2]
+    assert Slotted.signal.object(instance) is Slotted.signal.object(instance)
+
+
+def test_our_signal_on_slots_class_releases_host():
+    """qtrio._core.Signal hosts for slots classes are released with the instance."""
+
+    class Slotted:
+        __slots__ = ("__weakref__",)
+        signal = qtrio.Signal()
+
+    instance = Slotted()
+    instance.signal
+
+    key = id(instance)
+    assert key in qtrio._qt._slotted_signal_hosts.entries
+
+    del instance
+    gc.collect()
+
+    assert key not in qtrio._qt._slotted_signal_hosts.entries
+
+
+def test_our_signal_on_slots_class_without_weakref_raises():
+    """qtrio._core.Signal raises for slots classes without a __weakref__ slot."""
+
+    class Slotted:
+        __slots__ = ()
+        signal = qtrio.Signal()
+
+    instance = Slotted()
+
+    with pytest.raises(TypeError, match="__weakref__"):
+        instance.signal
+
+
 def test_connection_connects(qtbot: pytestqt.qtbot.QtBot) -> None:
     """qtrio._core.connection connects signal inside managed context."""
 
@@ -153,3 +387,233 @@ def test_failed_connection_raises():
     with pytest.raises(TypeError):
         with qtrio._qt.connection(instance.signal, 2):  # type: ignore
             pass  # pragma: no cover
+
+
+def test_connections_connects_and_disconnects(qtbot: pytestqt.qtbot.QtBot) -> None:
+    """qtrio._qt.connections connects all pairs inside the managed context and
+    disconnects them on exit.
+    """
+
+    class MyQObject(QtCore.QObject):
+        signal_a = QtCore.Signal(int)
+        signal_b = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    results: typing.List[typing.Tuple[str, int]] = []
+
+    pairs = [
+        (instance.signal_a, lambda value: results.append(("a", value))),
+        (instance.signal_b, lambda value: results.append(("b", value))),
+    ]
+
+    with qtrio._qt.connections(pairs=pairs):
+        instance.signal_a.emit(1)
+        instance.signal_b.emit(2)
+
+    instance.signal_a.emit(3)
+    instance.signal_b.emit(4)
+
+    assert results == [("a", 1), ("b", 2)]
+
+
+def test_connections_keeps_bound_method_slots_alive(
+    qtbot: pytestqt.qtbot.QtBot,
+) -> None:
+    """qtrio._qt.Connections holds slots only referenced by the connection."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    results: typing.List[int] = []
+
+    class Collector:
+        def collect(self, value: int) -> None:
+            results.append(value)
+
+    instance = MyQObject()
+
+    connections = qtrio._qt.Connections()
+    connections.connect(signal=instance.signal, slot=Collector().collect)
+
+    gc.collect()
+    instance.signal.emit(1)
+
+    connections.disconnect_all()
+    instance.signal.emit(2)
+
+    assert results == [1]
+
+
+def test_connections_disconnect_all_twice(qtbot: pytestqt.qtbot.QtBot) -> None:
+    """qtrio._qt.Connections.disconnect_all can be called repeatedly."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    results: typing.List[int] = []
+
+    connections = qtrio._qt.Connections()
+    connections.connect(signal=instance.signal, slot=results.append)
+
+    connections.disconnect_all()
+    connections.disconnect_all()
+
+    instance.signal.emit(1)
+
+    assert results == []
+    assert connections.connections == []
+
+
+def test_connections_ignores_already_disconnected(
+    qtbot: pytestqt.qtbot.QtBot,
+) -> None:
+    """qtrio._qt.Connections.disconnect_all ignores connections that were already
+    disconnected via the returned handle.
+    """
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    results: typing.List[int] = []
+
+    connections = qtrio._qt.Connections()
+    handle = connections.connect(signal=instance.signal, slot=results.append)
+
+    instance.signal.emit(1)
+    instance.signal.disconnect(handle)
+    instance.signal.emit(2)
+
+    connections.disconnect_all()
+
+    assert results == [1]
+
+
+def test_connections_disconnects_on_failed_connection(
+    qtbot: pytestqt.qtbot.QtBot,
+) -> None:
+    """qtrio._qt.connections disconnects earlier pairs if a later connection fails."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    results: typing.List[int] = []
+
+    with pytest.raises(TypeError):
+        with qtrio._qt.connections(
+            pairs=[(instance.signal, results.append), (instance.signal, 2)]  # type: ignore[list-item]
+        ):
+            pass  # pragma: no cover
+
+    instance.signal.emit(1)
+
+    assert results == []
+
+
+def test_track_connections_records_live_connections(
+    qtbot: pytestqt.qtbot.QtBot,
+) -> None:
+    """qtrio.track_connections records connections until they are disconnected."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    with qtrio.track_connections() as registry:
+        with qtrio._qt.connection(instance.signal, lambda value: None):
+            with qtrio._qt.connections(
+                pairs=[(instance.signal, lambda value: None)] * 2
+            ):
+                [statistics] = registry.top()
+                assert statistics.count == 3
+                assert all(site.startswith(__file__) for site in statistics.sites)
+
+            [statistics] = registry.top()
+            assert statistics.count == 1
+
+    assert registry.top() == []
+
+
+def test_track_connections_not_recording_outside(
+    qtbot: pytestqt.qtbot.QtBot,
+) -> None:
+    """qtrio.track_connections does not record connections made outside of it."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    with qtrio.track_connections() as registry:
+        pass
+
+    with qtrio._qt.connection(instance.signal, lambda value: None):
+        assert registry.top() == []
+
+
+def test_track_connections_orders_top_offenders(
+    qtbot: pytestqt.qtbot.QtBot,
+) -> None:
+    """qtrio.ConnectionRegistry.top reports the most connected signals first."""
+
+    class MyQObject(QtCore.QObject):
+        signal_a = QtCore.Signal(int)
+        signal_b = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    pairs = [
+        (instance.signal_a, lambda value: None),
+        (instance.signal_b, lambda value: None),
+        (instance.signal_b, lambda value: None),
+    ]
+
+    with qtrio.track_connections() as registry:
+        with qtrio._qt.connections(pairs=pairs):
+            assert [statistics.count for statistics in registry.top()] == [2, 1]
+            assert [statistics.count for statistics in registry.top(count=1)] == [2]
+
+
+def test_track_connections_warns_past_threshold(
+    qtbot: pytestqt.qtbot.QtBot,
+) -> None:
+    """qtrio.track_connections warns once the connections of a signal exceed the
+    threshold.
+    """
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+
+    with qtrio.track_connections(threshold=2):
+        with qtrio._qt.connections(pairs=[(instance.signal, lambda value: None)] * 2):
+            with pytest.warns(qtrio.ConnectionCountWarning):
+                with qtrio._qt.connection(instance.signal, lambda value: None):
+                    pass
+
+
+def test_track_connections_dump(qtbot: pytestqt.qtbot.QtBot) -> None:
+    """qtrio.ConnectionRegistry.dump writes the counts and creation sites."""
+
+    class MyQObject(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    instance = MyQObject()
+    file = io.StringIO()
+
+    with qtrio.track_connections() as registry:
+        with qtrio._qt.connection(instance.signal, lambda value: None):
+            registry.dump(file=file)
+
+    lines = file.getvalue().splitlines()
+
+    assert lines[0].startswith("1 connections")
+    assert lines[1].strip().startswith(f"1 from {__file__}")
@@ -1,10 +1,14 @@
 import contextlib
+import functools
+import inspect
 import os
 import sys
+import time
 import typing
 
 import async_generator
 import attr
+from qts import QtCore
 from qts import QtWidgets
 import trio
 import trio_typing
@@ -115,6 +119,231 @@ def _dialog_button_box_buttons_by_role(
     return {button_box.buttonRole(button): button for button in button_box.buttons()}
 
 
+_Dialog = typing.TypeVar("_Dialog", bound=QtWidgets.QDialog)
+
+
+@attr.s(auto_attribs=True)
+class DialogPool:
+    """A bounded pool of hidden, pre-built dialog widgets to avoid construction costs
+    such as populating the file system model of a :class:`QtWidgets.QFileDialog`.
+    Dialogs created with a pool check out a widget of the needed type when setup and
+    reset and return it when torn down.  Idle widgets are evicted lazily whenever the
+    pool is used.
+    """
+
+    max_size: int = 2
+    """The maximum number of idle widgets kept for each widget type."""
+    idle_timeout: typing.Optional[float] = 300
+    """Seconds after which an idle widget is evicted.  :obj:`None` keeps idle widgets
+    indefinitely.
+    """
+    clock: typing.Callable[[], float] = time.monotonic
+    """The clock used to measure idle time."""
+
+    idle: typing.Dict[
+        typing.Type[QtWidgets.QDialog],
+        typing.List[typing.Tuple[float, QtWidgets.QDialog]],
+    ] = attr.ib(factory=dict)
+    """The idle widgets by type along with the time they were returned."""
+
+    def fill(self, cls: typing.Type[QtWidgets.QDialog], count: int = 1) -> None:
+        """Build idle widgets ahead of use, up to :attr:`max_size`.
+
+        Arguments:
+            cls: The widget type to build such as :class:`QtWidgets.QFileDialog`.
+            count: The number of widgets to build.
+        """
+        for _ in range(count):
+            if len(self.idle.get(cls, [])) >= self.max_size:
+                break
+
+            self.checkin(dialog=cls())
+
+    def checkout(
+        self,
+        cls: typing.Type[_Dialog],
+        parent: typing.Optional[QtWidgets.QWidget] = None,
+    ) -> typing.Optional[_Dialog]:
+        """Take the most recently returned idle widget of the given type.
+
+        Arguments:
+            cls: The widget type needed.
+            parent: The parent to set on the widget.
+
+        Returns:
+            The widget, or :obj:`None` if none are idle.
+        """
+        self.evict_idle()
+
+        idle = self.idle.get(cls)
+        if not idle:
+            return None
+
+        _, dialog = idle.pop()
+        if parent is not None:
+            dialog.setParent(parent, dialog.windowFlags())
+
+        return typing.cast(_Dialog, dialog)
+
+    def checkin(self, dialog: QtWidgets.QDialog) -> None:
+        """Reset a hidden widget and keep it for reuse, or discard it if the pool is
+        full.
+
+        Arguments:
+            dialog: The widget to return.
+        """
+        self.evict_idle()
+
+        dialog.hide()
+        dialog.setParent(None, dialog.windowFlags())
+        dialog.setResult(0)
+
+        if isinstance(dialog, QtWidgets.QProgressDialog):
+            # also stops the timer that would otherwise show the dialog
+            dialog.reset()
+        elif isinstance(dialog, QtWidgets.QInputDialog):
+            dialog.setTextValue("")
+        elif isinstance(dialog, QtWidgets.QFileDialog):
+            dialog.selectFile("")
+
+        idle = self.idle.setdefault(type(dialog), [])
+        if len(idle) >= self.max_size:
+            dialog.deleteLater()
+            return
+
+        idle.append((self.clock(), dialog))
+
+    def evict_idle(self) -> None:
+        """Discard widgets idle for longer than :attr:`idle_timeout`."""
+        if self.idle_timeout is None:
+            return
+
+        oldest = self.clock() - self.idle_timeout
+
+        for idle in self.idle.values():
+            while len(idle) > 0 and idle[0][0] < oldest:
+                _, dialog = idle.pop(0)
+                dialog.deleteLater()
+
+    def clear(self) -> None:
+        """Discard all idle widgets."""
+        idle = self.idle
+        self.idle = {}
+
+        for entries in idle.values():
+            for _, dialog in entries:
+                dialog.deleteLater()
+
+
+def _checkout(
+    pool: typing.Optional[DialogPool],
+    cls: typing.Type[_Dialog],
+    parent: typing.Optional[QtWidgets.QWidget] = None,
+) -> typing.Optional[_Dialog]:
+    """Take a widget from the pool, if there is one.
+
+    Arguments:
+        pool: The pool to take the widget from.
+        cls: The widget type needed.
+        parent: The parent to set on the widget.
+
+    Returns:
+        The widget, or :obj:`None` if a new one must be built.
+    """
+    if pool is None:
+        return None
+
+    return pool.checkout(cls=cls, parent=parent)
+
+
+def _checkin(
+    pool: typing.Optional[DialogPool], dialog: typing.Optional[QtWidgets.QDialog]
+) -> None:
+    """Return the widget to the pool, if there is one.
+
+    Arguments:
+        pool: The pool to return the widget to.
+        dialog: The widget to return.
+    """
+    if pool is not None and dialog is not None:
+        pool.checkin(dialog=dialog)
+
+
+_Input = typing.TypeVar("_Input")
+
+
+async def _validate_input(
+    dialog: QtWidgets.QInputDialog,
+    accept_button: typing.Optional[QtWidgets.QAbstractButton],
+    parse: typing.Callable[[str], _Input],
+    validator: typing.Callable[[_Input], typing.Awaitable[bool]],
+    debounce: float,
+    *,
+    task_status: trio_typing.TaskStatus[None] = trio.TASK_STATUS_IGNORED,
+) -> None:
+    """Validate the input text each time it changes and enable the accept button only
+    while the present text is valid.  Validation starts once the text has been
+    unchanged for the debounce period and is cancelled if the text changes again.
+
+    Arguments:
+        dialog: The input dialog widget to validate.
+        accept_button: The button to enable and disable.
+        parse: Converts the text to the value passed to the validator.  Text that
+            raises :class:`ValueError` is invalid.
+        validator: Returns true if the value is valid.
+        debounce: Seconds to wait for further changes before validating.
+    """
+    if accept_button is None:  # pragma: no cover
+        raise qtrio.InternalError("Accept button unexpectedly not known.")
+
+    button = accept_button
+
+    async def check(
+        text: str, task_status: trio_typing.TaskStatus[trio.CancelScope]
+    ) -> None:
+        with trio.CancelScope() as cancel_scope:
+            task_status.started(cancel_scope)
+
+            await trio.sleep(debounce)
+
+            try:
+                value = parse(text)
+            except ValueError:
+                return
+
+            valid = await validator(value)
+
+        if not cancel_scope.cancel_called:
+            button.setEnabled(valid)
+
+    def disable(*args: object) -> None:
+        # Disable immediately, not once the emission is handled, so the user can not
+        # accept text that was not validated.
+        button.setEnabled(False)
+
+    with qtrio._qt.connection(signal=dialog.textValueChanged, slot=disable):
+        async with qtrio.enter_emissions_channel(
+            signals=[dialog.textValueChanged]
+        ) as emissions:
+            async with trio.open_nursery() as nursery:
+                check_scope: typing.Optional[trio.CancelScope] = None
+
+                async def restart(text: str) -> None:
+                    nonlocal check_scope
+
+                    if check_scope is not None:
+                        check_scope.cancel()
+                    check_scope = await nursery.start(check, text)
+
+                disable()
+                await restart(dialog.textValue())
+                task_status.started()
+
+                async for emission in emissions.channel:
+                    [text] = emission.args
+                    await restart(typing.cast(str, text))
+
+
 @check_dialog_protocol
 @attr.s(auto_attribs=True)
 class IntegerDialog:
@@ -135,6 +364,16 @@ class IntegerDialog:
 
     result: typing.Optional[int] = None
     """The result of parsing the user input."""
+    pool: typing.Optional[DialogPool] = None
+    """The pool to take the dialog widget from and return it to."""
+    validator: typing.Optional[typing.Callable[[int], typing.Awaitable[bool]]] = None
+    """An async callable run as the user types to decide if the integer is valid.  The
+    accept button is disabled until the present integer is valid.
+    """
+    debounce: float = 0.25
+    """Seconds the input must be unchanged before :attr:`validator` is called.  Stale
+    validations are cancelled when the input changes.
+    """
 
     shown = qtrio.Signal(QtWidgets.QInputDialog)
     """See :attr:`qtrio.dialogs.DialogProtocol.shown`."""
@@ -146,7 +385,9 @@ class IntegerDialog:
 
         self.result = None
 
-        self.dialog = QtWidgets.QInputDialog(self.parent)
+        self.dialog = _checkout(self.pool, QtWidgets.QInputDialog, parent=self.parent)
+        if self.dialog is None:
+            self.dialog = QtWidgets.QInputDialog(self.parent)
 
         # TODO: adjust so we can use a context manager?
         self.dialog.finished.connect(self.finished)
@@ -167,6 +408,7 @@ class IntegerDialog:
         if self.dialog is not None:
             self.dialog.close()
             self.dialog.finished.disconnect(self.finished)
+            _checkin(self.pool, self.dialog)
         self.dialog = None
         self.accept_button = None
         self.reject_button = None
@@ -180,7 +422,21 @@ class IntegerDialog:
                     "Dialog not assigned while it is being managed."
                 )
 
-            await finished_event.wait()
+            async with trio.open_nursery() as nursery:
+                if self.validator is not None:
+                    await nursery.start(
+                        functools.partial(
+                            _validate_input,
+                            dialog=self.dialog,
+                            accept_button=self.accept_button,
+                            parse=int,
+                            validator=self.validator,
+                            debounce=self.debounce,
+                        )
+                    )
+
+                await finished_event.wait()
+                nursery.cancel_scope.cancel()
 
             if self.dialog.result() != QtWidgets.QDialog.Accepted:
                 raise qtrio.UserCancelledError()
@@ -195,16 +451,30 @@ class IntegerDialog:
 
 def create_integer_dialog(
     parent: typing.Optional[QtWidgets.QWidget] = None,
+    pool: typing.Optional[DialogPool] = None,
+    validator: typing.Optional[typing.Callable[[int], typing.Awaitable[bool]]] = None,
+    debounce: float = 0.25,
 ) -> IntegerDialog:
     """Create an integer input dialog.
 
     Arguments:
         parent: See :attr:`qtrio.dialogs.IntegerDialog.parent`.
+        pool: See :attr:`qtrio.dialogs.IntegerDialog.pool`.
+        validator: See :attr:`qtrio.dialogs.IntegerDialog.validator`.
+        debounce: See :attr:`qtrio.dialogs.IntegerDialog.debounce`.
 
     Returns:
         The dialog manager.
     """
-    return IntegerDialog(parent=parent)
+    if _headless_backend is not None:
+        return typing.cast(
+            IntegerDialog,
+            _headless_backend.create(kind="integer", arguments={}),
+        )
+
+    return IntegerDialog(
+        parent=parent, pool=pool, validator=validator, debounce=debounce
+    )
 
 
 @check_dialog_protocol
@@ -238,17 +508,27 @@ class TextInputDialog:
     """See :attr:`qtrio.dialogs.BasicDialogProtocol.finished`."""
 
     finished_event: trio.Event = attr.ib(factory=trio.Event)
+    pool: typing.Optional[DialogPool] = None
+    """The pool to take the dialog widget from and return it to."""
+    validator: typing.Optional[typing.Callable[[str], typing.Awaitable[bool]]] = None
+    """An async callable run as the user types to decide if the text is valid.  The
+    accept button is disabled until the present text is valid.
+    """
+    debounce: float = 0.25
+    """Seconds the input must be unchanged before :attr:`validator` is called.  Stale
+    validations are cancelled when the input changes.
+    """
 
     def setup(self) -> None:
         """See :meth:`qtrio.dialogs.BasicDialogProtocol.setup`."""
 
         self.result = None
 
-        self.dialog = QtWidgets.QInputDialog(parent=self.parent)
-        if self.label is not None:
-            self.dialog.setLabelText(self.label)
-        if self.title is not None:
-            self.dialog.setWindowTitle(self.title)
+        self.dialog = _checkout(self.pool, QtWidgets.QInputDialog, parent=self.parent)
+        if self.dialog is None:
+            self.dialog = QtWidgets.QInputDialog(parent=self.parent)
+        self.dialog.setLabelText("" if self.label is None else self.label)
+        self.dialog.setWindowTitle("" if self.title is None else self.title)
 
         # TODO: adjust so we can use a context manager?
         self.dialog.finished.connect(self.finished)
@@ -268,6 +548,7 @@ class TextInputDialog:
         if self.dialog is not None:
             self.dialog.close()
             self.dialog.finished.disconnect(self.finished)
+            _checkin(self.pool, self.dialog)
         self.dialog = None
         self.accept_button = None
         self.reject_button = None
@@ -281,9 +562,23 @@ class TextInputDialog:
                     "Dialog not assigned while it is being managed."
                 )
 
-            shown_event.set()
+            async with trio.open_nursery() as nursery:
+                if self.validator is not None:
+                    await nursery.start(
+                        functools.partial(
+                            _validate_input,
+                            dialog=self.dialog,
+                            accept_button=self.accept_button,
+                            parse=str,
+                            validator=self.validator,
+                            debounce=self.debounce,
+                        )
+                    )
 
-            await finished_event.wait()
+                shown_event.set()
+
+                await finished_event.wait()
+                nursery.cancel_scope.cancel()
 
             dialog_result = self.dialog.result()
 
@@ -303,6 +598,9 @@ def create_text_input_dialog(
     title: typing.Optional[str] = None,
     label: typing.Optional[str] = None,
     parent: typing.Optional[QtWidgets.QWidget] = None,
+    pool: typing.Optional[DialogPool] = None,
+    validator: typing.Optional[typing.Callable[[str], typing.Awaitable[bool]]] = None,
+    debounce: float = 0.25,
 ) -> TextInputDialog:
     """Create a text input dialog.
 
@@ -310,11 +608,29 @@ def create_text_input_dialog(
         title: The text to use for the input dialog title bar.
         label: The text to use for the input text box label.
         parent: See :attr:`qtrio.dialogs.IntegerDialog.parent`.
+        pool: See :attr:`qtrio.dialogs.TextInputDialog.pool`.
+        validator: See :attr:`qtrio.dialogs.TextInputDialog.validator`.
+        debounce: See :attr:`qtrio.dialogs.TextInputDialog.debounce`.
 
     Returns:
         The dialog manager.
     """
-    return TextInputDialog(title=title, label=label, parent=parent)
+    if _headless_backend is not None:
+        return typing.cast(
+            TextInputDialog,
+            _headless_backend.create(
+                kind="text_input", arguments={"title": title, "label": label}
+            ),
+        )
+
+    return TextInputDialog(
+        title=title,
+        label=label,
+        parent=parent,
+        pool=pool,
+        validator=validator,
+        debounce=debounce,
+    )
 
 
 @check_dialog_protocol
@@ -349,6 +665,18 @@ class FileDialog:
 
     result: typing.Optional[trio.Path] = None
     """The path selected by the user."""
+    pool: typing.Optional[DialogPool] = None
+    """The pool to take the dialog widget from and return it to."""
+    prefetch: bool = False
+    """When true, :meth:`wait` calls :meth:`prefetch_directories` before showing the
+    dialog.
+    """
+    prefetch_siblings: bool = False
+    """When true, :meth:`prefetch_directories` also lists the sibling directories of
+    :attr:`default_directory`.
+    """
+    prefetched: typing.Optional[typing.List[trio.Path]] = None
+    """The paths found by the most recent :meth:`prefetch_directories`."""
 
     shown = qtrio.Signal(QtWidgets.QFileDialog)
     """See :attr:`qtrio.dialogs.DialogProtocol.shown`."""
@@ -374,6 +702,26 @@ class FileDialog:
 
         self.file_name_line_edit.setText(path.name)
 
+    async def prefetch_directories(self) -> None:
+        """List and stat the entries of :attr:`default_directory`, and optionally its
+        siblings, in a worker thread.  This warms the operating system caches, such as
+        for network file systems, so the dialog's own enumeration on the GUI thread
+        does not block on slow file system access.  Entries that can not be accessed
+        are skipped.
+        """
+        if self.default_directory is None:
+            self.prefetched = []
+            return
+
+        self.prefetched = await trio.to_thread.run_sync(
+            functools.partial(
+                _scan_directory,
+                path=self.default_directory,
+                siblings=self.prefetch_siblings,
+            ),
+            cancellable=True,
+        )
+
     def setup(self) -> None:
         """See :meth:`qtrio.dialogs.BasicDialogProtocol.setup`."""
 
@@ -389,12 +737,18 @@ class FileDialog:
             # https://github.com/altendky/qtrio/issues/28
             options |= QtWidgets.QFileDialog.DontUseNativeDialog
 
-        # TODO: huh, so ``options`` is entirely undocumented...  and hints an ``Any``
-        #       return.
-        self.dialog = typing.cast(
-            QtWidgets.QFileDialog,
-            QtWidgets.QFileDialog(parent=self.parent, options=options, **extras),
-        )
+        self.dialog = _checkout(self.pool, QtWidgets.QFileDialog, parent=self.parent)
+        if self.dialog is None:
+            # TODO: huh, so ``options`` is entirely undocumented...  and hints an
+            #       ``Any`` return.
+            self.dialog = typing.cast(
+                QtWidgets.QFileDialog,
+                QtWidgets.QFileDialog(parent=self.parent, options=options, **extras),
+            )
+        else:
+            self.dialog.setOptions(options)
+            if "directory" in extras:
+                self.dialog.setDirectory(extras["directory"])
 
         if self.default_file is not None:
             self.dialog.selectFile(os.fspath(self.default_file))
@@ -420,6 +774,7 @@ class FileDialog:
         if self.dialog is not None:
             self.dialog.close()
             self.dialog.finished.disconnect(self.finished)
+            _checkin(self.pool, self.dialog)
         self.dialog = None
         self.accept_button = None
         self.reject_button = None
@@ -428,6 +783,9 @@ class FileDialog:
     async def wait(self, shown_event: trio.Event = trio.Event()) -> trio.Path:
         """See :meth:`qtrio.dialogs.DialogProtocol.wait`."""
 
+        if self.prefetch:
+            await self.prefetch_directories()
+
         with _manage(dialog=self) as finished_event:
             if self.dialog is None:  # pragma: no cover
                 raise qtrio.InternalError(
@@ -446,11 +804,66 @@ class FileDialog:
             return self.result
 
 
+def _scan_directory(path: trio.Path, siblings: bool) -> typing.List[trio.Path]:
+    """List and stat the entries of a directory and optionally of its siblings.
+
+    Arguments:
+        path: The directory to scan.
+        siblings: Also scan the other directories in the parent of ``path``.
+
+    Returns:
+        The paths of the entries that were successfully stat'ed.
+    """
+    directories = [os.fspath(path)]
+
+    if siblings:
+        parent = os.path.dirname(os.path.abspath(directories[0]))
+        directories.extend(
+            entry.path
+            for entry in _stat_entries(parent)
+            if entry.is_dir() and not os.path.samefile(entry.path, directories[0])
+        )
+
+    return [
+        trio.Path(entry.path)
+        for directory in directories
+        for entry in _stat_entries(directory)
+    ]
+
+
+def _stat_entries(directory: str) -> typing.List["os.DirEntry[str]"]:
+    """List the entries of a directory that can be stat'ed.
+
+    Arguments:
+        directory: The directory to list.
+
+    Returns:
+        The entries, or an empty list if the directory can not be listed.
+    """
+    entries = []
+
+    try:
+        with os.scandir(directory) as iterator:
+            for entry in iterator:
+                try:
+                    entry.stat()
+                except OSError:
+                    continue
+                entries.append(entry)
+    except OSError:
+        return []
+
+    return entries
+
+
 def create_file_save_dialog(
     parent: typing.Optional[QtWidgets.QWidget] = None,
     default_directory: typing.Optional[trio.Path] = None,
     default_file: typing.Optional[trio.Path] = None,
     options: QtWidgets.QFileDialog.Option = QtWidgets.QFileDialog.Option(),
+    pool: typing.Optional[DialogPool] = None,
+    prefetch: bool = False,
+    prefetch_siblings: bool = False,
 ) -> FileDialog:
     """Create a file save dialog.
 
@@ -459,12 +872,30 @@ def create_file_save_dialog(
         default_directory: See :attr:`qtrio.dialogs.FileDialog.default_directory`.
         default_file: See :attr:`qtrio.dialogs.FileDialog.default_file`.
         options: See :attr:`qtrio.dialogs.FileDialog.options`.
+        pool: See :attr:`qtrio.dialogs.FileDialog.pool`.
+        prefetch: See :attr:`qtrio.dialogs.FileDialog.prefetch`.
+        prefetch_siblings: See :attr:`qtrio.dialogs.FileDialog.prefetch_siblings`.
     """
+    if _headless_backend is not None:
+        return typing.cast(
+            FileDialog,
+            _headless_backend.create(
+                kind="file_save",
+                arguments={
+                    "default_directory": default_directory,
+                    "default_file": default_file,
+                },
+            ),
+        )
+
     return FileDialog(
         parent=parent,
         default_directory=default_directory,
         default_file=default_file,
         options=options,
+        pool=pool,
+        prefetch=prefetch,
+        prefetch_siblings=prefetch_siblings,
         file_mode=QtWidgets.QFileDialog.AnyFile,
         accept_mode=QtWidgets.QFileDialog.AcceptSave,
     )
@@ -475,6 +906,9 @@ def create_file_open_dialog(
     default_directory: typing.Optional[trio.Path] = None,
     default_file: typing.Optional[trio.Path] = None,
     options: QtWidgets.QFileDialog.Option = QtWidgets.QFileDialog.Option(),
+    pool: typing.Optional[DialogPool] = None,
+    prefetch: bool = False,
+    prefetch_siblings: bool = False,
 ) -> FileDialog:
     """Create a file open dialog.
 
@@ -483,12 +917,30 @@ def create_file_open_dialog(
         default_directory: See :attr:`qtrio.dialogs.FileDialog.default_directory`.
         default_file: See :attr:`qtrio.dialogs.FileDialog.default_file`.
         options: See :attr:`qtrio.dialogs.FileDialog.options`.
+        pool: See :attr:`qtrio.dialogs.FileDialog.pool`.
+        prefetch: See :attr:`qtrio.dialogs.FileDialog.prefetch`.
+        prefetch_siblings: See :attr:`qtrio.dialogs.FileDialog.prefetch_siblings`.
     """
+    if _headless_backend is not None:
+        return typing.cast(
+            FileDialog,
+            _headless_backend.create(
+                kind="file_open",
+                arguments={
+                    "default_directory": default_directory,
+                    "default_file": default_file,
+                },
+            ),
+        )
+
     return FileDialog(
         parent=parent,
         default_directory=default_directory,
         default_file=default_file,
         options=options,
+        pool=pool,
+        prefetch=prefetch,
+        prefetch_siblings=prefetch_siblings,
         file_mode=QtWidgets.QFileDialog.AnyFile,
         accept_mode=QtWidgets.QFileDialog.AcceptOpen,
     )
@@ -525,6 +977,10 @@ class MessageBox:
 
     result: typing.Optional[trio.Path] = None
     """Not generally relevant for a message box."""
+    pool: typing.Optional[DialogPool] = None
+    """The pool to take the dialog widget from and return it to."""
+    detailed_text: str = ""
+    """Text shown in an expandable details area.  No details area is shown if empty."""
 
     shown = qtrio.Signal(QtWidgets.QMessageBox)
     """See :attr:`qtrio.dialogs.DialogProtocol.shown`."""
@@ -536,13 +992,22 @@ class MessageBox:
 
         self.result = None
 
-        self.dialog = QtWidgets.QMessageBox(
-            self.icon,
-            self.title,
-            self.text,
-            self.buttons,
-            self.parent,
-        )
+        self.dialog = _checkout(self.pool, QtWidgets.QMessageBox, parent=self.parent)
+        if self.dialog is None:
+            self.dialog = QtWidgets.QMessageBox(
+                self.icon,
+                self.title,
+                self.text,
+                self.buttons,
+                self.parent,
+            )
+        else:
+            self.dialog.setIcon(self.icon)
+            self.dialog.setWindowTitle(self.title)
+            self.dialog.setText(self.text)
+            self.dialog.setStandardButtons(self.buttons)
+
+        self.dialog.setDetailedText(self.detailed_text)
 
         # TODO: adjust so we can use a context manager?
         self.dialog.finished.connect(self.finished)
@@ -559,6 +1024,8 @@ class MessageBox:
 
         if self.dialog is not None:
             self.dialog.close()
+            self.dialog.finished.disconnect(self.finished)
+            _checkin(self.pool, self.dialog)
         self.dialog = None
         self.accept_button = None
 
@@ -587,6 +1054,8 @@ def create_message_box(
     icon: QtWidgets.QMessageBox.Icon = QtWidgets.QMessageBox.Information,
     buttons: message_box_standard_button_union = QtWidgets.QMessageBox.Ok,
     parent: typing.Optional[QtWidgets.QWidget] = None,
+    pool: typing.Optional[DialogPool] = None,
+    detailed_text: str = "",
 ) -> MessageBox:
     """Create a message box.
 
@@ -596,8 +1065,301 @@ def create_message_box(
         icon: See :attr:`qtrio.dialogs.MessageBox.icon`.
         buttons: See :attr:`qtrio.dialogs.MessageBox.buttons`.
         parent: See :attr:`qtrio.dialogs.MessageBox.parent`.
+        pool: See :attr:`qtrio.dialogs.MessageBox.pool`.
+        detailed_text: See :attr:`qtrio.dialogs.MessageBox.detailed_text`.
+    """
+    if _headless_backend is not None:
+        return typing.cast(
+            MessageBox,
+            _headless_backend.create(
+                kind="message_box",
+                arguments={
+                    "title": title,
+                    "text": text,
+                    "detailed_text": detailed_text,
+                },
+            ),
+        )
+
+    return MessageBox(
+        icon=icon,
+        title=title,
+        text=text,
+        buttons=buttons,
+        parent=parent,
+        pool=pool,
+        detailed_text=detailed_text,
+    )
+
+
+@attr.s(auto_attribs=True, eq=False)
+class MessageQueue:
+    """Show queued messages to the user, coalescing those arriving close together into a
+    single message box.  Messages are buffered in a bounded channel so a burst of
+    failures can not exhaust memory.  Messages that do not fit are dropped and counted.
+    Generally instances should be created via :func:`qtrio.dialogs.open_message_queue`.
+    """
+
+    title: str = ""
+    """The message box title."""
+    icon: QtWidgets.QMessageBox.Icon = QtWidgets.QMessageBox.Information
+    """The icon shown inside the message box."""
+    window: float = 0.5
+    """Seconds to wait for more messages after the first before showing them."""
+    max_buffer_size: int = 1000
+    """The maximum number of messages waiting to be shown."""
+    max_details: int = 100
+    """The maximum number of messages listed in the details of a single message
+    box.
+    """
+    parent: typing.Optional[QtWidgets.QWidget] = None
+    """The parent widget for the message boxes."""
+    pool: typing.Optional[DialogPool] = None
+    """The pool to take the message box widgets from and return them to."""
+
+    message_box: typing.Optional[MessageBox] = None
+    """The message box presently shown, if any."""
+    dropped: int = 0
+    """The number of messages dropped since the last message box was shown."""
+
+    shown = qtrio.Signal(object)
+    """Emitted with the :class:`qtrio.dialogs.MessageBox` when it is shown."""
+
+    _send_channel: trio.MemorySendChannel = attr.ib(init=False)
+    _receive_channel: trio.MemoryReceiveChannel = attr.ib(init=False)
+
+    def __attrs_post_init__(self) -> None:
+        self._send_channel, self._receive_channel = trio.open_memory_channel(
+            self.max_buffer_size
+        )
+
+    def send(self, text: str) -> None:
+        """Queue a message to be shown.  This never blocks.
+
+        Arguments:
+            text: The message.
+        """
+        try:
+            self._send_channel.send_nowait(text)
+        except trio.WouldBlock:
+            self.dropped += 1
+
+    async def serve(
+        self, *, task_status: trio_typing.TaskStatus[None] = trio.TASK_STATUS_IGNORED
+    ) -> None:
+        """Show the queued messages until cancelled.  Messages that arrive while a
+        message box is shown are coalesced into the next one.
+        """
+        task_status.started()
+
+        async for first in self._receive_channel:
+            messages = [first]
+
+            with trio.move_on_after(self.window):
+                async for message in self._receive_channel:
+                    messages.append(message)
+
+            while True:
+                try:
+                    messages.append(self._receive_channel.receive_nowait())
+                except trio.WouldBlock:
+                    break
+
+            dropped = self.dropped
+            self.dropped = 0
+
+            self.message_box = self._create_message_box(
+                messages=messages, dropped=dropped
+            )
+
+            try:
+                with qtrio._qt.connection(
+                    signal=self.message_box.shown,
+                    slot=lambda *args: self.shown.emit(self.message_box),
+                ):
+                    with contextlib.suppress(qtrio.UserCancelledError):
+                        await self.message_box.wait()
+            finally:
+                self.message_box = None
+
+    def _create_message_box(
+        self, messages: typing.List[str], dropped: int
+    ) -> MessageBox:
+        if len(messages) == 1 and dropped == 0:
+            return create_message_box(
+                title=self.title,
+                text=messages[0],
+                icon=self.icon,
+                parent=self.parent,
+                pool=self.pool,
+            )
+
+        count = len(messages) + dropped
+        details = messages[: self.max_details]
+        not_detailed = count - len(details)
+        if not_detailed > 0:
+            details.append(f"... and {not_detailed} more")
+
+        return create_message_box(
+            title=self.title,
+            text=f"{count} messages, the first being:\n\n{messages[0]}",
+            icon=self.icon,
+            parent=self.parent,
+            pool=self.pool,
+            detailed_text="\n\n".join(details),
+        )
+
+
+@async_generator.asynccontextmanager
+async def open_message_queue(
+    title: str = "",
+    icon: QtWidgets.QMessageBox.Icon = QtWidgets.QMessageBox.Information,
+    window: float = 0.5,
+    max_buffer_size: int = 1000,
+    max_details: int = 100,
+    parent: typing.Optional[QtWidgets.QWidget] = None,
+    pool: typing.Optional[DialogPool] = None,
+) -> typing.AsyncIterator[MessageQueue]:
+    """Create a message queue and serve it for the duration of the context manager.
+    Messages not yet shown, and any message box still shown, are discarded on exit.
+
+    Arguments:
+        title: See :attr:`qtrio.dialogs.MessageQueue.title`.
+        icon: See :attr:`qtrio.dialogs.MessageQueue.icon`.
+        window: See :attr:`qtrio.dialogs.MessageQueue.window`.
+        max_buffer_size: See :attr:`qtrio.dialogs.MessageQueue.max_buffer_size`.
+        max_details: See :attr:`qtrio.dialogs.MessageQueue.max_details`.
+        parent: See :attr:`qtrio.dialogs.MessageQueue.parent`.
+        pool: See :attr:`qtrio.dialogs.MessageQueue.pool`.
+    """
+    message_queue = MessageQueue(
+        title=title,
+        icon=icon,
+        window=window,
+        max_buffer_size=max_buffer_size,
+        max_details=max_details,
+        parent=parent,
+        pool=pool,
+    )
+
+    async with trio.open_nursery() as nursery:
+        await nursery.start(message_queue.serve)
+        yield message_queue
+        nursery.cancel_scope.cancel()
+
+
+@attr.s(auto_attribs=True, eq=False)
+class ProgressReporter:
+    """Accept progress updates at any rate and apply them to a progress dialog widget at
+    most once per frame.  Updating only records the values so hot loops never touch Qt
+    directly.  Generally instances are provided by
+    :meth:`qtrio.dialogs.ProgressDialog.manage`.
+    """
+
+    dialog: typing.Optional[QtWidgets.QProgressDialog]
+    """The widget to apply the updates to.  When :obj:`None` the updates are only
+    recorded, such as for headless dialogs.
     """
-    return MessageBox(icon=icon, title=title, text=text, buttons=buttons, parent=parent)
+    fps: float = 60
+    """The maximum number of times per second to apply updates to the widget."""
+    clock: typing.Callable[[], float] = time.monotonic
+    """The clock used to calculate the throughput and ETA."""
+
+    value: typing.Optional[int] = None
+    """The most recent progress value."""
+    maximum: typing.Optional[int] = None
+    """The most recent maximum progress value, if updated."""
+    applied_count: int = 0
+    """The number of times updates have been applied to the widget."""
+
+    _start: typing.Optional[typing.Tuple[float, int]] = None
+    _pending: bool = False
+    _timer: typing.Optional[QtCore.QTimer] = None
+
+    def update(self, value: int, maximum: typing.Optional[int] = None) -> None:
+        """Record the progress to be applied to the widget on the next frame.
+
+        Arguments:
+            value: The present progress value.
+            maximum: The new maximum progress value, if changed.
+        """
+        if self._start is None:
+            self._start = (self.clock(), value)
+
+        self.value = value
+        if maximum is not None:
+            self.maximum = maximum
+
+        if self._pending or self.dialog is None:
+            return
+
+        self._pending = True
+
+        if self._timer is None:
+            self._timer = QtCore.QTimer(self.dialog)
+            self._timer.setSingleShot(True)
+            self._timer.setInterval(round(1000 / self.fps))
+            self._timer.timeout.connect(self.apply)
+
+        self._timer.start()
+
+    def apply(self) -> None:
+        """Apply any pending update to the widget immediately."""
+        if not self._pending or self.dialog is None:
+            return
+
+        self._pending = False
+        self.applied_count += 1
+
+        if self.maximum is not None and self.dialog.maximum() != self.maximum:
+            self.dialog.setMaximum(self.maximum)
+        if self.value is not None:
+            self.dialog.setValue(self.value)
+
+    def close(self) -> None:
+        """Apply any pending update and stop the frame timer."""
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer.timeout.disconnect(self.apply)
+            self._timer = None
+
+        self.apply()
+
+    def throughput(self) -> typing.Optional[float]:
+        """Calculate the average progress per second since the first update.
+
+        Returns:
+            The throughput, or :obj:`None` if no time has passed yet.
+        """
+        if self._start is None or self.value is None:
+            return None
+
+        start_time, start_value = self._start
+        duration = self.clock() - start_time
+        if duration <= 0:
+            return None
+
+        return (self.value - start_value) / duration
+
+    def eta(self) -> typing.Optional[float]:
+        """Estimate the seconds remaining until the maximum is reached at the average
+        throughput.
+
+        Returns:
+            The estimate, or :obj:`None` if the maximum or throughput is not known.
+        """
+        throughput = self.throughput()
+
+        if (
+            throughput is None
+            or throughput <= 0
+            or self.maximum is None
+            or self.maximum <= 0
+            or self.value is None
+        ):
+            return None
+
+        return max(0, self.maximum - self.value) / throughput
 
 
 @check_basic_dialog_protocol
@@ -625,6 +1387,14 @@ class ProgressDialog:
     """The actual dialog widget instance."""
     cancel_button: typing.Optional[QtWidgets.QPushButton] = None
     """The cancellation button."""
+    pool: typing.Optional[DialogPool] = None
+    """The pool to take the dialog widget from and return it to."""
+    fps: float = 60
+    """The maximum number of times per second that updates from the reporter are
+    applied to the widget.
+    """
+    reporter: typing.Optional[ProgressReporter] = None
+    """The reporter while the dialog is managed by :meth:`manage`."""
 
     shown = qtrio.Signal(QtWidgets.QMessageBox)
     """See :attr:`qtrio.dialogs.DialogProtocol.shown`."""
@@ -634,7 +1404,9 @@ class ProgressDialog:
     def setup(self) -> None:
         """See :meth:`qtrio.dialogs.BasicDialogProtocol.setup`."""
 
-        self.dialog = QtWidgets.QProgressDialog()
+        self.dialog = _checkout(self.pool, QtWidgets.QProgressDialog)
+        if self.dialog is None:
+            self.dialog = QtWidgets.QProgressDialog()
         self.dialog.setWindowTitle(self.title)
         self.dialog.setLabelText(self.text)
         self.dialog.setMinimum(self.minimum)
@@ -660,13 +1432,16 @@ class ProgressDialog:
         if self.dialog is not None:
             self.dialog.close()
             self.dialog.finished.disconnect(self.finished)
+            _checkin(self.pool, self.dialog)
         self.dialog = None
         self.cancel_button = None
 
     @async_generator.asynccontextmanager
-    async def manage(self) -> typing.AsyncIterator[None]:
+    async def manage(self) -> typing.AsyncIterator[ProgressReporter]:
         """A context manager to setup the progress dialog, cancel the managed context
-        and teardown the dialog when done.
+        and teardown the dialog when done.  The yielded reporter accepts progress
+        updates at any rate and applies them to the widget at most :attr:`fps` times
+        per second.
         """
         with _manage(dialog=self):
             if self.dialog is None:  # pragma: no cover
@@ -674,11 +1449,17 @@ class ProgressDialog:
                     "Dialog not assigned while it is being managed."
                 )
 
-            with trio.CancelScope() as cancel_scope:
-                with qtrio._qt.connection(
-                    signal=self.dialog.canceled, slot=cancel_scope.cancel
-                ):
-                    yield
+            self.reporter = ProgressReporter(dialog=self.dialog, fps=self.fps)
+
+            try:
+                with trio.CancelScope() as cancel_scope:
+                    with qtrio._qt.connection(
+                        signal=self.dialog.canceled, slot=cancel_scope.cancel
+                    ):
+                        yield self.reporter
+            finally:
+                self.reporter.close()
+                self.reporter = None
 
             if self.dialog.wasCanceled():
                 raise qtrio.UserCancelledError()
@@ -691,6 +1472,8 @@ def create_progress_dialog(
     minimum: int = 0,
     maximum: int = 0,
     parent: typing.Optional[QtWidgets.QWidget] = None,
+    pool: typing.Optional[DialogPool] = None,
+    fps: float = 60,
 ) -> ProgressDialog:
     """Create a progress dialog.
 
@@ -701,7 +1484,18 @@ def create_progress_dialog(
         minimum: See :attr:`qtrio.dialogs.ProgressDialog.minimum`.
         maximum: See :attr:`qtrio.dialogs.ProgressDialog.maximum`.
         parent: See :attr:`qtrio.dialogs.ProgressDialog.parent`.
+        pool: See :attr:`qtrio.dialogs.ProgressDialog.pool`.
+        fps: See :attr:`qtrio.dialogs.ProgressDialog.fps`.
     """
+    if _headless_backend is not None:
+        return typing.cast(
+            ProgressDialog,
+            HeadlessProgressDialog(
+                arguments={"title": title, "text": text},
+                backend=_headless_backend,
+            ),
+        )
+
     return ProgressDialog(
         title=title,
         text=text,
@@ -709,4 +1503,200 @@ def create_progress_dialog(
         minimum=minimum,
         maximum=maximum,
         parent=parent,
+        pool=pool,
+        fps=fps,
     )
+
+
+@attr.s(auto_attribs=True, eq=False)
+class HeadlessDialog:
+    """A widget-free dialog answered by the responder of a
+    :class:`qtrio.dialogs.HeadlessBackend`.  While a backend is in use via
+    :func:`qtrio.dialogs.use_headless_backend` the creation functions return these in
+    place of the regular dialogs.  Attributes such as ``title`` may be assigned as with
+    the regular dialogs and are available to the responder.
+    """
+
+    kind: str
+    """The kind of dialog such as ``"integer"``, ``"text_input"``, ``"file_save"``,
+    ``"file_open"`` or ``"message_box"``.
+    """
+    arguments: typing.Dict[str, object]
+    """The arguments passed to the creation function."""
+    backend: "HeadlessBackend"
+    """The backend which will answer the dialog."""
+
+    dialog: None = None
+    """There is no widget."""
+    result: typing.Any = None
+    """The response once answered."""
+
+    shown = qtrio.Signal(object)
+    """See :attr:`qtrio.dialogs.DialogProtocol.shown`.  Emitted with this object."""
+    finished = qtrio.Signal(int)
+    """See :attr:`qtrio.dialogs.BasicDialogProtocol.finished`."""
+
+    def setup(self) -> None:
+        """See :meth:`qtrio.dialogs.BasicDialogProtocol.setup`."""
+        self.result = None
+        self.shown.emit(self)
+
+    def teardown(self) -> None:
+        """See :meth:`qtrio.dialogs.BasicDialogProtocol.teardown`."""
+
+    async def wait(self, shown_event: trio.Event = trio.Event()) -> typing.Any:
+        """See :meth:`qtrio.dialogs.DialogProtocol.wait`.  The response from the
+        responder is returned, or raised if it is an exception.  File dialog responses
+        are converted to :class:`trio.Path`.
+        """
+        self.setup()
+
+        try:
+            shown_event.set()
+
+            response = self.backend.responder(self)
+            if inspect.isawaitable(response):
+                response = await response
+
+            if isinstance(response, BaseException) or (
+                isinstance(response, type) and issubclass(response, BaseException)
+            ):
+                raise response
+
+            if self.kind in {"file_save", "file_open"}:
+                response = trio.Path(typing.cast(str, response))
+
+            self.result = response
+            self.finished.emit(QtWidgets.QDialog.Accepted)
+
+            return response
+        finally:
+            self.teardown()
+
+
+@attr.s(auto_attribs=True, eq=False)
+class HeadlessProgressDialog:
+    """A widget-free progress dialog.  The responder is not consulted and the dialog is
+    never cancelled.  See :class:`qtrio.dialogs.HeadlessDialog`.
+    """
+
+    arguments: typing.Dict[str, object]
+    """The arguments passed to the creation function."""
+    backend: "HeadlessBackend"
+    """The backend which created the dialog."""
+
+    dialog: None = None
+    """There is no widget."""
+    cancel_button: None = None
+    """There is no widget."""
+    reporter: typing.Optional[ProgressReporter] = None
+    """The reporter while the dialog is managed by :meth:`manage`."""
+
+    shown = qtrio.Signal(object)
+    """See :attr:`qtrio.dialogs.DialogProtocol.shown`.  Emitted with this object."""
+    finished = qtrio.Signal(int)
+    """See :attr:`qtrio.dialogs.BasicDialogProtocol.finished`."""
+
+    def setup(self) -> None:
+        """See :meth:`qtrio.dialogs.BasicDialogProtocol.setup`."""
+        self.shown.emit(self)
+
+    def teardown(self) -> None:
+        """See :meth:`qtrio.dialogs.BasicDialogProtocol.teardown`."""
+
+    @async_generator.asynccontextmanager
+    async def manage(self) -> typing.AsyncIterator[ProgressReporter]:
+        """See :meth:`qtrio.dialogs.ProgressDialog.manage`.  The reporter only records
+        the updates.
+        """
+        self.setup()
+
+        try:
+            self.reporter = ProgressReporter(dialog=None)
+            yield self.reporter
+        finally:
+            self.reporter = None
+            self.teardown()
+
+
+check_dialog_protocol(HeadlessDialog)
+check_basic_dialog_protocol(HeadlessProgressDialog)
+
+
+@attr.s(auto_attribs=True, eq=False)
+class HeadlessBackend:
+    """Answer dialogs without widgets, such as for automation and benchmarks."""
+
+    responder: typing.Callable[[HeadlessDialog], object]
+    """Called with each dialog as it is waited on.  It returns the response, an
+    exception to raise such as :class:`qtrio.UserCancelledError`, or an awaitable for
+    either.
+    """
+    created_count: int = 0
+    """The number of dialogs created."""
+
+    def create(self, kind: str, arguments: typing.Dict[str, object]) -> HeadlessDialog:
+        """Create a headless dialog.
+
+        Arguments:
+            kind: See :attr:`qtrio.dialogs.HeadlessDialog.kind`.
+            arguments: See :attr:`qtrio.dialogs.HeadlessDialog.arguments`.
+
+        Returns:
+            The new dialog.
+        """
+        self.created_count += 1
+
+        return HeadlessDialog(kind=kind, arguments=arguments, backend=self)
+
+
+def scripted_responder(
+    responses: typing.Iterable[object],
+) -> typing.Callable[[HeadlessDialog], object]:
+    """Create a responder answering dialogs with the given responses in order.
+
+    Arguments:
+        responses: The responses, including exceptions to be raised.
+
+    Returns:
+        The responder.
+    """
+    iterator = iter(responses)
+
+    def respond(dialog: HeadlessDialog) -> object:
+        try:
+            return next(iterator)
+        except StopIteration:
+            raise qtrio.HeadlessScriptExhaustedError(
+                f"No scripted response left for {dialog.kind} dialog."
+            ) from None
+
+    return respond
+
+
+_headless_backend: typing.Optional[HeadlessBackend] = None
+
+
+@contextlib.contextmanager
+def use_headless_backend(
+    responder: typing.Callable[[HeadlessDialog], object],
+) -> typing.Generator[HeadlessBackend, None, None]:
+    """Make the dialog creation functions return headless dialogs answered by
+    ``responder`` for the duration of the context manager.
+
+    Arguments:
+        responder: See :attr:`qtrio.dialogs.HeadlessBackend.responder`.
+
+    Yields:
+        The backend answering the dialogs.
+    """
+    global _headless_backend
+
+    previous = _headless_backend
+    backend = HeadlessBackend(responder=responder)
+    _headless_backend = backend
+
+    try:
+        yield backend
+    finally:
+        _headless_backend = previous
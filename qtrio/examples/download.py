@@ -2,14 +2,22 @@
 integration with Qt.
 """
 import contextlib
+import errno
 import functools
+import hashlib
+import heapq
+import itertools
+import json
 import math
+import mmap
 import os
+import queue
+import threading
 import time
 import typing
 
+import async_generator
 import attr
-import httpcore._async.http11
 import httpx
 import hyperlink
 import trio
@@ -19,9 +27,6 @@ import qtrio
 import qtrio.dialogs
 
 
-# Default is 4096
-httpcore._async.http11.AsyncHTTP11Connection.READ_NUM_BYTES = 100_000
-
 default_fps: int = 60
 
 
@@ -34,6 +39,25 @@ class Progress:
     downloaded: int
     first: bool
     total: typing.Optional[int] = None
+    digests: typing.Optional[typing.Mapping[str, str]] = None
+    """The hexadecimal digests by hash name, in the final progress when hashing."""
+    verified: typing.Optional[bool] = None
+    """Whether the digests matched those expected, in the final progress when any were
+    expected.
+    """
+
+
+@attr.s(auto_attribs=True, slots=True, eq=False)
+class ProgressCounter:
+    """The live progress of a download, updated in place for every chunk so the
+    download loop never builds progress objects or waits on a consumer.  Sample it
+    from another task at whatever rate suits the display.
+    """
+
+    downloaded: int = 0
+    """The bytes downloaded so far, including any that were resumed."""
+    total: typing.Optional[int] = None
+    """The total bytes once known from the response, otherwise :obj:`None`."""
 
 
 @attr.s(auto_attribs=True, eq=False)
@@ -140,6 +164,9 @@ class GetDialog:
     fps: float = default_fps
     clock: typing.Callable[[], float] = time.monotonic
     http_application: typing.Optional[typing.Callable[..., typing.Any]] = None
+    connections: int = 1
+    rate_limiter: typing.Optional["TokenBucket"] = None
+    chunk_sizer: typing.Optional["ChunkSizer"] = None
 
     progress_dialog: typing.Optional[qtrio.dialogs.ProgressDialog] = None
     message_box: typing.Optional[qtrio.dialogs.MessageBox] = None
@@ -152,41 +179,42 @@ class GetDialog:
         url: hyperlink.URL,
         destination: trio.Path,
     ) -> None:
-        self.progress_dialog = qtrio.dialogs.create_progress_dialog()
+        self.progress_dialog = qtrio.dialogs.create_progress_dialog(fps=self.fps)
 
         self.progress_dialog.title = create_title("Fetching")
         self.progress_dialog.text = f"Fetching {url}..."
 
-        async with self.progress_dialog.manage():
-            if self.progress_dialog.dialog is None:  # pragma: no cover
-                raise qtrio.InternalError(
-                    "Dialog not assigned while it is being managed."
-                )
-
-            # Always show the dialog
-            self.progress_dialog.dialog.setMinimumDuration(0)
+        async with self.progress_dialog.manage() as reporter:
+            # headless dialogs have no widget
+            if self.progress_dialog.dialog is not None:
+                # Always show the dialog
+                self.progress_dialog.dialog.setMinimumDuration(0)
             self.progress_dialog_shown_event.set()
 
+            counter = ProgressCounter()
             start = self.clock()
 
-            async for progress in get(
-                url=url,
-                destination=destination,
-                update_period=1 / self.fps,
-                clock=self.clock,
-                http_application=self.http_application,
-            ):
-                if progress.first:
-                    if progress.total is None:
-                        maximum = 0
-                    else:
-                        maximum = progress.total
-
-                    self.progress_dialog.dialog.setMaximum(maximum)
-                    self.progress_dialog.dialog.setValue(0)
-
-                if progress.total is not None:
-                    self.progress_dialog.dialog.setValue(progress.downloaded)
+            async with trio.open_nursery() as nursery:
+                # the download only updates the counter so a slow repaint never
+                # holds up reading from the network
+                nursery.start_soon(self._sample, counter, reporter)
+
+                async for _ in get(
+                    url=url,
+                    destination=destination,
+                    update_period=math.inf,
+                    clock=self.clock,
+                    http_application=self.http_application,
+                    connections=self.connections,
+                    rate_limiter=self.rate_limiter,
+                    chunk_sizer=self.chunk_sizer,
+                    counter=counter,
+                ):
+                    pass
+
+                nursery.cancel_scope.cancel()
+
+            _report(counter=counter, reporter=reporter)
 
             end = self.clock()
 
@@ -195,18 +223,18 @@ class GetDialog:
         duration = end - start
         if duration == 0:
             # define this seems to happen when testing on Windows with an x86 Python
-            if progress.downloaded > 0:
+            if counter.downloaded > 0:
                 bytes_per_second = math.inf
             else:  # pragma: no cover
                 bytes_per_second = 0
         else:
-            bytes_per_second = progress.downloaded / duration
+            bytes_per_second = counter.downloaded / duration
 
         summary = "\n\n".join(
             [
                 url.asText(),
                 os.fspath(destination),
-                f"Downloaded {progress.downloaded} bytes in {duration:.2f} seconds",
+                f"Downloaded {counter.downloaded} bytes in {duration:.2f} seconds",
                 f"{bytes_per_second:.2f} bytes/second",
             ]
         )
@@ -220,6 +248,21 @@ class GetDialog:
 
         self.message_box = None
 
+    async def _sample(
+        self, counter: ProgressCounter, reporter: qtrio.dialogs.ProgressReporter
+    ) -> None:
+        while True:
+            _report(counter=counter, reporter=reporter)
+            await trio.sleep(1 / self.fps)
+
+
+def _report(counter: ProgressCounter, reporter: qtrio.dialogs.ProgressReporter) -> None:
+    if counter.total is None:
+        # unknown lengths show a busy indicator
+        reporter.update(value=0, maximum=0)
+    else:
+        reporter.update(value=counter.downloaded, maximum=counter.total)
+
 
 async def start_get_dialog(
     url: hyperlink.URL,
@@ -227,11 +270,20 @@ async def start_get_dialog(
     fps: float = default_fps,
     http_application: typing.Optional[typing.Callable[..., typing.Any]] = None,
     hold_event: typing.Optional[trio.Event] = None,
+    connections: int = 1,
+    rate_limiter: typing.Optional["TokenBucket"] = None,
+    chunk_sizer: typing.Optional["ChunkSizer"] = None,
     *,
     cls: typing.Type[GetDialog] = GetDialog,
     task_status: trio_typing.TaskStatus[GetDialog] = trio.TASK_STATUS_IGNORED,
 ) -> None:
-    self = cls(fps=fps, http_application=http_application)
+    self = cls(
+        fps=fps,
+        http_application=http_application,
+        connections=connections,
+        rate_limiter=rate_limiter,
+        chunk_sizer=chunk_sizer,
+    )
 
     task_status.started(self)
 
@@ -241,47 +293,1511 @@ async def start_get_dialog(
     await self.serve(url=url, destination=destination)
 
 
+@async_generator.asynccontextmanager
+async def _open_client(**kwargs: typing.Any) -> typing.AsyncIterator[httpx.AsyncClient]:
+    client = httpx.AsyncClient(**kwargs)
+
+    try:
+        yield client
+    finally:
+        # a cancelled close leaves the pooled sockets open
+        with trio.CancelScope(shield=True):
+            await client.aclose()
+
+
+@attr.s(auto_attribs=True, eq=False)
+class ChunkSizer:
+    """Choose the size of the chunks a download hands on to writing and progress
+    reporting so that each takes about :attr:`period` at the observed throughput.  Slow
+    downloads keep small chunks for responsive progress while fast downloads get large
+    chunks to reduce the per chunk overhead.  The parts of a ranged download share
+    their download's sizer.
+    """
+
+    minimum: int = 16_384
+    """The smallest chunk size."""
+    maximum: int = 4_194_304
+    """The largest chunk size."""
+    period: float = 0.05
+    """The targeted seconds of transfer per chunk."""
+
+    size: int = attr.ib()
+    """The present chunk size."""
+    throughput: typing.Optional[float] = None
+    """The smoothed observed bytes per second, once observed."""
+
+    @size.default
+    def _size_default(self) -> int:
+        return self.minimum
+
+    def observe(self, count: int, duration: float) -> None:
+        """Update the chunk size given the time to receive a chunk.
+
+        Arguments:
+            count: The bytes received.
+            duration: The seconds taken to receive them.
+        """
+        if duration <= 0:
+            # faster than the clock can tell
+            self.size = min(self.maximum, 2 * self.size)
+            return
+
+        rate = count / duration
+        if self.throughput is None:
+            self.throughput = rate
+        else:
+            self.throughput = (self.throughput + rate) / 2
+
+        size = round(self.throughput * self.period)
+        self.size = max(self.minimum, min(self.maximum, size))
+
+
+async def _sized_chunks(
+    raw_chunks: typing.AsyncIterable[bytes],
+    sizer: ChunkSizer,
+    clock: typing.Callable[[], float],
+) -> typing.AsyncIterator[bytes]:
+    buffer = bytearray()
+    start = clock()
+
+    async for raw_chunk in raw_chunks:
+        if len(buffer) == 0 and len(raw_chunk) >= sizer.size:
+            # already large enough, skip the copy
+            chunk = raw_chunk
+        else:
+            buffer += raw_chunk
+            if len(buffer) < sizer.size:
+                continue
+
+            chunk = bytes(buffer)
+            buffer.clear()
+
+        now = clock()
+        sizer.observe(count=len(chunk), duration=now - start)
+        start = now
+
+        yield chunk
+
+    if len(buffer) > 0:
+        yield bytes(buffer)
+
+
+@attr.s(auto_attribs=True, eq=False)
+class Hasher:
+    """Compute :mod:`hashlib` hashes of data in a worker thread as it arrives.
+    Generally created by :func:`open_hasher`.
+    """
+
+    names: typing.Sequence[str]
+    """The names of the hashes to compute, as accepted by :func:`hashlib.new`."""
+    max_buffered_chunks: int = 16
+    """The chunks queued for hashing before :meth:`update` waits."""
+
+    hashes: typing.Dict[str, "hashlib._Hash"] = attr.ib(init=False)
+    _send_channel: trio.MemorySendChannel = attr.ib(init=False)
+    _receive_channel: trio.MemoryReceiveChannel = attr.ib(init=False)
+    _done_event: trio.Event = attr.ib(factory=trio.Event, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        self.hashes = {name: hashlib.new(name) for name in self.names}
+        self._send_channel, self._receive_channel = trio.open_memory_channel[
+            typing.Union[bytes, typing.Tuple[trio.Path, int]]
+        ](self.max_buffered_chunks)
+
+    def _update(self, data: bytes) -> None:
+        # hashlib releases the GIL for large data
+        for hash in self.hashes.values():
+            hash.update(data)
+
+    def _update_from_file(self, path: trio.Path, size: int) -> None:
+        remaining = size
+
+        with open(path, "rb") as file:
+            while remaining > 0:
+                data = file.read(min(remaining, 1_048_576))
+                if len(data) == 0:
+                    raise EOFError(f"{path} is shorter than {size} bytes.")
+
+                self._update(data)
+                remaining -= len(data)
+
+    async def serve(self) -> None:
+        """Hash the queued data until :meth:`digests` is called."""
+        async with self._receive_channel:
+            async for item in self._receive_channel:
+                if isinstance(item, bytes):
+                    await trio.to_thread.run_sync(self._update, item)
+                else:
+                    await trio.to_thread.run_sync(self._update_from_file, *item)
+
+        self._done_event.set()
+
+    async def update(self, data: bytes) -> None:
+        """Queue the data to be hashed.
+
+        Arguments:
+            data: The data following that already queued.
+        """
+        await self._send_channel.send(data)
+
+    async def update_from_file(self, path: trio.Path, size: int) -> None:
+        """Hash the start of a file, after the data already queued.
+
+        Arguments:
+            path: The file to read.
+            size: The number of bytes to hash.
+        """
+        await self._send_channel.send((path, size))
+
+    async def digests(self) -> typing.Dict[str, str]:
+        """Finish hashing the queued data.
+
+        Returns:
+            The hexadecimal digests by hash name.
+        """
+        await self._send_channel.aclose()
+        await self._done_event.wait()
+
+        return {name: hash.hexdigest() for name, hash in self.hashes.items()}
+
+
+@async_generator.asynccontextmanager
+async def open_hasher(
+    names: typing.Sequence[str], max_buffered_chunks: int = 16
+) -> typing.AsyncIterator[Hasher]:
+    """Serve a :class:`Hasher` for the duration of the context manager.
+
+    Arguments:
+        names: See :attr:`Hasher.names`.
+        max_buffered_chunks: See :attr:`Hasher.max_buffered_chunks`.
+    """
+    hasher = Hasher(names=names, max_buffered_chunks=max_buffered_chunks)
+
+    async with trio.open_nursery() as nursery:
+        nursery.start_soon(hasher.serve)
+
+        try:
+            yield hasher
+        finally:
+            await hasher._send_channel.aclose()
+
+
+@attr.s(auto_attribs=True, eq=False)
+class TokenBucket:
+    """Limit the combined bandwidth of the downloads sharing it.  Tokens, one per byte,
+    accumulate at :attr:`rate` up to :attr:`burst` seconds worth.  Each received chunk
+    consumes its size in tokens, possibly going into debt, and waits until the debt is
+    repaid.  The rate can be changed at any time, such as from the UI, via
+    :meth:`set_rate`.
+    """
+
+    rate: float
+    """The bytes per second.  :obj:`math.inf` is unlimited and zero pauses."""
+    burst: float = 1
+    """The seconds of :attr:`rate` that may accumulate while idle."""
+    clock: typing.Callable[[], float] = trio.current_time
+    """The clock to measure the refill with.  It should follow the Trio clock, as the
+    default does, so a :class:`trio.testing.MockClock` controls it.
+    """
+
+    tokens: float = attr.ib(init=False)
+    """The presently available bytes.  Negative while in debt."""
+    _updated: float = attr.ib(init=False)
+    _rate_changed: trio.Event = attr.ib(factory=trio.Event, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        self.tokens = self.capacity()
+        self._updated = self.clock()
+
+    def capacity(self) -> float:
+        """The most tokens that can accumulate at the present rate."""
+        return self.rate * self.burst
+
+    def _refill(self) -> None:
+        now = self.clock()
+        elapsed = now - self._updated
+        self._updated = now
+
+        if elapsed > 0 and self.rate > 0:
+            self.tokens = min(self.capacity(), self.tokens + self.rate * elapsed)
+
+    def set_rate(self, rate: float) -> None:
+        """Change the rate, waking waiting downloads to recalculate their wait.
+
+        Arguments:
+            rate: See :attr:`rate`.
+        """
+        self._refill()
+        self.rate = rate
+        self.tokens = min(self.capacity(), self.tokens)
+
+        self._rate_changed.set()
+        self._rate_changed = trio.Event()
+
+    async def consume(self, count: int) -> None:
+        """Take the tokens for ``count`` bytes and wait until they are available.
+
+        Arguments:
+            count: The number of bytes received.
+        """
+        if self.rate == math.inf:
+            await trio.lowlevel.checkpoint()
+            return
+
+        self._refill()
+        self.tokens -= count
+
+        # tolerate the rounding of the refill arithmetic
+        while self.tokens < -1e-6:
+            if self.rate == math.inf:
+                self.tokens = 0
+                break
+
+            rate_changed = self._rate_changed
+
+            if self.rate > 0:
+                with trio.move_on_after(-self.tokens / self.rate):
+                    await rate_changed.wait()
+            else:
+                await rate_changed.wait()
+
+            self._refill()
+
+        await trio.lowlevel.checkpoint()
+
+
+class RangeNotSatisfiedError(Exception):
+    """Raised when a server advertising range support does not respond to a range
+    request with exactly the requested bytes.
+    """
+
+
 async def get(
     url: hyperlink.URL,
     destination: trio.Path,
     update_period: float = 0.2,
     clock: typing.Callable[[], float] = time.monotonic,
     http_application: typing.Optional[typing.Callable[..., typing.Any]] = None,
+    connections: int = 1,
+    minimum_part_size: int = 1_000_000,
+    resume: bool = True,
+    checkpoint_size: int = 10_000_000,
+    client: typing.Optional[httpx.AsyncClient] = None,
+    preallocate: bool = False,
+    chunk_sizer: typing.Optional["ChunkSizer"] = None,
+    hash_names: typing.Sequence[str] = (),
+    expected_digests: typing.Mapping[str, str] = {},
+    rate_limiter: typing.Optional["TokenBucket"] = None,
+    counter: typing.Optional[ProgressCounter] = None,
 ) -> typing.AsyncIterable[Progress]:
-    async with httpx.AsyncClient(app=http_application) as client:
-        async with client.stream("GET", url.asText()) as response:
-            raw_content_length = response.headers.get("content-length")
-            if raw_content_length is None:
-                content_length = None
-            else:
-                content_length = int(raw_content_length)
-
-            progress = Progress(
-                downloaded=0,
-                total=content_length,
-                first=True,
+    """Download ``url`` to ``destination`` yielding the progress.  With more than one
+    connection a ``HEAD`` request checks for range support and the download is split
+    into concurrent range requests of at least ``minimum_part_size`` bytes each.
+    Otherwise, or if ranges are not supported, a single stream is used.
+
+    A single stream is resumable when ``resume`` is true and the server provides a
+    strong ETag.  The synced byte offset and the ETag are checkpointed to a sidecar
+    file every ``checkpoint_size`` bytes and when the download is interrupted.  A later
+    call continues from the checkpoint with a range request, unless the ETag no longer
+    matches.  The sidecar is removed once the download completes.
+
+    Pass a ``client`` to reuse its connection pool, otherwise a client is created for
+    this download alone.
+
+    With ``preallocate`` and a known length the file is allocated up front, with
+    :func:`os.posix_fallocate` where available, and the chunks are copied straight into
+    a memory mapping of it.
+
+    The received data is handed on in chunks sized by ``chunk_sizer`` to follow the
+    throughput of this download.  A new :class:`ChunkSizer` is used by default.
+
+    The :mod:`hashlib` hashes named in ``hash_names`` and ``expected_digests`` are
+    computed in a worker thread as the chunks arrive.  An extra final progress reports
+    the digests and whether they match the expected hexadecimal digests.  Only ranged
+    downloads, which arrive out of order, and the resumed part of a file are read back
+    to be hashed.
+
+    Pass a ``rate_limiter`` to limit the bandwidth, possibly shared with other
+    downloads.
+
+    Progress is only yielded every ``update_period`` seconds, and at the start and
+    end, since the download waits while the consumer handles each.  The ``counter``
+    is updated for every chunk without waiting so pass an ``update_period`` of
+    :obj:`math.inf` and sample the counter from another task to keep a slow consumer
+    from holding up the download.
+    """
+    if chunk_sizer is None:
+        chunk_sizer = ChunkSizer()
+
+    if counter is None:
+        counter = ProgressCounter()
+
+    async with contextlib.AsyncExitStack() as stack:
+        pooled_client: httpx.AsyncClient
+        if client is None:
+            pooled_client = await stack.enter_async_context(
+                _open_client(app=http_application)
+            )
+        else:
+            pooled_client = client
+
+        hasher: typing.Optional[Hasher] = None
+        names = [
+            *hash_names,
+            *(name for name in expected_digests if name not in hash_names),
+        ]
+        if len(names) > 0:
+            hasher = await stack.enter_async_context(open_hasher(names=names))
+
+        total: typing.Optional[int] = None
+        if connections > 1:
+            total = await _ranged_content_length(client=pooled_client, url=url)
+
+        if total is None or total < 2 * minimum_part_size:
+            parts = _get_stream(
+                client=pooled_client,
+                url=url,
+                destination=destination,
+                update_period=update_period,
+                clock=clock,
+                resume=resume,
+                checkpoint_size=checkpoint_size,
+                preallocate=preallocate,
+                chunk_sizer=chunk_sizer,
+                hasher=hasher,
+                rate_limiter=rate_limiter,
+                counter=counter,
+            )
+        else:
+            part_count = min(connections, total // minimum_part_size)
+            parts = _get_ranges(
+                client=pooled_client,
+                url=url,
+                destination=destination,
+                total=total,
+                part_count=part_count,
+                update_period=update_period,
+                clock=clock,
+                preallocate=preallocate,
+                chunk_sizer=chunk_sizer,
+                rate_limiter=rate_limiter,
+                counter=counter,
             )
 
+        async for progress in parts:
             yield progress
-            last_update = clock()
 
-            progress = attr.evolve(progress, first=False)
+        if hasher is not None:
+            if total is not None and total >= 2 * minimum_part_size:
+                # the parts arrived out of order
+                await hasher.update_from_file(path=destination, size=total)
+
+            digests = await hasher.digests()
+
+            verified: typing.Optional[bool] = None
+            if len(expected_digests) > 0:
+                verified = all(
+                    digests[name] == expected.lower()
+                    for name, expected in expected_digests.items()
+                )
+
+            yield attr.evolve(progress, digests=digests, verified=verified)
+
 
-            downloaded = 0
+async def _ranged_content_length(
+    client: httpx.AsyncClient, url: hyperlink.URL
+) -> typing.Optional[int]:
+    response = await client.head(url.asText())
 
-            async with (await destination.open("wb")) as file:
-                async for chunk in response.aiter_raw():
+    if response.status_code != 200:
+        return None
+
+    if response.headers.get("accept-ranges", "").lower() != "bytes":
+        return None
+
+    raw_content_length = response.headers.get("content-length")
+    if raw_content_length is None:
+        return None
+
+    return int(raw_content_length)
+
+
+@attr.s(auto_attribs=True, eq=False)
+class BatchedWriter:
+    """Collect written chunks into blocks aligned to the file position and write them
+    from a dedicated thread.  This avoids a thread hop per small chunk and lets the
+    next chunks be received while blocks are written.  Generally created by
+    :func:`open_batched_writer`.
+    """
+
+    file: typing.BinaryIO
+    """The unbuffered file to write to, positioned at :attr:`position`."""
+    position: int = 0
+    """The file position up to which the data has been written by the thread."""
+    block_size: int = 1_048_576
+    """The size, and alignment, of the blocks handed to the thread."""
+    memory_budget: int = 8_388_608
+    """The maximum bytes queued for the thread.  Writing waits while exceeded."""
+
+    _buffer: bytearray = attr.ib(factory=bytearray)
+    _queued: int = 0
+    _error: typing.Optional[BaseException] = None
+    _changed: trio.Event = attr.ib(factory=trio.Event)
+    _queue: "queue.SimpleQueue[typing.Optional[typing.Tuple[bytes, bool]]]" = attr.ib(
+        factory=queue.SimpleQueue
+    )
+    _thread: typing.Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        token = trio.lowlevel.current_trio_token()
+
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(token,),
+            name="qtrio download writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    async def stop(self) -> None:
+        """Stop the writer thread after it writes the queued blocks.  Data not yet
+        queued by :meth:`write` or :meth:`flush` is discarded.
+        """
+        if self._thread is None:
+            return
+
+        self._queue.put(None)
+        await trio.to_thread.run_sync(self._thread.join)
+        self._thread = None
+
+    def _run(self, token: trio.lowlevel.TrioToken) -> None:
+        failed = False
+
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            block, fsync = item
+            error: typing.Optional[BaseException] = None
+
+            if not failed:
+                try:
+                    view = memoryview(block)
+                    while len(view) > 0:
+                        view = view[self.file.write(view) :]
+
+                    if fsync:
+                        os.fsync(self.file.fileno())
+                except BaseException as e:
+                    failed = True
+                    error = e
+
+            token.run_sync_soon(self._written, len(block), error)
+
+    def _written(self, count: int, error: typing.Optional[BaseException]) -> None:
+        self._queued -= count
+        if error is None:
+            self.position += count
+        elif self._error is None:
+            self._error = error
+
+        self._changed.set()
+        self._changed = trio.Event()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    async def _submit(self, block: bytes, fsync: bool) -> None:
+        # always allow one block so oversized blocks can not wait forever
+        while self._queued > 0 and self._queued + len(block) > self.memory_budget:
+            await self._changed.wait()
+            self._raise_error()
+
+        self._queued += len(block)
+        self._queue.put((block, fsync))
+
+    async def write(self, data: bytes) -> None:
+        """Buffer the data and queue any completed blocks for the thread.
+
+        Arguments:
+            data: The data to write.
+
+        Raises:
+            Exception: Whatever writing an earlier block failed with.
+        """
+        self._raise_error()
+        self._buffer += data
+
+        while True:
+            end = self.position + self._queued + len(self._buffer)
+            aligned_size = len(self._buffer) - end % self.block_size
+            if aligned_size <= 0:
+                break
+
+            block = bytes(self._buffer[:aligned_size])
+            await self._submit(block=block, fsync=False)
+            del self._buffer[:aligned_size]
+
+    async def flush(self, fsync: bool = False) -> None:
+        """Queue the partial block and wait until everything is written.
+
+        Arguments:
+            fsync: Also sync the file to disk.
+
+        Raises:
+            Exception: Whatever writing any block failed with.
+        """
+        await self._submit(block=bytes(self._buffer), fsync=fsync)
+        self._buffer.clear()
+
+        while self._queued > 0:
+            await self._changed.wait()
+
+        self._raise_error()
+
+
+@async_generator.asynccontextmanager
+async def open_batched_writer(
+    path: trio.Path,
+    offset: typing.Optional[int] = None,
+    block_size: int = 1_048_576,
+    memory_budget: int = 8_388_608,
+    fsync_on_close: bool = False,
+) -> typing.AsyncIterator[BatchedWriter]:
+    """Open the file for a :class:`BatchedWriter`.  Exiting normally flushes the writer.
+    Exiting by an exception finishes writing the queued blocks but discards the partial
+    block.
+
+    Arguments:
+        path: The existing file to write to.
+        offset: The position to write at, otherwise the file is opened for appending.
+        block_size: See :attr:`BatchedWriter.block_size`.
+        memory_budget: See :attr:`BatchedWriter.memory_budget`.
+        fsync_on_close: Sync the file to disk when exiting normally.
+    """
+
+    def open_file() -> typing.BinaryIO:
+        # unbuffered since the writer already collects blocks
+        if offset is None:
+            return open(path, "ab", buffering=0)
+
+        return open(path, "r+b", buffering=0)
+
+    file = await trio.to_thread.run_sync(open_file)
+
+    try:
+        position: int
+        if offset is None:
+            position = await trio.to_thread.run_sync(file.seek, 0, os.SEEK_END)
+        else:
+            position = await trio.to_thread.run_sync(file.seek, offset)
+
+        writer = BatchedWriter(
+            file=file,
+            position=position,
+            block_size=block_size,
+            memory_budget=memory_budget,
+        )
+        writer.start()
+
+        try:
+            yield writer
+            await writer.flush(fsync=fsync_on_close)
+        finally:
+            with trio.CancelScope(shield=True):
+                await writer.stop()
+    finally:
+        with trio.CancelScope(shield=True):
+            await trio.to_thread.run_sync(file.close)
+
+
+@attr.s(auto_attribs=True, eq=False)
+class MappedWriter:
+    """Copy written chunks straight into a memory mapping of the file.  Several writers
+    may share a mapping to write separate regions.  Generally created via
+    :func:`open_mapped_file`.
+    """
+
+    mapping: mmap.mmap
+    """The mapping of the whole file."""
+    position: int = 0
+    """The position in the file for the next write."""
+
+    async def write(self, data: bytes) -> None:
+        """Copy the data into the mapping.
+
+        Arguments:
+            data: The data to write.
+
+        Raises:
+            ValueError: If the data extends past the end of the mapping.
+        """
+        end = self.position + len(data)
+        if end > len(self.mapping):
+            raise ValueError(
+                f"Writing {len(data)} bytes at {self.position} exceeds the"
+                f" {len(self.mapping)} byte file."
+            )
+
+        self.mapping[self.position : end] = data
+        self.position = end
+
+    async def flush(self, fsync: bool = False) -> None:
+        """The mapped pages are already visible to other readers of the file.
+
+        Arguments:
+            fsync: Also sync the mapped file to disk.
+        """
+        if fsync:
+            await trio.to_thread.run_sync(self.mapping.flush)
+
+
+Writer = typing.Union[BatchedWriter, MappedWriter]
+
+
+def _allocate(file: typing.BinaryIO, size: int) -> None:
+    file.truncate(size)
+
+    posix_fallocate = getattr(os, "posix_fallocate", None)
+    if posix_fallocate is None or size == 0:
+        return
+
+    try:
+        posix_fallocate(file.fileno(), 0, size)
+    except OSError as e:
+        # some file systems do not support it, the truncated file still works
+        if e.errno not in {errno.EINVAL, errno.EOPNOTSUPP}:
+            raise
+
+
+@async_generator.asynccontextmanager
+async def open_mapped_file(
+    path: trio.Path, size: int
+) -> typing.AsyncIterator[mmap.mmap]:
+    """Resize and preallocate the existing file then map it into memory.
+
+    Arguments:
+        path: The file to map.
+        size: The size to allocate.  Must not be zero.
+    """
+
+    def allocate_and_map() -> mmap.mmap:
+        with open(path, "r+b") as file:
+            _allocate(file=file, size=size)
+            # the mapping keeps its own handle to the file
+            return mmap.mmap(file.fileno(), size)
+
+    mapping = await trio.to_thread.run_sync(allocate_and_map)
+
+    try:
+        yield mapping
+    finally:
+        mapping.close()
+
+
+@async_generator.asynccontextmanager
+async def _open_mapped_writer(
+    path: trio.Path, size: int, position: int
+) -> typing.AsyncIterator[MappedWriter]:
+    async with open_mapped_file(path=path, size=size) as mapping:
+        yield MappedWriter(mapping=mapping, position=position)
+
+
+@async_generator.asynccontextmanager
+async def _share_mapped_writer(
+    mapping: mmap.mmap, position: int
+) -> typing.AsyncIterator[MappedWriter]:
+    yield MappedWriter(mapping=mapping, position=position)
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class Checkpoint:
+    """The resumable state of a partial download."""
+
+    offset: int
+    etag: str
+
+
+def checkpoint_path(destination: trio.Path) -> trio.Path:
+    """The path of the sidecar file checkpointing the download to ``destination``."""
+    return destination.with_name(destination.name + ".resume")
+
+
+async def _load_checkpoint(destination: trio.Path) -> typing.Optional[Checkpoint]:
+    path = checkpoint_path(destination)
+
+    try:
+        raw = json.loads(await path.read_text())
+        size = (await destination.stat()).st_size
+    except (OSError, ValueError):
+        return None
+
+    try:
+        offset = int(raw["offset"])
+        etag = str(raw["etag"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    # only trust the bytes actually present in the file
+    return Checkpoint(offset=min(offset, size), etag=etag)
+
+
+async def _save_checkpoint(destination: trio.Path, checkpoint: Checkpoint) -> None:
+    path = checkpoint_path(destination)
+    temporary_path = path.with_name(path.name + ".tmp")
+
+    await temporary_path.write_text(json.dumps(attr.asdict(checkpoint)))
+    await temporary_path.replace(path)
+
+
+def _strong_etag(response: httpx.Response) -> typing.Optional[str]:
+    etag: typing.Optional[str] = response.headers.get("etag")
+
+    # weak validators can not be used with If-Range
+    if etag is None or etag.startswith("W/"):
+        return None
+
+    return etag
+
+
+async def _get_stream(
+    client: httpx.AsyncClient,
+    url: hyperlink.URL,
+    destination: trio.Path,
+    update_period: float,
+    clock: typing.Callable[[], float],
+    resume: bool,
+    checkpoint_size: int,
+    preallocate: bool,
+    chunk_sizer: "ChunkSizer",
+    hasher: typing.Optional["Hasher"],
+    rate_limiter: typing.Optional["TokenBucket"],
+    counter: ProgressCounter,
+) -> typing.AsyncIterable[Progress]:
+    checkpoint: typing.Optional[Checkpoint] = None
+    if resume:
+        checkpoint = await _load_checkpoint(destination=destination)
+
+    headers = {}
+    if checkpoint is not None and checkpoint.offset > 0:
+        headers = {
+            "range": f"bytes={checkpoint.offset}-",
+            "if-range": checkpoint.etag,
+        }
+
+    async with contextlib.AsyncExitStack() as stack:
+        response = await stack.enter_async_context(
+            client.stream("GET", url.asText(), headers=headers)
+        )
+
+        if response.status_code == 416:
+            # the checkpoint is stale, start over
+            await response.aclose()
+            response = await stack.enter_async_context(
+                client.stream("GET", url.asText())
+            )
+
+        offset = 0
+        if response.status_code == 206 and checkpoint is not None:
+            offset = checkpoint.offset
+
+        etag = _strong_etag(response=response) if resume else None
+
+        raw_content_length = response.headers.get("content-length")
+        if raw_content_length is None:
+            content_length = None
+        else:
+            content_length = offset + int(raw_content_length)
+
+        counter.downloaded = offset
+        counter.total = content_length
+
+        progress = Progress(
+            downloaded=offset,
+            total=content_length,
+            first=True,
+        )
+
+        yield progress
+        last_update = clock()
+
+        progress = attr.evolve(progress, first=False)
+
+        downloaded = offset
+        synced = offset
+
+        # discard anything beyond the resumed offset and append from there
+        await destination.touch()
+        async with (await destination.open("r+b")) as file:
+            await file.truncate(offset)
+
+        if hasher is not None and offset > 0:
+            await hasher.update_from_file(path=destination, size=offset)
+
+        writer_manager: typing.AsyncContextManager[Writer]
+        if preallocate and content_length is not None and content_length > 0:
+            writer_manager = _open_mapped_writer(
+                path=destination, size=content_length, position=offset
+            )
+        else:
+            writer_manager = open_batched_writer(path=destination)
+
+        async with writer_manager as writer:
+
+            async def sync() -> None:
+                nonlocal synced
+
+                await writer.flush(fsync=True)
+                synced = writer.position
+
+                if etag is not None:
+                    await _save_checkpoint(
+                        destination=destination,
+                        checkpoint=Checkpoint(offset=synced, etag=etag),
+                    )
+
+            try:
+                chunks = _sized_chunks(
+                    raw_chunks=response.aiter_raw(), sizer=chunk_sizer, clock=clock
+                )
+                async for chunk in chunks:
                     downloaded += len(chunk)
-                    await file.write(chunk)
+                    counter.downloaded = downloaded
+                    await writer.write(chunk)
+                    if hasher is not None:
+                        await hasher.update(chunk)
+                    if rate_limiter is not None:
+                        await rate_limiter.consume(len(chunk))
+
+                    if downloaded - synced >= checkpoint_size:
+                        await sync()
 
                     if clock() - last_update > update_period:
                         progress = attr.evolve(progress, downloaded=downloaded)
                         yield progress
                         last_update = clock()
 
-            if progress.downloaded != downloaded:
-                progress = attr.evolve(progress, downloaded=downloaded)
-                yield progress
+                await sync()
+            except BaseException:
+                if etag is not None:
+                    # record what was received even when cancelled
+                    with trio.CancelScope(shield=True):
+                        await sync()
+                raise
+
+        if etag is not None:
+            with contextlib.suppress(FileNotFoundError):
+                await checkpoint_path(destination).unlink()
+
+        if progress.downloaded != downloaded:
+            progress = attr.evolve(progress, downloaded=downloaded)
+            yield progress
+
+
+async def _get_ranges(
+    client: httpx.AsyncClient,
+    url: hyperlink.URL,
+    destination: trio.Path,
+    total: int,
+    part_count: int,
+    update_period: float,
+    clock: typing.Callable[[], float],
+    preallocate: bool,
+    chunk_sizer: "ChunkSizer",
+    rate_limiter: typing.Optional["TokenBucket"],
+    counter: ProgressCounter,
+) -> typing.AsyncIterable[Progress]:
+    counter.downloaded = 0
+    counter.total = total
+
+    progress = Progress(downloaded=0, total=total, first=True)
+
+    yield progress
+    last_update = clock()
+
+    progress = attr.evolve(progress, first=False)
+
+    downloaded = 0
+    send_channel, receive_channel = trio.open_memory_channel[int](math.inf)
+
+    async with contextlib.AsyncExitStack() as stack:
+        # size the file up front so each part can write at its own offset
+        await destination.touch()
+        mapping: typing.Optional[mmap.mmap] = None
+        if preallocate:
+            mapping = await stack.enter_async_context(
+                open_mapped_file(path=destination, size=total)
+            )
+        else:
+            async with (await destination.open("r+b")) as file:
+                await file.truncate(total)
+
+        nursery = await stack.enter_async_context(trio.open_nursery())
+
+        async with send_channel:
+            for index in range(part_count):
+                nursery.start_soon(
+                    functools.partial(
+                        _get_range,
+                        client=client,
+                        url=url,
+                        destination=destination,
+                        start=total * index // part_count,
+                        end=total * (index + 1) // part_count,
+                        send_channel=send_channel.clone(),
+                        mapping=mapping,
+                        chunk_sizer=chunk_sizer,
+                        clock=clock,
+                        rate_limiter=rate_limiter,
+                    )
+                )
+
+        async with receive_channel:
+            async for count in receive_channel:
+                downloaded += count
+                counter.downloaded = downloaded
+
+                if clock() - last_update > update_period:
+                    progress = attr.evolve(progress, downloaded=downloaded)
+                    yield progress
+                    last_update = clock()
+
+    if progress.downloaded != downloaded:
+        progress = attr.evolve(progress, downloaded=downloaded)
+        yield progress
+
+
+async def _get_range(
+    client: httpx.AsyncClient,
+    url: hyperlink.URL,
+    destination: trio.Path,
+    start: int,
+    end: int,
+    send_channel: trio.MemorySendChannel,
+    mapping: typing.Optional[mmap.mmap],
+    chunk_sizer: "ChunkSizer",
+    clock: typing.Callable[[], float],
+    rate_limiter: typing.Optional["TokenBucket"],
+) -> None:
+    headers = {"range": f"bytes={start}-{end - 1}"}
+
+    async with send_channel:
+        async with client.stream("GET", url.asText(), headers=headers) as response:
+            if response.status_code != 206:
+                raise RangeNotSatisfiedError(
+                    f"Expected status 206 for range {start}-{end - 1} but got"
+                    f" {response.status_code}."
+                )
+
+            position = start
+
+            writer_manager: typing.AsyncContextManager[Writer]
+            if mapping is None:
+                writer_manager = open_batched_writer(path=destination, offset=start)
+            else:
+                writer_manager = _share_mapped_writer(mapping=mapping, position=start)
+
+            async with writer_manager as writer:
+                chunks = _sized_chunks(
+                    raw_chunks=response.aiter_raw(), sizer=chunk_sizer, clock=clock
+                )
+                async for chunk in chunks:
+                    position += len(chunk)
+                    if position > end:
+                        raise RangeNotSatisfiedError(
+                            f"Received more than the range {start}-{end - 1}."
+                        )
+
+                    await writer.write(chunk)
+                    await send_channel.send(len(chunk))
+                    if rate_limiter is not None:
+                        await rate_limiter.consume(len(chunk))
+
+            if position != end:
+                raise RangeNotSatisfiedError(
+                    f"Received {position - start} of {end - start} bytes for range"
+                    f" {start}-{end - 1}."
+                )
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class AggregateProgress:
+    """The combined progress of the downloads of a :class:`DownloadManager`."""
+
+    downloaded: int
+    """The bytes downloaded by all jobs."""
+    total: typing.Optional[int]
+    """The total bytes of all jobs, or :obj:`None` while any is unknown."""
+    completed: int
+    """The number of jobs done."""
+    count: int
+    """The number of jobs submitted."""
+
+
+@attr.s(auto_attribs=True, eq=False)
+class DownloadJob:
+    """A download submitted to a :class:`DownloadManager`."""
+
+    url: hyperlink.URL
+    destination: trio.Path
+    priority: int = 0
+    """Jobs with higher priorities are started first."""
+
+    progress: typing.Optional[Progress] = None
+    """The latest progress, once started."""
+    error: typing.Optional[Exception] = None
+    """The exception the download failed with, if any."""
+    started: typing.Optional[float] = None
+    """The time the download started, according to the manager's clock."""
+    finished: typing.Optional[float] = None
+    """The time the download finished, according to the manager's clock."""
+    done_event: trio.Event = attr.ib(factory=trio.Event)
+
+    async def wait(self) -> typing.Optional[Progress]:
+        """Wait for the download to finish.
+
+        Returns:
+            The final progress.
+
+        Raises:
+            Exception: Whatever the download failed with.
+        """
+        await self.done_event.wait()
+
+        if self.error is not None:
+            raise self.error
+
+        return self.progress
+
+
+@attr.s(auto_attribs=True, eq=False)
+class DownloadManager:
+    """Run queued downloads through one pooled client while limiting the concurrent
+    downloads overall and per host.  Generally started by :func:`open_download_manager`.
+    """
+
+    http_application: typing.Optional[typing.Callable[..., typing.Any]] = None
+    max_connections: int = 10
+    """The maximum number of concurrent downloads."""
+    max_connections_per_host: int = 4
+    """The maximum number of concurrent downloads from each host."""
+    update_period: float = 0.2
+    """The minimum time between progress updates of each download."""
+    clock: typing.Callable[[], float] = time.monotonic
+    """The clock used to time the jobs and rate limit their progress updates."""
+
+    client: typing.Optional[httpx.AsyncClient] = None
+    """The pooled client while serving."""
+    jobs: typing.List[DownloadJob] = attr.ib(factory=list)
+    """All submitted jobs."""
+
+    _queue: typing.List[typing.Tuple[int, int, DownloadJob]] = attr.ib(factory=list)
+    _sequence: typing.Iterator[int] = attr.ib(factory=itertools.count)
+    _active: int = 0
+    _host_active: typing.Dict[str, int] = attr.ib(factory=dict)
+    _changed: trio.Event = attr.ib(factory=trio.Event)
+
+    progress_changed = qtrio.Signal(object)
+    """Emitted with the :class:`AggregateProgress` as any download progresses."""
+
+    def submit(
+        self, url: hyperlink.URL, destination: trio.Path, priority: int = 0
+    ) -> DownloadJob:
+        """Queue a download.
+
+        Arguments:
+            url: The URL to download.
+            destination: The file to write to.
+            priority: See :attr:`DownloadJob.priority`.
+
+        Returns:
+            The queued job.
+        """
+        job = DownloadJob(url=url, destination=destination, priority=priority)
+        self.jobs.append(job)
+        heapq.heappush(self._queue, (-priority, next(self._sequence), job))
+        self._changed.set()
+
+        return job
+
+    async def join(self) -> None:
+        """Wait for all submitted jobs to finish."""
+        for job in list(self.jobs):
+            await job.done_event.wait()
+
+    def progress(self) -> AggregateProgress:
+        """Combine the progress of all jobs.
+
+        Returns:
+            The present aggregate progress.
+        """
+        downloaded = 0
+        total: typing.Optional[int] = 0
+
+        for job in self.jobs:
+            if job.progress is None or job.progress.total is None:
+                total = None
+            elif total is not None:
+                total += job.progress.total
+
+            if job.progress is not None:
+                downloaded += job.progress.downloaded
+
+        return AggregateProgress(
+            downloaded=downloaded,
+            total=total,
+            completed=sum(job.done_event.is_set() for job in self.jobs),
+            count=len(self.jobs),
+        )
+
+    def _take_next_job(self) -> typing.Optional[DownloadJob]:
+        if self._active >= self.max_connections:
+            return None
+
+        for entry in sorted(self._queue):
+            job = entry[2]
+            host_active = self._host_active.get(_host(job.url), 0)
+            if host_active < self.max_connections_per_host:
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+                return job
+
+        return None
+
+    async def serve(
+        self, *, task_status: trio_typing.TaskStatus[None] = trio.TASK_STATUS_IGNORED
+    ) -> None:
+        """Run queued jobs until cancelled."""
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections,
+        )
+
+        async with _open_client(app=self.http_application, limits=limits) as client:
+            self.client = client
+
+            try:
+                async with trio.open_nursery() as nursery:
+                    task_status.started()
+
+                    while True:
+                        job = self._take_next_job()
+                        if job is None:
+                            await self._changed.wait()
+                            self._changed = trio.Event()
+                            continue
+
+                        self._active += 1
+                        host = _host(job.url)
+                        self._host_active[host] = self._host_active.get(host, 0) + 1
+                        nursery.start_soon(self._run, job)
+            finally:
+                self.client = None
+
+    async def _run(self, job: DownloadJob) -> None:
+        job.started = self.clock()
+
+        try:
+            async for progress in get(
+                url=job.url,
+                destination=job.destination,
+                update_period=self.update_period,
+                clock=self.clock,
+                client=self.client,
+            ):
+                job.progress = progress
+                self.progress_changed.emit(self.progress())
+        except Exception as e:
+            job.error = e
+        finally:
+            job.finished = self.clock()
+            self._active -= 1
+            self._host_active[_host(job.url)] -= 1
+            job.done_event.set()
+            self._changed.set()
+
+        self.progress_changed.emit(self.progress())
+
+
+def _host(url: hyperlink.URL) -> str:
+    return f"{url.scheme}://{url.host}:{url.port}"
+
+
+@async_generator.asynccontextmanager
+async def open_download_manager(
+    http_application: typing.Optional[typing.Callable[..., typing.Any]] = None,
+    max_connections: int = 10,
+    max_connections_per_host: int = 4,
+    clock: typing.Callable[[], float] = time.monotonic,
+) -> typing.AsyncIterator[DownloadManager]:
+    """Serve a download manager for the duration of the context manager.  Unfinished
+    downloads are cancelled on exit.
+    """
+    manager = DownloadManager(
+        http_application=http_application,
+        max_connections=max_connections,
+        max_connections_per_host=max_connections_per_host,
+        clock=clock,
+    )
+
+    async with trio.open_nursery() as nursery:
+        await nursery.start(manager.serve)
+        yield manager
+        nursery.cancel_scope.cancel()
+
+
+class ManifestError(Exception):
+    """Raised when a download manifest line can not be parsed."""
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class ManifestEntry:
+    """A download listed in a manifest."""
+
+    url: hyperlink.URL
+    destination: trio.Path
+
+
+def read_manifest(lines: typing.Iterable[str]) -> typing.List[ManifestEntry]:
+    """Parse a download manifest.  Each line holds a URL and the destination path
+    separated by whitespace.  The destination may itself contain spaces.  Blank lines
+    and lines starting with ``#`` are ignored.
+
+    Arguments:
+        lines: The lines of the manifest, such as an open text file.
+
+    Returns:
+        The listed downloads in order.
+
+    Raises:
+        ManifestError: If a line does not hold both a URL and a destination.
+    """
+    entries = []
+
+    for number, line in enumerate(lines, start=1):
+        stripped = line.strip()
+        if len(stripped) == 0 or stripped.startswith("#"):
+            continue
+
+        fields = stripped.split(maxsplit=1)
+        if len(fields) != 2:
+            raise ManifestError(
+                f"Line {number} must hold a URL and a destination: {stripped!r}"
+            )
+
+        url, destination = fields
+        entries.append(
+            ManifestEntry(
+                url=hyperlink.URL.from_text(url), destination=trio.Path(destination)
+            )
+        )
+
+    return entries
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class BatchResult:
+    """The outcome of one download of a batch."""
+
+    url: str
+    destination: str
+    downloaded: int
+    """The bytes downloaded, including any that were resumed."""
+    duration: float
+    """The seconds from the start to the end of the download."""
+    error: typing.Optional[str] = None
+    """A description of the exception the download failed with, if any."""
+
+    def to_dict(self) -> typing.Dict[str, object]:
+        """Build the JSON compatible form of the result.
+
+        Returns:
+            The fields along with the throughput in bytes per second.
+        """
+        return {
+            **attr.asdict(self),
+            "bytes_per_second": _bytes_per_second(self.downloaded, self.duration),
+        }
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class BatchSummary:
+    """The outcome of a batch of downloads."""
+
+    results: typing.List[BatchResult]
+    """The results in manifest order."""
+    duration: float
+    """The seconds from the start of the first to the end of the last download."""
+
+    @property
+    def downloaded(self) -> int:
+        """The bytes downloaded by all jobs."""
+        return sum(result.downloaded for result in self.results)
+
+    @property
+    def failures(self) -> typing.List[BatchResult]:
+        """The results of the downloads that failed."""
+        return [result for result in self.results if result.error is not None]
+
+    def to_dict(self) -> typing.Dict[str, object]:
+        """Build the JSON compatible form of the summary.
+
+        Returns:
+            The totals and the results of each download.
+        """
+        return {
+            "downloaded": self.downloaded,
+            "duration": self.duration,
+            "bytes_per_second": _bytes_per_second(self.downloaded, self.duration),
+            "failures": len(self.failures),
+            "results": [result.to_dict() for result in self.results],
+        }
+
+
+def _bytes_per_second(downloaded: int, duration: float) -> typing.Optional[float]:
+    # JSON has no infinity so an instantaneous download has no defined throughput
+    if duration == 0:
+        return None
+
+    return downloaded / duration
+
+
+batch_progress_resolution: int = 1000
+"""The progress dialog steps for each download of a batch."""
+
+
+@attr.s(auto_attribs=True, eq=False)
+class BatchDialog:
+    """Download a batch of files concurrently through a :class:`DownloadManager` while
+    showing their combined progress in one dialog.
+    """
+
+    fps: float = default_fps
+    clock: typing.Callable[[], float] = time.monotonic
+    http_application: typing.Optional[typing.Callable[..., typing.Any]] = None
+    max_connections: int = 4
+    max_connections_per_host: int = 4
+
+    progress_dialog: typing.Optional[qtrio.dialogs.ProgressDialog] = None
+    summary: typing.Optional[BatchSummary] = None
+
+    progress_dialog_shown_event: trio.Event = attr.ib(factory=trio.Event)
+
+    async def serve(self, entries: typing.Sequence[ManifestEntry]) -> BatchSummary:
+        """Download the entries.  Failed downloads are recorded in the summary rather
+        than raised.
+
+        Arguments:
+            entries: The downloads to run.
+
+        Returns:
+            The summary, also stored as :attr:`summary`.
+        """
+        self.progress_dialog = qtrio.dialogs.create_progress_dialog(fps=self.fps)
+
+        self.progress_dialog.title = create_title("Fetching")
+        self.progress_dialog.text = f"Fetching {len(entries)} files..."
+
+        async with self.progress_dialog.manage() as reporter:
+            if self.progress_dialog.dialog is not None:
+                self.progress_dialog.dialog.setMinimumDuration(0)
+            self.progress_dialog_shown_event.set()
+
+            reporter.update(value=0, maximum=len(entries) * batch_progress_resolution)
+
+            start = self.clock()
+
+            async with open_download_manager(
+                http_application=self.http_application,
+                max_connections=self.max_connections,
+                max_connections_per_host=self.max_connections_per_host,
+                clock=self.clock,
+            ) as manager:
+                jobs = [
+                    manager.submit(url=entry.url, destination=entry.destination)
+                    for entry in entries
+                ]
+
+                def update(aggregate: AggregateProgress) -> None:
+                    # sizes are only known once each job starts so weight each job
+                    # equally rather than by bytes
+                    reporter.update(value=_batch_progress_value(jobs=jobs))
+
+                manager.progress_changed.connect(update)
+                await manager.join()
+
+            end = self.clock()
+
+        self.progress_dialog = None
+
+        self.summary = BatchSummary(
+            results=[_batch_result(job=job, clock=self.clock) for job in jobs],
+            duration=end - start,
+        )
+
+        return self.summary
+
+
+def _batch_progress_value(jobs: typing.Sequence[DownloadJob]) -> int:
+    done = 0.0
+
+    for job in jobs:
+        if job.done_event.is_set():
+            done += 1
+        elif job.progress is not None and job.progress.total:
+            done += job.progress.downloaded / job.progress.total
+
+    return round(done * batch_progress_resolution)
+
+
+def _batch_result(job: DownloadJob, clock: typing.Callable[[], float]) -> BatchResult:
+    error: typing.Optional[str] = None
+    if job.error is not None:
+        error = f"{type(job.error).__name__}: {job.error}"
+
+    started = job.started if job.started is not None else clock()
+    finished = job.finished if job.finished is not None else started
+
+    return BatchResult(
+        url=job.url.asText(),
+        destination=os.fspath(job.destination),
+        downloaded=0 if job.progress is None else job.progress.downloaded,
+        duration=finished - started,
+        error=error,
+    )
+
+
+async def start_batch_downloader(
+    entries: typing.Sequence[ManifestEntry],
+    fps: float = default_fps,
+    max_connections: int = 4,
+    max_connections_per_host: int = 4,
+    http_application: typing.Optional[typing.Callable[..., typing.Any]] = None,
+    *,
+    cls: typing.Type[BatchDialog] = BatchDialog,
+    task_status: trio_typing.TaskStatus[BatchDialog] = trio.TASK_STATUS_IGNORED,
+) -> typing.Optional[BatchSummary]:
+    """Download the manifest entries with a :class:`BatchDialog`.
+
+    Returns:
+        The summary, or :obj:`None` if the user cancelled.
+    """
+    self = cls(
+        fps=fps,
+        http_application=http_application,
+        max_connections=max_connections,
+        max_connections_per_host=max_connections_per_host,
+    )
+
+    task_status.started(self)
+
+    with contextlib.suppress(qtrio.UserCancelledError):
+        return await self.serve(entries=entries)
+
+    return None
 
 
 if __name__ == "__main__":  # pragma: no cover
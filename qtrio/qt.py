@@ -32,3 +32,26 @@ class Reenter(QtCore.QObject):
             return True
         except Exception as e:
             raise qtrio.InternalError("Exception while handling a reenter event") from e
+
+
+class InputEventFilter(QtCore.QObject):
+    """A ``QtCore.QObject`` for noticing user input events when installed as an event
+    filter on the application.
+    """
+
+    def __init__(
+        self,
+        event_types: typing.AbstractSet[QtCore.QEvent.Type],
+        callback: typing.Callable[[], object],
+    ):
+        super().__init__()
+        self.event_types = event_types
+        self.callback = callback
+
+    def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        """Qt calls this for each event sent to any object in the application."""
+
+        if event.type() in self.event_types:
+            self.callback()
+
+        return False